@@ -16,19 +16,21 @@ Requirements:
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
+# Add the src directory to Python path at import time so worker processes
+# started for parallel PDF extraction can import the core modules too
+script_dir = Path(__file__).parent.absolute()
+src_dir = script_dir / "src"
+if src_dir.exists() and str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
 def main():
     """Main entry point for the application launcher"""
     
-    # Get the directory where this script is located
-    script_dir = Path(__file__).parent.absolute()
-    
-    # Add the src directory to Python path
-    src_dir = script_dir / "src"
-    if src_dir.exists():
-        sys.path.insert(0, str(src_dir))
-    else:
+    # Check that the src directory is on the Python path
+    if not src_dir.exists():
         print(f"Error: Source directory not found at {src_dir}")
         print("Please ensure you're running this script from the project root directory.")
         sys.exit(1)
@@ -51,4 +53,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,183 @@
+"""
+Xcel MakeReady Sheet QC - headless batch runner
+===============================================
+
+Runs the same pipeline as the GUI's "Process Files" without Tkinter, for one job
+given on the command line or for every job in a JSON manifest.
+
+Usage (from the project root):
+    python -m src.cli --template Template.xlsx --input Nodes.xlsx --attachment Midspan.xlsx \\
+        --existing-reports reports/existing --proposed-reports reports/proposed --alden-qc Alden.xlsx
+
+    python -m src.cli --manifest district.json
+    python -m src.cli --manifest district.json --workers 4 --log-dir logs/district
+
+Manifest format (relative paths are resolved against the manifest's folder):
+    {
+        "defaults": {"output_file": "Template.xlsx", "output_dir": "out"},
+        "jobs": [
+            {"name": "Job 1", "input_file": "job1/Nodes.xlsx", "attachment_file": "job1/Midspan.xlsx",
+             "existing_reports_folder": "job1/existing", "proposed_reports_folder": "job1/proposed",
+             "alden_qc_file": "job1/Alden.xlsx"}
+        ]
+    }
+A plain list of jobs, or a saved last_paths.json, is accepted as well.
+
+With --workers 2 or more the jobs run in parallel worker processes (see JobScheduler):
+each job logs to its own file in --log-dir and a JSON summary report is written there.
+
+Every job writes a per-stage timing report ('<output name>.run.json') next to its output
+workbook; --profile adds a cProfile dump ('<output name>.prof', view with pstats or snakeviz).
+
+Exit status is 0 when every job completed, 1 otherwise.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Make the core package importable the same way run_app.py does, so PDF extraction
+# worker processes resolve the same module names
+src_dir = Path(__file__).parent.absolute()
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from core.config_manager import ConfigManager
+from core.job_runner import ProcessingJob, load_manifest, run_job
+from core.job_scheduler import JobScheduler
+
+
+def build_parser():
+    """Command line options"""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Process MakeReady jobs without the GUI."
+    )
+    jobs = parser.add_argument_group("single job")
+    jobs.add_argument("--template", dest="output_file", help="Output template workbook")
+    jobs.add_argument("--input", dest="input_file", default="", help="Nodes/Sections/Connections workbook")
+    jobs.add_argument("--attachment", dest="attachment_file", default="", help="Midspan/attachment heights workbook")
+    jobs.add_argument("--existing-reports", dest="existing_reports_folder", default="", help="Existing analysis reports folder")
+    jobs.add_argument("--proposed-reports", dest="proposed_reports_folder", default="", help="Proposed analysis reports folder")
+    jobs.add_argument("--alden-qc", dest="alden_qc_file", default="", help="Alden QC workbook")
+    jobs.add_argument("--name", default="", help="Job name used in log messages")
+    parser.add_argument("--manifest", help="JSON manifest of jobs (replaces the single job options)")
+    parser.add_argument("--output-dir", default="", help="Folder for output workbooks (default: 'output' next to each template)")
+    parser.add_argument("--config-dir", default=None,
+                        help="Folder containing xcel_config.json (default: the application folder)")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop at the first failed job")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jobs to run in parallel (default 1: one after another in this process)")
+    parser.add_argument("--log-dir", default="batch_logs",
+                        help="Folder for per-job logs and the summary report when --workers > 1 (default: batch_logs)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write a cProfile dump ('<output name>.prof') next to each output workbook")
+    parser.add_argument("--no-run-report", action="store_true",
+                        help="Do not write the per-stage timing report ('<output name>.run.json')")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    return parser
+
+
+def collect_jobs(args, parser):
+    """Jobs from the manifest or from the single job options"""
+    if args.manifest:
+        jobs = load_manifest(args.manifest)
+    elif args.output_file:
+        jobs = [ProcessingJob.from_dict({
+            "name": args.name,
+            "output_file": args.output_file,
+            "input_file": args.input_file,
+            "attachment_file": args.attachment_file,
+            "existing_reports_folder": args.existing_reports_folder,
+            "proposed_reports_folder": args.proposed_reports_folder,
+            "alden_qc_file": args.alden_qc_file,
+        })]
+    else:
+        parser.error("either --template or --manifest is required")
+
+    if args.output_dir:
+        for job in jobs:
+            job.output_dir = str(Path(args.output_dir).expanduser())
+    return jobs
+
+
+def run_parallel(args, jobs, config, mapping_data):
+    """Run the jobs on a JobScheduler process pool and write its summary report"""
+    start = time.perf_counter()
+    scheduler = JobScheduler(config, mapping_data, max_workers=args.workers, log_dir=args.log_dir,
+                             log_level=getattr(logging, args.log_level))
+    results = scheduler.run(jobs, fail_fast=args.fail_fast)
+    summary = JobScheduler.build_summary(jobs, results, time.perf_counter() - start)
+    summary_file = scheduler.write_summary(summary)
+
+    for entry in summary['results']:
+        if entry['status'] == 'complete':
+            logging.info(f"  OK      {entry['name']}: {entry['poles']} poles in {entry['wall_time']:.1f}s, "
+                         f"peak {entry['peak_rss_mb']} MB -> {entry['output_file']}")
+        else:
+            logging.info(f"  {entry['status'].upper():<8}{entry['name']}: {entry['error'] or entry['status']} "
+                         f"(log: {entry['log_file']})")
+    logging.info(f"{summary['completed']}/{summary['jobs']} jobs completed in {summary['total_wall_time']:.1f}s "
+                 f"({summary['sum_job_wall_time']:.1f}s of job time); summary: {summary_file}")
+    return 0 if summary['failed'] == 0 else 1
+
+
+def main(argv=None):
+    """Run the requested jobs; returns the process exit status"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format='%(asctime)s %(levelname)s %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    try:
+        jobs = collect_jobs(args, parser)
+    except Exception as e:
+        logging.error(f"Could not read jobs: {e}")
+        return 1
+
+    config_dir = Path(args.config_dir) if args.config_dir else src_dir.parent
+    config = ConfigManager(config_dir).load_config()
+    mapping_data = config.get("column_mappings", [])
+    options = config.setdefault("processing_options", {})
+    if args.profile:
+        options["profile"] = True
+    if args.no_run_report:
+        options["run_report"] = False
+
+    def progress_callback(percentage, message):
+        logging.debug(f"[{percentage:.0f}%] {message}")
+        return True
+
+    if args.workers > 1 and len(jobs) > 1:
+        return run_parallel(args, jobs, config, mapping_data)
+
+    results = []
+    for index, job in enumerate(jobs, start=1):
+        logging.info(f"=== Job {index}/{len(jobs)}: {job.name} ===")
+        result = run_job(job, config, mapping_data, progress_callback=progress_callback)
+        results.append((job, result))
+        if result['status'] != 'complete' and args.fail_fast:
+            logging.error(f"Job '{job.name}' failed - stopping (--fail-fast)")
+            break
+
+    failed = [job.name for job, result in results if result['status'] != 'complete']
+    for job, result in results:
+        if result['status'] == 'complete':
+            logging.info(f"  OK      {job.name}: {result['poles']} poles -> {result['output_file']}")
+        else:
+            logging.info(f"  FAILED  {job.name}: {result['error'] or result['status']}")
+    logging.info(f"{len(results) - len(failed)}/{len(jobs)} jobs completed")
+    return 1 if failed or len(results) < len(jobs) else 0
+
+
+if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
+    sys.exit(main())
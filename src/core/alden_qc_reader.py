@@ -141,103 +141,7 @@ class AldenQCReader:
                 self._active = False
                 return
             
-            # First pass: Create mapping of pole number to MR notes and extract specific heights
-            for _, row in df.iterrows():
-                pole_number = str(row[pole_col]).strip() if pd.notna(row[pole_col]) else ""
-                mr_notes = str(row[mr_notes_col]).strip() if pd.notna(row[mr_notes_col]) else ""
-                
-                if pole_number and pole_number != "nan":
-                    # Normalize pole number and extract notes after colon
-                    normalized_pole = self._normalize_pole_number(pole_number)
-                    extracted_notes = self._extract_notes_after_colon(mr_notes)
-                    self.qc_data[normalized_pole] = extracted_notes
-                    
-                    # Extract company name
-                    company_name = str(row[company_col]).strip() if pd.notna(row.get(company_col, '')) else ""
-                    
-                    # Extract MetroNet heights
-                    if "Metronet Fiber LLC" in company_name:
-                        attachment_height = str(row[height_col]).strip() if pd.notna(row.get(height_col, '')) else ""
-                        midspan_height = str(row[midspan_col]).strip() if pd.notna(row.get(midspan_col, '')) else ""
-                        
-                        # Initialize pole entry if not exists
-                        if normalized_pole not in self.metronet_heights:
-                            self.metronet_heights[normalized_pole] = {
-                                'attachment_height': attachment_height,
-                                'midspan_height': midspan_height
-                            }
-                    
-                    # Extract Power heights
-                    if "XCEL ENERGY" in company_name:
-                        attachment_height = str(row[height_col]).strip() if pd.notna(row.get(height_col, '')) else ""
-                        midspan_height = str(row[midspan_col]).strip() if pd.notna(row.get(midspan_col, '')) else ""
-                        attachment_type = str(row.get(attachment_type_col, '')).strip() if pd.notna(row.get(attachment_type_col, '')) else ""
-                        
-                        # Initialize pole entry if not exists
-                        if normalized_pole not in self.power_heights:
-                            self.power_heights[normalized_pole] = {
-                                'attachment_height': attachment_height,
-                                'midspan_height': midspan_height,
-                                'attachment_type': attachment_type
-                            }
-                        # Update attachment_type if this row has the lowest height
-                        elif attachment_height:
-                            # Compare heights and keep the lowest one's attachment_type
-                            current_height = self.power_heights[normalized_pole].get('attachment_height', '')
-                            if current_height:
-                                # Parse both heights to compare
-                                current_decimal = self._parse_height_to_decimal(current_height)
-                                new_decimal = self._parse_height_to_decimal(attachment_height)
-                                if new_decimal > 0 and (current_decimal == 0 or new_decimal < current_decimal):
-                                    # This is lower, update everything
-                                    self.power_heights[normalized_pole]['attachment_height'] = attachment_height
-                                    self.power_heights[normalized_pole]['midspan_height'] = midspan_height
-                                    self.power_heights[normalized_pole]['attachment_type'] = attachment_type
-                            else:
-                                # No current height, set this one
-                                self.power_heights[normalized_pole]['attachment_height'] = attachment_height
-                                self.power_heights[normalized_pole]['midspan_height'] = midspan_height
-                                self.power_heights[normalized_pole]['attachment_type'] = attachment_type
-            
-            # Second pass: Extract and assign comm heights based on attachment heights
-            # First collect all comm attachments per pole
-            temp_comm_by_pole = {}  # pole_number -> list of (attachment_height, midspan_height)
-            for _, row in df.iterrows():
-                pole_number = str(row[pole_col]).strip() if pd.notna(row[pole_col]) else ""
-                status = str(row.get(status_col, '')).strip() if pd.notna(row.get(status_col, '')) else ""
-                attachment_type = str(row.get(attachment_type_col, '')).strip() if pd.notna(row.get(attachment_type_col, '')) else ""
-                
-                if pole_number and pole_number != "nan":
-                    normalized_pole = self._normalize_pole_number(pole_number)
-                    
-                    # Check if this is a communication attachment (EXISTING with Coax or Communication Fiber-Optic)
-                    # Case-insensitive comparison
-                    if status.upper() == "EXISTING" and attachment_type.upper() in ["COAX", "COMMUNICATION FIBER-OPTIC"]:
-                        attachment_height = str(row[height_col]).strip() if pd.notna(row.get(height_col, '')) else ""
-                        midspan_height = str(row[midspan_col]).strip() if pd.notna(row.get(midspan_col, '')) else ""
-                        
-                        if attachment_height:
-                            if normalized_pole not in temp_comm_by_pole:
-                                temp_comm_by_pole[normalized_pole] = []
-                            temp_comm_by_pole[normalized_pole].append({
-                                'attachment_height': attachment_height,
-                                'midspan_height': midspan_height,
-                                'height_decimal': self._parse_height_to_decimal(attachment_height)
-                            })
-            
-            # Now assign comm numbers based on height (descending order)
-            for normalized_pole, comm_list in temp_comm_by_pole.items():
-                # Sort by height in descending order
-                comm_list.sort(key=lambda x: x['height_decimal'], reverse=True)
-                
-                # Assign comm1, comm2, comm3
-                self.comm_heights[normalized_pole] = []
-                for i, comm in enumerate(comm_list[:3], start=1):  # Limit to 3 comm fields
-                    self.comm_heights[normalized_pole].append({
-                        'comm_number': i,
-                        'attachment_height': comm['attachment_height'],
-                        'midspan_height': comm['midspan_height']
-                    })
+            self._index_rows(df, pole_col, mr_notes_col, company_col, height_col, midspan_col, status_col, attachment_type_col)
             
             self._active = len(self.qc_data) > 0
             self.alden_qc_file_path = alden_qc_file_path
@@ -248,6 +152,117 @@ class AldenQCReader:
             logging.error(f"Error loading Alden QC file {alden_qc_file_path}: {e}", exc_info=True)
             self._active = False
     
+    @staticmethod
+    def _text_column(df, column, required=False):
+        """
+        Column as stripped text with blanks for missing values (str(value).strip() per cell)
+        
+        Args:
+            df: Alden rows
+            column: Column name
+            required: Raise KeyError when the column is missing instead of returning blanks
+        """
+        if column not in df.columns:
+            if required:
+                raise KeyError(column)
+            return pd.Series("", index=df.index, dtype=object)
+        # Blanks are filled before .str: a column with no values at all is not inferred as text
+        return df[column].map(str, na_action='ignore').astype(object).fillna("").str.strip()
+    
+    def _normalize_pole_column(self, poles):
+        """Vectorized _normalize_pole_number for a column of non-empty pole strings"""
+        leading_zero = poles.str.startswith('0') & (poles.str.len() > 1)
+        normalized = poles.where(~leading_zero, poles.str.lstrip('0'))
+        return normalized.where(normalized != "", "0")
+    
+    @staticmethod
+    def _parse_height_column(heights):
+        """Vectorized _parse_height_to_decimal: "22ft 1in" -> 22.083..., anything else -> 0.0"""
+        parts = heights.str.extract(r"^(\d+)ft\s*(\d+)in", expand=True)
+        decimals = parts[0].astype(float) + parts[1].astype(float) / 12.0
+        return decimals.fillna(0.0)
+    
+    def _index_rows(self, df, pole_col, mr_notes_col, company_col, height_col, midspan_col, status_col, attachment_type_col):
+        """
+        Build the per-pole lookups from the Alden rows with column operations
+        
+        Rules (unchanged from the row-by-row loader):
+        - MR notes: last row of each pole wins, text after the first colon
+        - MetroNet: first "Metronet Fiber LLC" row of each pole
+        - Power: "XCEL ENERGY" row with the lowest positive parsed height (earliest on ties);
+          without any, the first row with a height, else the pole's first power row
+        - Comm: EXISTING Coax/Communication Fiber-Optic rows with a height, top 3 by height
+          (stable, so equal heights keep file order) numbered comm1..comm3
+        """
+        raw_poles = self._text_column(df, pole_col)
+        valid = (raw_poles != "") & (raw_poles != "nan")
+        rows = pd.DataFrame({'pole': self._normalize_pole_column(raw_poles[valid])})
+        if rows.empty:
+            return
+        
+        notes = self._text_column(df, mr_notes_col)[valid]
+        has_colon = notes.str.contains(':', regex=False)
+        notes = notes.where(~has_colon, notes.str.partition(':')[2].str.strip())
+        
+        rows['company'] = self._text_column(df, company_col, required=True)[valid]
+        is_metronet = rows['company'].str.contains("Metronet Fiber LLC", regex=False)
+        is_power = rows['company'].str.contains("XCEL ENERGY", regex=False)
+        status = self._text_column(df, status_col)[valid].str.upper()
+        rows['attachment_type'] = self._text_column(df, attachment_type_col)[valid]
+        is_existing_comm = (
+            (status == "EXISTING")
+            & rows['attachment_type'].str.upper().isin(["COAX", "COMMUNICATION FIBER-OPTIC"])
+        )
+        # Heights are only read for MetroNet, power and existing comm rows
+        needs_heights = is_metronet.any() or is_power.any() or is_existing_comm.any()
+        rows['height'] = self._text_column(df, height_col, required=needs_heights)[valid]
+        rows['midspan'] = self._text_column(df, midspan_col, required=needs_heights)[valid]
+        rows['height_decimal'] = self._parse_height_column(rows['height'])
+        
+        self.qc_data.update(zip(rows['pole'], notes))
+        
+        # MetroNet: first row per pole
+        metronet = rows[is_metronet].drop_duplicates('pole', keep='first')
+        self.metronet_heights.update(
+            (pole, {'attachment_height': height, 'midspan_height': midspan})
+            for pole, height, midspan in zip(metronet['pole'], metronet['height'], metronet['midspan'])
+        )
+        
+        # Power: lowest positive height, else first row with a height, else first row
+        power = rows[is_power]
+        if not power.empty:
+            positive = power[power['height_decimal'] > 0]
+            lowest = positive.groupby('pole', sort=False)['height_decimal'].idxmin()
+            # drop_duplicates keeps each pole's first row; an empty selection stays an empty Series
+            with_height = power[power['height'] != ""].drop_duplicates('pole', keep='first')
+            first_with_height = pd.Series(with_height.index, index=with_height['pole'].values)
+            first_rows = power.drop_duplicates('pole', keep='first')
+            chosen = pd.Series(first_rows.index, index=first_rows['pole'].values)
+            chosen.update(first_with_height)
+            chosen.update(lowest)
+            chosen_rows = power.loc[chosen.values]
+            self.power_heights.update(
+                (pole, {'attachment_height': height, 'midspan_height': midspan, 'attachment_type': attachment_type})
+                for pole, height, midspan, attachment_type in zip(
+                    chosen.index, chosen_rows['height'], chosen_rows['midspan'], chosen_rows['attachment_type']
+                )
+            )
+        
+        # Comm: top 3 EXISTING comm rows per pole by height (descending)
+        is_comm = is_existing_comm & (rows['height'] != "")
+        comm = rows[is_comm]
+        if not comm.empty:
+            top = comm.sort_values('height_decimal', ascending=False, kind='stable').groupby('pole', sort=False).head(3)
+            comm_numbers = top.groupby('pole', sort=False).cumcount() + 1
+            by_pole = {pole: [] for pole in comm['pole'].drop_duplicates()}
+            for pole, number, height, midspan in zip(top['pole'], comm_numbers, top['height'], top['midspan']):
+                by_pole[pole].append({
+                    'comm_number': int(number),
+                    'attachment_height': height,
+                    'midspan_height': midspan
+                })
+            self.comm_heights.update(by_pole)
+    
     def is_active(self):
         """Check if Alden QC reader has valid data"""
         return self._active
@@ -1,8 +1,12 @@
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import json
 import logging
 import re
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
 try:
     from .utils import Utils
 except ImportError:
@@ -14,6 +18,8 @@ class AttachmentDataReader:
     def __init__(self, file_path, config=None, valid_scids=None):
         self.file_path = file_path
         self.attachment_data = {}
+        self.attachment_table = pd.DataFrame()  # All SCID rows with normalized columns, built at load
+        self._scid_slices = {}  # SCID -> (start, stop) row positions in attachment_table
         self.config = config or {}
         self.valid_scids = set(valid_scids) if valid_scids else None
         self.load_attachment_data()
@@ -23,23 +29,20 @@ class AttachmentDataReader:
            Sheet names are expected to be 'SCID <scid>' where <scid> is already filtered.
         """
         try:
-            xls = pd.ExcelFile(self.file_path)
-            scid_sheets = [sheet for sheet in xls.sheet_names if sheet.startswith("SCID ")]
+            if Path(self.file_path).suffix.lower() in ('.xlsx', '.xlsm'):
+                sheet_frames = self._iter_scid_sheets_openpyxl()
+            else:
+                sheet_frames = self._iter_scid_sheets_pandas()
             
             loaded_count = 0
             skipped_count = 0
             
-            for sheet_name in scid_sheets:
-                scid = sheet_name[5:].strip()
-                ignore_keywords = self.config.get('ignore_scid_keywords', [])
-                scid = Utils.normalize_scid(scid, ignore_keywords)
-                
-                if self.valid_scids is not None and scid not in self.valid_scids:
+            for sheet_name, scid, df in sheet_frames:
+                if df is None:
                     skipped_count += 1
                     continue
                 
                 try:
-                    df = pd.read_excel(self.file_path, sheet_name=sheet_name, header=1)
                     df = df.fillna("")
                     
                     df.columns = df.columns.str.strip().str.lower()
@@ -59,160 +62,309 @@ class AttachmentDataReader:
             logging.info(f"Loaded {loaded_count} SCID sheets" + (f", skipped {skipped_count}" if skipped_count > 0 else ""))
             if not self.attachment_data:
                 logging.error("No valid SCID data found in attachment file")
+            self._build_attachment_store()
         except Exception as e:
             logging.error(f"Failed to load attachment data: {e}", exc_info=True)
     
+    def _scid_for_sheet(self, sheet_name):
+        """Return the normalized SCID for a 'SCID <scid>' sheet, or None if it should be skipped"""
+        if not sheet_name.startswith("SCID "):
+            return None
+        ignore_keywords = self.config.get('ignore_scid_keywords', [])
+        scid = Utils.normalize_scid_cached(sheet_name[5:].strip(), ignore_keywords)
+        if self.valid_scids is not None and scid not in self.valid_scids:
+            return None
+        return scid
+    
+    def _iter_scid_sheets_openpyxl(self):
+        """
+        Stream every wanted SCID sheet from a single read-only workbook.
+        
+        Sheets whose SCID is not in valid_scids are skipped before any of their
+        rows are read. Cell values are converted the way pandas' openpyxl reader
+        does, so the frames match pd.read_excel(sheet_name=..., header=1).
+        
+        Yields:
+            tuple: (sheet_name, scid, DataFrame or None when the sheet failed to read)
+        """
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            scid_sheets = [sheet for sheet in wb.sheetnames if sheet.startswith("SCID ")]
+            for sheet_name in scid_sheets:
+                scid = self._scid_for_sheet(sheet_name)
+                if scid is None:
+                    yield sheet_name, None, None
+                    continue
+                try:
+                    ws = wb[sheet_name]
+                    # Read-only sheets can carry stale dimensions; pandas resets them too
+                    ws.reset_dimensions()
+                    rows = [
+                        [self._convert_cell_value(value) for value in row]
+                        for row in ws.iter_rows(values_only=True)
+                    ]
+                    yield sheet_name, scid, self._rows_to_dataframe(rows, header_row=1)
+                except Exception as e:
+                    logging.error(f"Error reading sheet '{sheet_name}': {e}")
+                    yield sheet_name, scid, None
+        finally:
+            wb.close()
+    
+    def _iter_scid_sheets_pandas(self):
+        """Fallback loader for formats openpyxl cannot stream (e.g. legacy .xls)"""
+        xls = pd.ExcelFile(self.file_path)
+        scid_sheets = [sheet for sheet in xls.sheet_names if sheet.startswith("SCID ")]
+        for sheet_name in scid_sheets:
+            scid = self._scid_for_sheet(sheet_name)
+            if scid is None:
+                yield sheet_name, None, None
+                continue
+            try:
+                yield sheet_name, scid, xls.parse(sheet_name, header=1)
+            except Exception as e:
+                logging.error(f"Error reading sheet '{sheet_name}': {e}")
+                yield sheet_name, scid, None
+    
+    @staticmethod
+    def _convert_cell_value(value):
+        """Convert an openpyxl cell value the same way pandas' openpyxl reader does"""
+        if value is None:
+            return ""
+        if isinstance(value, str) and value in ERROR_CODES:
+            return np.nan
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if value == int(value):
+                return int(value)
+            return float(value)
+        return value
+    
+    @staticmethod
+    def _rows_to_dataframe(rows, header_row=1):
+        """
+        Build a DataFrame from converted sheet rows using row `header_row` (0-based) as the header
+        
+        Rows go through pandas' own text parser, so header naming, default NA strings
+        ("N/A", "NA", "null", ...) and type inference match pd.read_excel.
+        """
+        # Trim trailing empty cells and rows the way pandas does
+        data = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(rows):
+            row = list(row)
+            while row and row[-1] == "":
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            data.append(row)
+        data = data[:last_row_with_data + 1]
+        if len(data) <= header_row:
+            return pd.DataFrame()
+        
+        max_width = max(len(data_row) for data_row in data)
+        data = [data_row + [""] * (max_width - len(data_row)) for data_row in data]
+        try:
+            return TextParser(data, header=header_row, skip_blank_lines=False).read()
+        except EmptyDataError:
+            return pd.DataFrame()
+    
+    def _build_attachment_store(self):
+        """
+        Concatenate every SCID sheet into one table and precompute the columns the finders need.
+        
+        Adds '_scid' (categorical), '_company_norm' / '_measured_norm' (stripped, lower-case text)
+        and '_inches' (height_in_inches as float, NaN when not numeric). Rows of one SCID are
+        contiguous, so a SCID lookup is a positional slice.
+        """
+        scids = list(self.attachment_data.keys())
+        if not scids:
+            self.attachment_table = pd.DataFrame()
+            self._scid_slices = {}
+            return
+        
+        frames = [self.attachment_data[scid] for scid in scids]
+        table = pd.concat(frames, ignore_index=True, sort=False)
+        
+        lengths = [len(df) for df in frames]
+        offsets = np.cumsum([0] + lengths)
+        self._scid_slices = {scid: (int(offsets[i]), int(offsets[i + 1])) for i, scid in enumerate(scids)}
+        
+        table['_scid'] = pd.Categorical.from_codes(np.repeat(np.arange(len(scids)), lengths), categories=scids)
+        table['_company_norm'] = table['company'].astype(str).str.strip().str.lower()
+        table['_measured_norm'] = table['measured'].astype(str).str.strip().str.lower()
+        table['_inches'] = pd.to_numeric(
+            table['height_in_inches'].astype(str).str.replace('"', '').str.replace('″', '').str.strip(),
+            errors='coerce'
+        )
+        self.attachment_table = table
+        logging.debug(f"Attachment store built: {len(table)} rows across {len(scids)} SCIDs")
+    
+    def get_scid_rows(self, scid):
+        """Get the rows of attachment_table for a SCID (read-only slice; empty if unknown)"""
+        ignore_keywords = self.config.get('ignore_scid_keywords', [])
+        normalized_scid = Utils.normalize_scid_cached(scid, ignore_keywords)
+        bounds = self._scid_slices.get(normalized_scid)
+        if bounds is None:
+            return self.attachment_table.iloc[0:0]
+        return self.attachment_table.iloc[bounds[0]:bounds[1]]
+    
+    def _power_company_mask(self, rows):
+        """Return (power_company_pattern, mask of rows whose company matches the power company)"""
+        power_company = self.config.get("power_company", "").strip().lower()
+        if not power_company:
+            return None, pd.Series(False, index=rows.index)
+        power_company_pattern = r'\b' + re.escape(power_company) + r'\b'
+        return power_company_pattern, rows['_company_norm'].str.contains(power_company_pattern, na=False, regex=True)
+    
     def get_scid_data(self, scid):
         """Get attachment data for a specific SCID"""
         ignore_keywords = self.config.get('ignore_scid_keywords', [])
-        normalized_scid = Utils.normalize_scid(scid, ignore_keywords)
+        normalized_scid = Utils.normalize_scid_cached(scid, ignore_keywords)
         data = self.attachment_data.get(normalized_scid, pd.DataFrame())
         return data
 
-    def find_power_attachment(self, scid, power_keywords):
-        """Find the lowest power attachment for a SCID"""
-        df = self.get_scid_data(scid)
-        if df.empty:
+    def _match_power_keywords(self, rows, power_keywords):
+        """
+        Match power keywords against a SCID's rows
+        
+        Returns:
+            tuple: (candidate rows, keyword that matched each candidate (longest wins),
+                    mask of candidates that pass the power company rule for riser keywords)
+        """
+        keyword_map = [
+            (kw.strip().lower(), kw)
+            for kw in power_keywords
+            if isinstance(kw, str) and kw.strip()
+        ]
+        if not keyword_map:
+            empty = rows.iloc[0:0]
+            return empty, pd.Series(dtype=object), pd.Series(dtype=bool)
+        
+        power_company_pattern, company_matches_power = self._power_company_mask(rows)
+        if power_company_pattern:
+            candidate_mask = company_matches_power | rows['_company_norm'].eq('')
+        else:
+            candidate_mask = pd.Series(True, index=rows.index)
+        
+        keyword_pattern = '|'.join([re.escape(k) for k, _ in keyword_map])
+        candidate_mask &= rows['_measured_norm'].str.contains(keyword_pattern, na=False, regex=True)
+        candidates = rows[candidate_mask]
+        
+        # Determine which keyword matched each row (longest keyword wins)
+        keywords_by_length = sorted(keyword_map, key=lambda x: len(x[0]), reverse=True)
+        
+        def find_keyword(measured_text):
+            for keyword_lower, keyword_original in keywords_by_length:
+                if keyword_lower in measured_text:
+                    return keyword_original
+            return None
+        
+        matched_keyword = candidates['_measured_norm'].map(find_keyword)
+        requires_power = matched_keyword.map(lambda kw: isinstance(kw, str) and self._keyword_requires_power_company(kw)).astype(bool)
+        keep = matched_keyword.notna() & ~(requires_power & ~company_matches_power[candidates.index])
+        return candidates, matched_keyword, keep
+
+    def find_power_attachment(self, scid, power_keywords, labels=None):
+        """
+        Find the lowest power attachment for a SCID
+        
+        Args:
+            scid: SCID to look up
+            power_keywords: Power keywords from the configuration
+            labels: Optional row labels for the SCID from the batch attachment classifier; its
+                'power_keyword' column replaces the keyword matching done here
+        """
+        rows = self.get_scid_rows(scid)
+        if rows.empty:
             return None
         try:
-            power_company = self.config.get("power_company", "").strip().lower()
-            keyword_map = [
-                (kw.strip().lower(), kw)
-                for kw in power_keywords
-                if isinstance(kw, str) and kw.strip()
-            ]
-            if not keyword_map:
-                return None
-            
-            df['company_stripped'] = df['company'].astype(str).str.strip().str.lower()
-            df['measured_stripped'] = df['measured'].astype(str).str.strip().str.lower()
-            
-            if power_company:
-                power_company_pattern = r'\b' + re.escape(power_company) + r'\b'
-                company_mask = df['company_stripped'].str.contains(power_company_pattern, na=False, regex=True)
-                blank_mask = df['company_stripped'].eq('')
-                candidate_rows = df[company_mask | blank_mask].copy()
-            else:
-                power_company_pattern = None
-                company_mask = pd.Series(False, index=df.index)
-                candidate_rows = df.copy()
-            
-            if candidate_rows.empty:
-                return None
-            
-            keyword_pattern = '|'.join([re.escape(k) for k, _ in keyword_map])
-            candidate_rows = candidate_rows[
-                candidate_rows['measured_stripped'].str.contains(keyword_pattern, na=False, regex=True)
-            ]
-            if candidate_rows.empty:
-                return None
-            
-            # Determine which keyword matched each row
-            def find_keyword(measured_text):
-                for keyword_lower, keyword_original in sorted(keyword_map, key=lambda x: len(x[0]), reverse=True):
-                    if keyword_lower in measured_text:
-                        return keyword_original
-                return None
-            
-            candidate_rows['matched_keyword'] = candidate_rows['measured_stripped'].apply(find_keyword)
-            candidate_rows = candidate_rows[candidate_rows['matched_keyword'].notna()]
-            if candidate_rows.empty:
-                return None
-            
-            if power_company_pattern:
-                candidate_rows['company_matches_power'] = candidate_rows['company_stripped'].str.contains(
-                    power_company_pattern, na=False, regex=True
-                )
+            if labels is not None:
+                matched_keyword = labels['power_keyword'].reindex(rows.index)
+                matched_keyword = matched_keyword[matched_keyword.notna()]
+                candidates = rows.loc[matched_keyword.index]
+                keep = pd.Series(True, index=candidates.index)
             else:
-                candidate_rows['company_matches_power'] = False
-            
-            def requires_power(keyword):
-                return 'riser' in keyword.strip().lower()
-            
-            candidate_rows = candidate_rows[
-                ~(candidate_rows['matched_keyword'].apply(requires_power) & ~candidate_rows['company_matches_power'])
-            ]
-            if candidate_rows.empty:
+                candidates, matched_keyword, keep = self._match_power_keywords(rows, power_keywords)
+            if candidates.empty:
                 return None
             
-            candidate_rows['height_numeric'] = pd.to_numeric(
-                candidate_rows['height_in_inches'].astype(str).str.replace('"', '').str.replace('″', ''),
-                errors='coerce'
-            )
-            candidate_rows = candidate_rows.dropna(subset=['height_numeric'])
-            candidate_rows = candidate_rows[candidate_rows['height_numeric'] > 0]
-            if candidate_rows.empty:
+            heights = candidates['_inches']
+            keep = keep & heights.notna() & (heights > 0)
+            if not keep.any():
                 return None
             
-            min_row = candidate_rows.loc[candidate_rows['height_numeric'].idxmin()]
-            height_formatted = Utils.inches_to_feet_format(str(int(min_row['height_numeric'])))
+            min_idx = heights[keep].idxmin()
+            min_row = candidates.loc[min_idx]
+            height_formatted = Utils.inches_to_feet_format(str(int(min_row['_inches'])))
             height_formatted = self._format_height_for_output(height_formatted)
             
             result = {
                 'height': height_formatted,
-                'height_decimal': float(min_row['height_numeric']) / 12,
+                'height_decimal': float(min_row['_inches']) / 12,
                 'company': min_row['company'],
                 'measured': min_row['measured'],
-                'keyword': min_row['matched_keyword']
+                'keyword': matched_keyword[min_idx]
             }
             return result
         except Exception as e:
             logging.error(f"Error processing power attachment for SCID {scid}: {e}")
         return None
     
-    def find_power_equipment(self, scid, power_equipment_keywords):
-        """Find all power equipment for a SCID and return formatted list"""
-        df = self.get_scid_data(scid)
-        if df.empty:
+    def find_power_equipment(self, scid, power_equipment_keywords, labels=None):
+        """
+        Find all power equipment for a SCID and return formatted list
+        
+        Args:
+            scid: SCID to look up
+            power_equipment_keywords: Power equipment keywords from the configuration
+            labels: Optional row labels for the SCID from the batch attachment classifier; its
+                'equipment' column replaces the candidate row search done here
+        """
+        rows = self.get_scid_rows(scid)
+        if rows.empty:
             return None
         
         try:
-            power_company = self.config.get("power_company", "").strip().lower()
             normalized_keywords = [kw.strip().lower() for kw in power_equipment_keywords if isinstance(kw, str) and kw.strip()]
             if not normalized_keywords:
                 return None
             
-            df['company_stripped'] = df['company'].astype(str).str.strip().str.lower()
-            
-            if power_company:
-                power_company_pattern = r'\b' + re.escape(power_company) + r'\b'
-                company_mask = df['company_stripped'].str.contains(power_company_pattern, na=False, regex=True)
-                blank_mask = df['company_stripped'].eq('')
-                power_company_rows = df[company_mask | blank_mask]
+            power_company_pattern, company_matches_power = self._power_company_mask(rows)
+            if labels is not None:
+                candidate_mask = labels['equipment'].reindex(rows.index, fill_value=False).astype(bool)
             else:
-                power_company_pattern = None
-                power_company_rows = df.copy()
-            
+                if power_company_pattern:
+                    candidate_mask = company_matches_power | rows['_company_norm'].eq('')
+                else:
+                    candidate_mask = pd.Series(True, index=rows.index)
+                
+                # Only rows mentioning at least one equipment keyword need a closer look
+                keyword_pattern = '|'.join(re.escape(kw) for kw in normalized_keywords)
+                candidate_mask &= rows['_measured_norm'].str.contains(keyword_pattern, na=False, regex=True)
+            power_company_rows = rows[candidate_mask]
             if power_company_rows.empty:
                 return None
             
-            power_company_rows = power_company_rows.copy()
-            power_company_rows['measured_stripped'] = power_company_rows['measured'].astype(str).str.strip().str.lower()
+            # Height columns in lookup order: standard names first, then any other 'height' column of the sheet
+            standard_height_cols = ['height_in_inches', 'height_in', 'height']
+            dynamic_height_cols = [col for col in self.attachment_data[power_company_rows['_scid'].iloc[0]].columns if 'height' in str(col).lower()]
+            all_height_cols = standard_height_cols + [col for col in dynamic_height_cols if col not in standard_height_cols]
+            all_height_cols = [col for col in all_height_cols if col in power_company_rows.columns]
             
             # Find rows that match power equipment keywords (case-insensitive)
             all_equipment = []  # Collect all matching equipment
             
-            for _, row in power_company_rows.iterrows():
-                measured = str(row.get('measured', '')).lower().strip()
-                company_stripped = str(row.get('company', '')).strip().lower()
-                company_matches_power = False
-                if power_company_pattern:
-                    company_matches_power = bool(re.search(power_company_pattern, company_stripped))
+            for idx, row in power_company_rows.iterrows():
+                measured = row['_measured_norm']
                 for normalized_keyword in normalized_keywords:
                     if normalized_keyword in measured:
-                        if self._keyword_requires_power_company(normalized_keyword) and not company_matches_power:
+                        if self._keyword_requires_power_company(normalized_keyword) and not company_matches_power[idx]:
                             continue
-                        # Get height for this equipment - try different column names (flexible detection)
+                        # Get height for this equipment from the first non-blank height column
                         height_value = None
-                        # First try standard column names
-                        standard_height_cols = ['height_in_inches', 'height_in', 'height']
-                        # Then find any column containing 'height' in the name
-                        dynamic_height_cols = [col for col in row.index if 'height' in str(col).lower()]
-                        # Combine and deduplicate while preserving order
-                        all_height_cols = standard_height_cols + [col for col in dynamic_height_cols if col not in standard_height_cols]
-                        
                         for height_col in all_height_cols:
-                            if height_col in row and pd.notna(row[height_col]) and str(row[height_col]).strip():
+                            if pd.notna(row[height_col]) and str(row[height_col]).strip():
                                 height_value = row[height_col]
                                 break
                         
@@ -285,15 +437,42 @@ class AttachmentDataReader:
     
     def find_telecom_attachments(self, scid, telecom_keywords):
         """Find telecom attachments for a SCID and combine multiple heights in the same cell."""
-        df = self.get_scid_data(scid)
+        df = self.get_scid_rows(scid)
         if df.empty:
             return {}
         
         attachments = {}
         try:
-            if 'height_in_inches' not in df.columns:
-                logging.error(f"'height_in_inches' column missing for SCID {scid}")
-                return {}
+            # Updated keywords for communication attachment selection using configurable keywords
+            # Include: 'CATV Com', 'Telco Com', 'Fiber Optic Com', 'insulator', 'Power Guy'
+            comm_keywords = self.config.get("comm_keywords", ['catv com', 'telco com', 'fiber optic com', 'insulator', 'power guy'])
+            
+            # Support wildcard (*) for substring matching or exact match
+            def matches_comm_keyword(measured_clean):
+                """Check if measured text matches any communication keyword (case-insensitive)
+                - If keyword ends with *, performs substring matching
+                - Otherwise performs exact match
+                - Special case: 'Guy' always uses exact match
+                """
+                # Check if any keyword matches
+                for kw in comm_keywords:
+                    kw_clean = kw.strip().lower()
+                    if kw_clean == 'guy':
+                        # Special case: Guy always exact match
+                        if kw_clean == measured_clean:
+                            return True
+                    elif kw_clean.endswith('*'):
+                        # Wildcard match: substring
+                        if kw_clean[:-1] in measured_clean:
+                            return True
+                    else:
+                        # Exact match
+                        if kw_clean == measured_clean:
+                            return True
+                return False
+            
+            # The keyword test does not depend on the provider, so evaluate it once per row
+            comm_mask = df['_measured_norm'].map(matches_comm_keyword).astype(bool)
             
             for provider, keywords in telecom_keywords.items():
                 clean_keywords = [kw.strip() for kw in keywords if kw.strip()]
@@ -302,87 +481,23 @@ class AttachmentDataReader:
                     clean_keywords.append(main_name)
                 
                 company_regex = r'\b(?:' + '|'.join(re.escape(k.lower()) for k in clean_keywords) + r')\b'
-                
-                # Updated keywords for communication attachment selection using configurable keywords
-                # Include: 'CATV Com', 'Telco Com', 'Fiber Optic Com', 'insulator', 'Power Guy'
-                comm_keywords = self.config.get("comm_keywords", ['catv com', 'telco com', 'fiber optic com', 'insulator', 'power guy'])
-                
-                # Support wildcard (*) for substring matching or exact match
-                def matches_comm_keyword(measured_text):
-                    """Check if measured text matches any communication keyword (case-insensitive)
-                    - If keyword ends with *, performs substring matching
-                    - Otherwise performs exact match
-                    - Special case: 'Guy' always uses exact match
-                    """
-                    measured_clean = str(measured_text).strip().lower()
-                    
-                    # Check if any keyword matches
-                    for kw in comm_keywords:
-                        kw_clean = kw.strip().lower()
-                        if kw_clean == 'guy':
-                            # Special case: Guy always exact match
-                            if kw_clean == measured_clean:
-                                return True
-                        elif kw_clean.endswith('*'):
-                            # Wildcard match: substring
-                            if kw_clean[:-1] in measured_clean:
-                                return True
-                        else:
-                            # Exact match
-                            if kw_clean == measured_clean:
-                                return True
-                    return False
+                company_mask = df['_company_norm'].str.contains(company_regex, na=False, regex=True)
                 
                 # For "Power Guy" keyword, company name must be in company column, not measured column
-                if 'power guy' in [kw.lower() for kw in comm_keywords]:
-                    # Check if measured column contains "power guy" exactly
-                    power_guy_rows = df[df['measured'].astype(str).apply(matches_comm_keyword)]
-                    if not power_guy_rows.empty:
-                        # For power guy entries, company name should be in company column
-                        provider_rows = power_guy_rows[
-                            power_guy_rows['company'].astype(str).str.lower().str.contains(company_regex, na=False, regex=True)
-                        ]
-                    else:
-                        # Regular telecom attachment matching with exact measured matching
-                        provider_rows = df[
-                            (df['company'].astype(str).str.lower().str.contains(company_regex, na=False, regex=True)) &
-                            (df['measured'].astype(str).apply(matches_comm_keyword))
-                        ]
-                else:
-                    # Regular telecom attachment matching with exact measured matching
-                    provider_rows = df[
-                        (df['company'].astype(str).str.lower().str.contains(company_regex, na=False, regex=True)) &
-                        (df['measured'].astype(str).apply(matches_comm_keyword))
-                    ]
+                # (either way a row needs both a comm keyword match and a provider company match)
+                provider_rows = df[company_mask & comm_mask]
                 
                 if not provider_rows.empty:
-                    # Clean and convert height data with better error handling
-                    def clean_height_value(height_val):
-                        """Clean height value and convert to numeric"""
-                        if pd.isna(height_val):
-                            return None
-                        height_str = str(height_val).replace('"', '').replace('″', '').strip()
-                        if not height_str:
-                            return None
-                        try:
-                            return pd.to_numeric(height_str)
-                        except (ValueError, TypeError):
-                            logging.warning(f"Could not convert height value '{height_val}' to numeric for SCID {scid}")
-                            return None
-                    
-                    provider_rows['height_numeric'] = provider_rows['height_in_inches'].apply(clean_height_value)
-                    
-                    # Filter out rows with invalid height data
-                    valid_rows = provider_rows.dropna(subset=['height_numeric'])
+                    # Heights were parsed once when the store was built
+                    valid_rows = provider_rows[provider_rows['_inches'].notna()]
                     
                     if not valid_rows.empty:
-                        valid_rows = valid_rows.sort_values(by='height_numeric', ascending=False)
+                        valid_rows = valid_rows.sort_values(by='_inches', ascending=False)
                         
                         heights = []
                         decimal_values = []
                         
-                        for _, row in valid_rows.iterrows():
-                            height_inches = row['height_numeric']
+                        for height_inches in valid_rows['_inches']:
                             height_formatted = Utils.inches_to_feet_format(str(int(height_inches)))
                             if height_formatted:  # Only add if conversion was successful
                                 # Apply output formatting based on configuration
@@ -414,35 +529,26 @@ class AttachmentDataReader:
     
     def find_streetlight_attachment(self, scid):
         """Find the lowest street light attachment for a SCID (measured contains 'street light')"""
-        df = self.get_scid_data(scid)
-        if df.empty:
+        rows = self.get_scid_rows(scid)
+        if rows.empty:
             return None
         try:
-            df['measured_stripped'] = df['measured'].astype(str).str.strip().str.lower()
             keywords = self._get_street_light_keywords()
             keyword_pattern = self._build_keyword_regex(keywords)
             if keyword_pattern:
-                streetlight_rows = df[df['measured_stripped'].str.contains(keyword_pattern, na=False, regex=True)]
+                streetlight_mask = rows['_measured_norm'].str.contains(keyword_pattern, na=False, regex=True)
             else:
-                streetlight_rows = df[df['measured_stripped'].str.contains('street light', na=False)]
+                streetlight_mask = rows['_measured_norm'].str.contains('street light', na=False)
             
-            if streetlight_rows.empty:
-                return None
-            
-            streetlight_rows['height_numeric'] = pd.to_numeric(
-                streetlight_rows['height_in_inches'].astype(str).str.replace('"', '').str.replace('″', ''),
-                errors='coerce'
-            )
-            streetlight_rows = streetlight_rows.dropna(subset=['height_numeric'])
-            
-            if not streetlight_rows.empty:
-                min_row = streetlight_rows.loc[streetlight_rows['height_numeric'].idxmin()]
-                height_formatted = Utils.inches_to_feet_format(str(int(min_row['height_numeric'])))
+            heights = rows['_inches'][streetlight_mask].dropna()
+            if not heights.empty:
+                min_row = rows.loc[heights.idxmin()]
+                height_formatted = Utils.inches_to_feet_format(str(int(min_row['_inches'])))
                 # Apply output formatting based on configuration
                 height_formatted = self._format_height_for_output(height_formatted)
                 return {
                     'height': height_formatted,
-                    'height_decimal': float(min_row['height_numeric']) / 12,
+                    'height_decimal': float(min_row['_inches']) / 12,
                     'measured': min_row['measured']
                 }
         except Exception as e:
@@ -491,27 +597,22 @@ class AttachmentDataReader:
     
     def count_existing_risers_from_attachments(self, scid):
         """Count existing risers from attachment data, excluding MetroNet"""
-        df = self.get_scid_data(scid)
-        if df.empty:
+        rows = self.get_scid_rows(scid)
+        if rows.empty:
             return 0
         
         try:
             # Filter for riser entries
-            riser_rows = df[df['measured'].astype(str).str.lower().str.contains('riser', na=False)]
+            riser_rows = rows[rows['_measured_norm'].str.contains('riser', na=False, regex=False)]
             
             if riser_rows.empty:
                 return 0
             
             # Apply MetroNet filtering
             count = 0
-            for _, row in riser_rows.iterrows():
-                company = str(row.get('company', '')).lower()
-                measured = str(row.get('measured', '')).lower()
-                
+            for company, measured in zip(riser_rows['_company_norm'], riser_rows['_measured_norm']):
                 # Check if this is a MetroNet riser
-                is_metronet = self._is_metronet_riser(company, measured)
-                
-                if not is_metronet:
+                if not self._is_metronet_riser(company, measured):
                     count += 1
             
             return count
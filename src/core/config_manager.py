@@ -66,7 +66,8 @@ class ConfigManager:
             "output_settings": {
                 "header_row": 1,
                 "data_start_row": 2,
-                "worksheet_name": "1"
+                "worksheet_name": "1",
+                "output_engine": "openpyxl"
             },
             "processing_options": {
                 "open_output": True,
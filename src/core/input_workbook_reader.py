@@ -0,0 +1,62 @@
+import logging
+import time
+import pandas as pd
+
+
+class InputWorkbookReader:
+    """Reads the nodes/connections/sections sheets from a Katapult export in one pass"""
+
+    DEFAULT_SHEETS = ('nodes', 'connections', 'sections')
+
+    def __init__(self, file_path, sheet_names=None):
+        self.file_path = file_path
+        self.sheet_names = tuple(sheet_names) if sheet_names else self.DEFAULT_SHEETS
+        self.sheets = {}
+        self.sheet_timings = {}
+        self.load_workbook_data()
+
+    def load_workbook_data(self):
+        """
+        Open the workbook once and parse every requested sheet from the same handle.
+
+        Values are read as strings and missing cells come back as "" so callers get
+        the same frames the old read_excel(..., dtype=str).fillna("") calls produced.
+
+        Raises:
+            ValueError: If one of the requested sheets is not in the workbook
+        """
+        start = time.perf_counter()
+        with pd.ExcelFile(self.file_path) as xls:
+            open_time = time.perf_counter() - start
+            missing = [name for name in self.sheet_names if name not in xls.sheet_names]
+            if missing:
+                raise ValueError(f"Worksheet(s) {missing} not found in {self.file_path}")
+
+            for sheet_name in self.sheet_names:
+                sheet_start = time.perf_counter()
+                df = xls.parse(sheet_name, dtype=str)
+                # Blank cells are filled in place so no second frame is allocated
+                df.fillna("", inplace=True)
+                self.sheets[sheet_name] = df
+                self.sheet_timings[sheet_name] = time.perf_counter() - sheet_start
+                logging.debug(f"Read sheet '{sheet_name}': {len(df)} rows in {self.sheet_timings[sheet_name]:.2f}s")
+
+        total_time = time.perf_counter() - start
+        timing_summary = ", ".join(f"{name} {secs:.2f}s" for name, secs in self.sheet_timings.items())
+        logging.info(f"Input workbook read in {total_time:.2f}s (open {open_time:.2f}s; {timing_summary})")
+
+    def get_sheet(self, sheet_name):
+        """Get a loaded sheet, or an empty DataFrame if it was not requested"""
+        return self.sheets.get(sheet_name, pd.DataFrame())
+
+    @property
+    def nodes_df(self):
+        return self.get_sheet('nodes')
+
+    @property
+    def connections_df(self):
+        return self.get_sheet('connections')
+
+    @property
+    def sections_df(self):
+        return self.get_sheet('sections')
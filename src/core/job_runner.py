@@ -0,0 +1,432 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from .utils import Utils
+from .attachment_data_reader import AttachmentDataReader
+from .pole_data_processor import PoleDataProcessor
+from .pdf_report_reader import PDFReportReader
+from .alden_qc_reader import AldenQCReader
+from .input_workbook_reader import InputWorkbookReader
+from .run_profiler import RunProfiler
+
+
+class ProcessingJob:
+    """
+    Input paths for one run of the pipeline
+
+    Field names match last_paths.json, so a saved GUI session is also a valid one-job manifest.
+    """
+
+    PATH_FIELDS = (
+        "input_file",
+        "attachment_file",
+        "output_file",  # Output template
+        "existing_reports_folder",
+        "proposed_reports_folder",
+        "alden_qc_file",
+        "output_dir",  # Where the filled copy is written (default: <template folder>/output)
+    )
+
+    def __init__(self, output_file, input_file="", attachment_file="", existing_reports_folder="",
+                 proposed_reports_folder="", alden_qc_file="", output_dir="", name=""):
+        self.output_file = output_file
+        self.input_file = input_file
+        self.attachment_file = attachment_file
+        self.existing_reports_folder = existing_reports_folder
+        self.proposed_reports_folder = proposed_reports_folder
+        self.alden_qc_file = alden_qc_file
+        self.output_dir = output_dir
+        self.name = name or Path(input_file or output_file).stem
+
+    @classmethod
+    def from_dict(cls, data, base_dir=None):
+        """
+        Build a job from a manifest entry
+
+        Args:
+            data: Dictionary with PATH_FIELDS keys (missing keys are empty) and an optional 'name'
+            base_dir: Directory that relative paths are resolved against
+
+        Returns:
+            ProcessingJob
+        """
+        unknown = set(data) - set(cls.PATH_FIELDS) - {"name"}
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        if not data.get("output_file"):
+            raise ValueError("Job has no 'output_file' (output template)")
+
+        paths = {}
+        for field in cls.PATH_FIELDS:
+            value = str(data.get(field) or "").strip()
+            if value and base_dir is not None and not Path(value).expanduser().is_absolute():
+                value = str(Path(base_dir) / value)
+            paths[field] = str(Path(value).expanduser()) if value else ""
+        return cls(name=str(data.get("name") or "").strip(), **paths)
+
+    def to_dict(self):
+        """Job fields as a manifest entry"""
+        data = {"name": self.name}
+        data.update({field: getattr(self, field) for field in self.PATH_FIELDS})
+        return data
+
+
+def load_manifest(manifest_path):
+    """
+    Read a JSON job manifest
+
+    The manifest is either a list of jobs or {"defaults": {...}, "jobs": [...]}, where
+    defaults are applied to every job (e.g. a shared template or Alden QC file). Relative
+    paths are resolved against the manifest's folder.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        list: ProcessingJob objects in manifest order
+    """
+    manifest_path = Path(manifest_path)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if isinstance(manifest, dict):
+        defaults = manifest.get("defaults", {})
+        entries = manifest.get("jobs", [manifest] if "output_file" in manifest else [])
+    else:
+        defaults = {}
+        entries = manifest
+
+    jobs = []
+    for index, entry in enumerate(entries, start=1):
+        try:
+            data = dict(defaults)
+            data.update({key: value for key, value in entry.items() if key != "defaults"})
+            jobs.append(ProcessingJob.from_dict(data, base_dir=manifest_path.parent))
+        except Exception as e:
+            raise ValueError(f"Invalid job #{index} in {manifest_path}: {e}") from e
+    return jobs
+
+
+def generate_output_file(job_name, output_template, output_dir=None):
+    """
+    Copy the output template to '<job name> Spread Sheet.xlsx' in the output folder
+
+    Existing files are never overwritten: a timestamp, then a counter, is appended instead.
+    Names are claimed with an exclusive create, so concurrent jobs cannot pick the same file.
+
+    Args:
+        job_name: Job name used for the file name
+        output_template: Path to the output template
+        output_dir: Target folder (default: 'output' next to the template)
+
+    Returns:
+        Path of the new file, or None if the template could not be copied
+    """
+    template_path = Path(output_template)
+    if not template_path.exists():
+        logging.error(f"Output template file not found: {output_template}")
+        return None
+
+    # Create output directory in the same location as the template
+    output_dir = Path(output_dir) if output_dir else template_path.parent / "output"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Always use .xlsx format for output files; if the name is taken, try a timestamp, then a counter
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    candidates = [f"{job_name} Spread Sheet.xlsx", f"{job_name} Spread Sheet_{timestamp}.xlsx"]
+    candidates += [f"{job_name} Spread Sheet_{counter}.xlsx" for counter in range(2, 101)]
+
+    for file_name in candidates:
+        actual_output_file = output_dir / file_name
+        try:
+            # Exclusive create claims the name, so jobs running in parallel never share a file
+            with open(actual_output_file, 'xb') as target, open(template_path, 'rb') as source:
+                shutil.copyfileobj(source, target)
+            shutil.copymode(template_path, actual_output_file)
+            return actual_output_file
+        except FileExistsError:
+            continue
+        except PermissionError:
+            # File is likely open in Excel or another application
+            logging.warning(f"Permission denied - file may be open in another application: {actual_output_file}")
+            continue
+        except Exception as e:
+            logging.error(f"Error copying template file: {e}")
+            return None
+
+    # Every candidate name is taken
+    logging.error(f"Could not find available filename after 100 attempts")
+    return None
+
+
+def run_job(job, config, mapping_data, progress_callback=None):
+    """
+    Run the full pipeline for one job: read inputs, process poles and write the output copy
+
+    Every stage is timed (see RunProfiler) and a JSON run report is written next to the output
+    as '<output name>.run.json' unless processing_options.run_report is false. With
+    processing_options.profile set, a cProfile dump of the run is written as '<output name>.prof'.
+
+    Args:
+        job: ProcessingJob
+        config: Configuration dictionary (ConfigManager.load_config())
+        mapping_data: Column mappings
+        progress_callback: Optional callable (percentage, message) -> bool; returning False stops the job
+
+    Returns:
+        dict: {'status': 'complete' | 'stopped' | 'failed', 'output_file': Path or None,
+               'poles': number of output rows, 'error': message or None,
+               'run_report': Path of the run report or None}
+    """
+    result = {'status': 'failed', 'output_file': None, 'poles': 0, 'error': None, 'run_report': None}
+    stopped = []
+
+    def progress(percentage, message):
+        if stopped:
+            return False
+        if progress_callback and not progress_callback(percentage, message):
+            stopped.append(True)
+            logging.info("Processing stopped by user request")
+            return False
+        return True
+
+    options = config.get("processing_options", {})
+    write_report = options.get("run_report", True)
+    profile_file = None
+    if options.get("profile", False):
+        # The output name is not known yet; the dump is renamed next to it once the run is done
+        profile_file = Path(tempfile.gettempdir()) / f"xcel_run_{os.getpid()}_{threading.get_ident()}.prof"
+    profiler = RunProfiler(enabled=bool(write_report or profile_file), profile_file=profile_file)
+    profiler.start()
+
+    try:
+        _run_pipeline(job, config, mapping_data, progress, stopped, profiler, result)
+    except Exception as e:
+        logging.error(f"Error during processing: {e}", exc_info=True)
+        progress(0, "Processing failed!")
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    finally:
+        profiler.finish()
+
+    _write_run_outputs(job, profiler, result, write_report)
+    return result
+
+
+def _write_run_outputs(job, profiler, result, write_report):
+    """Write the run report and move the cProfile dump next to the output file"""
+    if not profiler.enabled:
+        return
+    output_file = result['output_file']
+    if profiler.profile_file and Path(profiler.profile_file).exists():
+        if output_file:
+            profile_target = Path(output_file).with_suffix('.prof')
+            try:
+                shutil.move(str(profiler.profile_file), str(profile_target))
+                profiler.profile_file = profile_target
+                logging.info(f"cProfile stats: {profile_target}")
+            except Exception as e:
+                logging.warning(f"Could not move cProfile stats next to the output: {e}")
+        else:
+            logging.info(f"cProfile stats: {profiler.profile_file}")
+
+    if result['status'] == 'complete' or output_file:
+        profiler.log_summary()
+    if not write_report:
+        return
+    if not output_file:
+        logging.debug("No output file - run report not written")
+        return
+    try:
+        report_file = Path(output_file).with_suffix('.run.json')
+        profiler.write_report(
+            report_file,
+            job=job.to_dict(),
+            status=result['status'],
+            poles=result['poles'],
+            error=result['error'],
+            output_file=str(output_file)
+        )
+        result['run_report'] = report_file
+        logging.info(f"Run report written to: {report_file}")
+    except Exception as e:
+        logging.warning(f"Could not write run report: {e}")
+
+
+def _run_pipeline(job, config, mapping_data, progress, stopped, profiler, result):
+    """Pipeline stages of run_job; fills in result and returns early when stopped"""
+    # Check for stop request before starting
+    if not progress(0, "Starting processing..."):
+        result['status'] = 'stopped'
+        return
+
+    # Read main input file if provided
+    if job.input_file:
+        if not progress(10, "Reading main input file..."):
+            result['status'] = 'stopped'
+            return
+        with profiler.stage("input read") as stage:
+            input_reader = InputWorkbookReader(job.input_file)
+            nodes_df = input_reader.nodes_df
+            connections_df = input_reader.connections_df
+            sections_df = input_reader.sections_df
+            stage.update(rows=len(nodes_df), connections=len(connections_df), sections=len(sections_df))
+        logging.info(f"Loaded {len(nodes_df)} nodes, {len(connections_df)} connections")
+    else:
+        nodes_df = pd.DataFrame()
+        connections_df = pd.DataFrame()
+        sections_df = pd.DataFrame()
+
+    if not progress(15, "Extracting valid SCIDs..."):
+        result['status'] = 'stopped'
+        return
+
+    # Extract valid SCIDs from nodes data if available
+    valid_scids = []
+    if not nodes_df.empty and 'scid' in nodes_df.columns:
+        with profiler.stage("SCID normalization", rows=len(nodes_df)) as stage:
+            ignore_keywords = config.get("ignore_scid_keywords", [])
+            # Normalized once here; process_data reuses the tagged frame instead of normalizing again
+            nodes_df = Utils.normalize_nodes_scids(nodes_df, ignore_keywords)
+            valid_nodes = Utils.filter_valid_nodes(nodes_df)
+            valid_scids = valid_nodes['scid'].tolist()
+            stage['valid_scids'] = len(valid_scids)
+        logging.info(f"Found {len(valid_scids)} valid SCIDs")
+
+    # Read attachment data if provided
+    attachment_reader = None
+    if job.attachment_file:
+        if not progress(25, "Reading attachment data..."):
+            result['status'] = 'stopped'
+            return
+        with profiler.stage("attachment load") as stage:
+            attachment_reader = AttachmentDataReader(job.attachment_file, config=config, valid_scids=valid_scids)
+            stage['rows'] = len(attachment_reader.attachment_table)
+
+    # QC reader disabled
+    qc_reader = None
+
+    # Initialize Alden QC reader if file is provided
+    alden_qc_reader = None
+    if job.alden_qc_file:
+        with profiler.stage("Alden load") as stage:
+            try:
+                alden_qc_reader = AldenQCReader(job.alden_qc_file)
+                if alden_qc_reader.is_active():
+                    stage['rows'] = len(alden_qc_reader.get_all_poles())
+                    logging.info(f"Loaded Alden QC with {stage['rows']} poles")
+            except Exception as e:
+                logging.error(f"Error loading Alden QC: {e}")
+                alden_qc_reader = None
+
+    if not progress(30, "Initializing data processor..."):
+        result['status'] = 'stopped'
+        return
+
+    # Initialize PDF reader with the report folders
+    pdf_reader = None
+    existing_reports_folder = str(Path(job.existing_reports_folder).resolve()) if job.existing_reports_folder else ""
+    proposed_reports_folder = str(Path(job.proposed_reports_folder).resolve()) if job.proposed_reports_folder else ""
+
+    if existing_reports_folder or proposed_reports_folder:
+        try:
+            ignore_keywords = config.get("ignore_scid_keywords", [])
+            use_pdf_cache = config.get("processing_options", {}).get("pdf_cache", True)
+            pdf_reader = PDFReportReader(existing_reports_folder, proposed_reports_folder, ignore_keywords,
+                                         use_cache=use_pdf_cache)
+            logging.info("PDF reader initialized")
+        except Exception as e:
+            logging.error(f"Error initializing PDF reader: {e}")
+            pdf_reader = None
+
+    processor = PoleDataProcessor(
+        config=config,
+        mapping_data=mapping_data,
+        attachment_reader=attachment_reader,
+        qc_reader=qc_reader,
+        pdf_reader=pdf_reader,
+        alden_qc_reader=alden_qc_reader,
+        profiler=profiler
+    )
+
+    # Read template SCIDs to filter processing
+    if not progress(35, "Reading template connections..."):
+        result['status'] = 'stopped'
+        return
+
+    with profiler.stage("template read") as stage:
+        template_scids = processor.read_template_scids(job.output_file)
+        stage['rows'] = len(template_scids) if template_scids else 0
+    if template_scids:
+        logging.info(f"Processing {len(template_scids)} template connections")
+
+    # Extract all PDF reports up front (in parallel) so row building never waits on a PDF
+    if pdf_reader:
+        def pdf_progress(completed, total):
+            percentage = 35 + (5 * completed / total if total else 5)
+            return progress(percentage, f"Reading PDF reports ({completed}/{total})...")
+
+        with profiler.stage("PDF extraction") as stage:
+            pdf_data = processor.prefetch_pdf_data(progress_callback=pdf_progress)
+            stage['rows'] = len(pdf_data) if pdf_data else 0
+        if stopped:
+            result['status'] = 'stopped'
+            return
+
+    # Process data
+    if not progress(40, "Processing pole data..."):
+        result['status'] = 'stopped'
+        return
+    # process_data and write_output time their own inner stages (connection processing, row building, ...)
+    result_data = processor.process_data(
+        nodes_df=nodes_df,
+        connections_df=connections_df,
+        sections_df=sections_df,
+        progress_callback=progress,
+        manual_routes=None,
+        clear_existing_routes=False
+    )
+
+    # Keep any reports read on demand for the next run
+    if pdf_reader:
+        pdf_reader.save_cache()
+    Utils.log_scid_cache_stats()
+    # process_data returns early with partial data when stopped; do not write that out
+    if stopped:
+        result['status'] = 'stopped'
+        return
+
+    # Extract job name from nodes_df if available
+    progress(85, "Generating output file...")
+    job_name = ""
+    if not nodes_df.empty and "job_name" in nodes_df.columns and not nodes_df["job_name"].empty:
+        job_name = str(nodes_df["job_name"].iloc[0]).strip()
+    if not job_name:
+        job_name = "Output"
+
+    # Generate actual output file by copying template with job name
+    with profiler.stage("output copy"):
+        actual_output_file = generate_output_file(job_name, job.output_file, job.output_dir or None)
+    if not actual_output_file:
+        progress(0, "Failed to generate output file!")
+        result['error'] = "Failed to generate output file"
+        return
+    result['output_file'] = actual_output_file
+
+    # Write output to the newly created file
+    progress(90, "Writing output file...")
+    processor.write_output(result_data, str(actual_output_file))
+
+    progress(100, "Processing complete!")
+    logging.info(f"Processing complete. Output written to: {actual_output_file}")
+    logging.info(f"✓ Processed {len(result_data)} poles → {actual_output_file.name}")
+
+    result.update(status='complete', poles=len(result_data))
@@ -0,0 +1,206 @@
+import copy
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import psutil
+
+from .job_runner import ProcessingJob, run_job
+from .run_profiler import MemorySampler, process_cpu_seconds
+
+
+def _run_scheduled_job(job_data, config, mapping_data, log_file, log_level, sample_interval):
+    """
+    Run one job inside a pool worker (module level so it can be pickled)
+
+    The worker's root logger is pointed at the job's own log file, so jobs running side
+    by side do not interleave their output.
+
+    Returns:
+        dict: run_job result plus timing, memory and log file fields
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+    file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    root_logger.addHandler(file_handler)
+    root_logger.setLevel(log_level)
+
+    process = psutil.Process()
+    sampler = MemorySampler(sample_interval)
+    sampler.start()
+    wall_start = time.perf_counter()
+    cpu_start = process_cpu_seconds(process)
+    try:
+        job = ProcessingJob.from_dict(job_data)
+        logging.info(f"Job '{job.name}' started in worker {os.getpid()}")
+        result = run_job(job, config, mapping_data)
+    except Exception as e:
+        logging.error(f"Job failed: {e}", exc_info=True)
+        result = {'status': 'failed', 'output_file': None, 'poles': 0, 'error': str(e)}
+    finally:
+        sampler.stop()
+        file_handler.flush()
+
+    result = dict(result)
+    result.update(
+        output_file=str(result['output_file']) if result.get('output_file') else None,
+        run_report=str(result['run_report']) if result.get('run_report') else None,
+        wall_time=round(time.perf_counter() - wall_start, 3),
+        cpu_time=round(process_cpu_seconds(process) - cpu_start, 3),
+        start_rss_mb=round(sampler.start_rss / 2**20, 1),
+        peak_rss_mb=round(sampler.peak_rss / 2**20, 1),
+        worker_pid=os.getpid(),
+        log_file=str(log_file)
+    )
+    logging.info(f"Job finished: {result['status']} in {result['wall_time']:.1f}s, peak RSS {result['peak_rss_mb']} MB")
+    root_logger.removeHandler(file_handler)
+    file_handler.close()
+    return result
+
+
+class JobScheduler:
+    """
+    Runs independent jobs across a bounded process pool
+
+    Every job goes through the same run_job pipeline as the GUI and CLI in its own worker
+    process, writes its own log file and reports wall/CPU time and peak memory. When the
+    configuration does not pin processing_options.pdf_workers, the CPU cores are shared out
+    between the concurrent jobs so PDF extraction pools do not oversubscribe the machine.
+    """
+
+    def __init__(self, config, mapping_data, max_workers=None, log_dir="batch_logs", log_level=logging.INFO,
+                 memory_sample_interval=0.25):
+        self.config = config
+        self.mapping_data = mapping_data
+        self.max_workers = max_workers
+        self.log_dir = Path(log_dir)
+        self.log_level = log_level
+        self.memory_sample_interval = memory_sample_interval
+
+    def _worker_count(self, job_count):
+        """Pool size: requested count (default min(4, CPU count)), never more than the number of jobs"""
+        requested = self.max_workers or min(4, os.cpu_count() or 1)
+        return max(1, min(int(requested), job_count))
+
+    def _job_config(self, workers):
+        """Configuration handed to every job (PDF workers split between concurrent jobs)"""
+        config = copy.deepcopy(self.config)
+        options = config.setdefault("processing_options", {})
+        if not options.get("pdf_workers"):
+            options["pdf_workers"] = max(1, (os.cpu_count() or 1) // workers)
+        return config
+
+    def _log_file(self, index, job):
+        safe_name = re.sub(r'[^\w.-]+', '_', job.name).strip('_') or "job"
+        return self.log_dir / f"{index:03d}_{safe_name}.log"
+
+    def run(self, jobs, fail_fast=False, progress_callback=None):
+        """
+        Run all jobs and wait for them to finish
+
+        Args:
+            jobs: List of ProcessingJob
+            fail_fast: Cancel jobs that have not started once one job fails
+            progress_callback: Optional callable (completed, total, job, result) called as jobs finish
+
+        Returns:
+            list: One result dictionary per job, in job order (jobs cancelled by fail_fast
+                  have status 'cancelled')
+        """
+        if not jobs:
+            return []
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        workers = self._worker_count(len(jobs))
+        job_config = self._job_config(workers)
+        logging.info(f"Running {len(jobs)} jobs on {workers} worker process(es); "
+                     f"{job_config['processing_options']['pdf_workers']} PDF worker(s) per job; logs in {self.log_dir}")
+
+        results = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for index, job in enumerate(jobs):
+                log_file = self._log_file(index + 1, job)
+                future = executor.submit(_run_scheduled_job, job.to_dict(), job_config, self.mapping_data,
+                                         str(log_file), self.log_level, self.memory_sample_interval)
+                futures[future] = (index, job, log_file)
+
+            completed = 0
+            for future in as_completed(futures):
+                index, job, log_file = futures[future]
+                if future.cancelled():
+                    continue
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker died (e.g. out of memory) or the result could not be returned
+                    result = {'status': 'failed', 'output_file': None, 'poles': 0,
+                              'error': f"Worker error: {e}", 'log_file': str(log_file)}
+                result['name'] = job.name
+                results[index] = result
+                completed += 1
+                logging.info(f"[{completed}/{len(jobs)}] {job.name}: {result['status']}"
+                             + (f" ({result.get('wall_time', 0):.1f}s, peak {result.get('peak_rss_mb', 0)} MB)"
+                                if 'wall_time' in result else ""))
+                if progress_callback:
+                    progress_callback(completed, len(jobs), job, result)
+                if fail_fast and result['status'] != 'complete':
+                    for pending in futures:
+                        pending.cancel()
+
+        for index, job in enumerate(jobs):
+            if results[index] is None:
+                results[index] = {'name': job.name, 'status': 'cancelled', 'output_file': None, 'poles': 0,
+                                  'error': "Cancelled after an earlier job failed"}
+        return results
+
+    @staticmethod
+    def build_summary(jobs, results, total_wall_time):
+        """
+        Summary report of a batch run
+
+        Returns:
+            dict: totals and one entry per job (paths, status, poles, timings, memory, log file)
+        """
+        entries = []
+        for job, result in zip(jobs, results):
+            entry = {
+                'name': job.name,
+                'status': result['status'],
+                'poles': result.get('poles', 0),
+                'output_file': str(result['output_file']) if result.get('output_file') else None,
+                'error': result.get('error'),
+                'wall_time': result.get('wall_time'),
+                'cpu_time': result.get('cpu_time'),
+                'peak_rss_mb': result.get('peak_rss_mb'),
+                'log_file': result.get('log_file'),
+                'run_report': str(result['run_report']) if result.get('run_report') else None,
+                'inputs': job.to_dict()
+            }
+            entries.append(entry)
+        completed = [entry for entry in entries if entry['status'] == 'complete']
+        job_time = sum(entry['wall_time'] or 0 for entry in entries)
+        return {
+            'finished_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'jobs': len(entries),
+            'completed': len(completed),
+            'failed': len(entries) - len(completed),
+            'poles': sum(entry['poles'] for entry in completed),
+            'total_wall_time': round(total_wall_time, 3),
+            'sum_job_wall_time': round(job_time, 3),
+            'max_peak_rss_mb': max((entry['peak_rss_mb'] or 0 for entry in entries), default=0),
+            'results': entries
+        }
+
+    def write_summary(self, summary):
+        """Write the summary report as JSON into the log folder and return its path"""
+        summary_file = self.log_dir / f"batch_summary_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return summary_file
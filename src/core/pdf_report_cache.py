@@ -0,0 +1,207 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class PDFReportCache:
+    """Persistent per-folder cache of data extracted from analysis report PDFs"""
+
+    CACHE_FILE_NAME = ".pdf_report_cache.json"
+    # Bump when the extraction rules change so older cached results are discarded
+    CACHE_VERSION = 1
+    # Saves from jobs sharing the folder are serialized with a lock file; a lock older than
+    # LOCK_STALE_SECONDS is left over from a crashed process, and after LOCK_TIMEOUT_SECONDS
+    # the save goes ahead without the lock
+    LOCK_TIMEOUT_SECONDS = 5.0
+    LOCK_STALE_SECONDS = 30.0
+
+    def __init__(self, folder_path: Path):
+        self.folder_path = Path(folder_path)
+        self.cache_file = self.folder_path / self.CACHE_FILE_NAME
+        self.entries = {}  # file name -> {'size', 'mtime_ns', 'structure_type', 'loading'}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._stored = set()  # file names put() in this session; they win over the file on disk when saving
+        self._cleared = False
+        self._load()
+
+    def _read_entries(self, log_errors=True) -> Optional[Dict[str, dict]]:
+        """Entries in the cache file, or None if it is missing, unreadable or from another version"""
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            if log_errors:
+                logging.warning(f"Could not read PDF report cache {self.cache_file}: {e}")
+            return None
+        if data.get('version') != self.CACHE_VERSION:
+            if log_errors:
+                logging.info(f"Discarding PDF report cache {self.cache_file} (version {data.get('version')})")
+            return None
+        return data.get('entries', {})
+
+    def _load(self):
+        """Read the cache file, ignoring it if it is missing, unreadable or from another version"""
+        entries = self._read_entries()
+        if entries is None:
+            # Rewrite an outdated or damaged file on the next save
+            self._dirty = self.cache_file.exists()
+            return
+        self.entries = entries
+        logging.debug(f"Loaded {len(self.entries)} cached PDF reports from {self.cache_file}")
+
+    @staticmethod
+    def _fingerprint(pdf_path: Path) -> Optional[Dict[str, int]]:
+        """Get the size/mtime fingerprint of a report file, or None if it cannot be read"""
+        try:
+            stat = os.stat(pdf_path)
+        except OSError:
+            return None
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def get(self, pdf_path: Path) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get cached data for a report if the file is unchanged since it was extracted
+
+        Args:
+            pdf_path: Path to the PDF report
+
+        Returns:
+            Dictionary with 'structure_type' and 'loading', or None on a miss
+        """
+        entry = self.entries.get(Path(pdf_path).name)
+        fingerprint = self._fingerprint(pdf_path)
+        if entry and fingerprint and entry.get('size') == fingerprint['size'] and entry.get('mtime_ns') == fingerprint['mtime_ns']:
+            self.hits += 1
+            return {
+                'structure_type': entry.get('structure_type'),
+                'loading': entry.get('loading')
+            }
+        self.misses += 1
+        return None
+
+    def put(self, pdf_path: Path, data: Dict[str, Optional[str]]):
+        """Store extracted data for a report under its current fingerprint"""
+        fingerprint = self._fingerprint(pdf_path)
+        if fingerprint is None or data is None:
+            return
+        self.entries[Path(pdf_path).name] = {
+            **fingerprint,
+            'structure_type': data.get('structure_type'),
+            'loading': data.get('loading')
+        }
+        self._stored.add(Path(pdf_path).name)
+        self._dirty = True
+
+    def evict_stale(self) -> int:
+        """
+        Drop entries whose report was removed or changed since it was cached
+
+        Returns:
+            Number of entries removed
+        """
+        stale = []
+        for file_name, entry in self.entries.items():
+            fingerprint = self._fingerprint(self.folder_path / file_name)
+            if fingerprint is None or entry.get('size') != fingerprint['size'] or entry.get('mtime_ns') != fingerprint['mtime_ns']:
+                stale.append(file_name)
+        for file_name in stale:
+            del self.entries[file_name]
+        if stale:
+            self._dirty = True
+            logging.debug(f"Evicted {len(stale)} stale entries from {self.cache_file}")
+        return len(stale)
+
+    def clear(self):
+        """Forget every cached report (the file is rewritten on the next save)"""
+        self.entries = {}
+        self._stored.clear()
+        self._cleared = True
+        self._dirty = True
+
+    def _merge_disk_entries(self):
+        """
+        Fold in entries another process saved since this cache was loaded
+
+        Jobs running side by side can share a reports folder; without the merge the last job
+        to save would drop everything the others added. Entries stored in this session win.
+        """
+        if self._cleared:
+            return
+        disk_entries = self._read_entries(log_errors=False)
+        if not disk_entries:
+            return
+        merged = dict(self.entries)
+        merged.update(disk_entries)
+        merged.update({name: self.entries[name] for name in self._stored if name in self.entries})
+        self.entries = merged
+
+    @contextmanager
+    def _save_lock(self):
+        """Hold the folder's cache lock file while merging and replacing the cache"""
+        lock_file = self.cache_file.with_name(self.cache_file.name + ".lock")
+        deadline = time.monotonic() + self.LOCK_TIMEOUT_SECONDS
+        locked = False
+        while True:
+            try:
+                os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                locked = True
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_file).st_mtime > self.LOCK_STALE_SECONDS:
+                        os.unlink(lock_file)
+                        continue
+                except OSError:
+                    pass  # Released meanwhile, or a stale lock that cannot be removed; the deadline still applies
+                if time.monotonic() >= deadline:
+                    logging.debug(f"Saving {self.cache_file} without its lock (held by another job)")
+                    break
+                time.sleep(0.05)
+            except OSError:
+                # Folder is read-only or does not support the lock; the save reports its own error
+                break
+        try:
+            yield
+        finally:
+            if locked:
+                try:
+                    os.unlink(lock_file)
+                except OSError:
+                    pass
+
+    def save(self):
+        """Write the cache back to the reports folder if anything changed"""
+        if not self._dirty:
+            return
+        with self._save_lock():
+            self._merge_disk_entries()
+            self.evict_stale()
+            temp_file = None
+            try:
+                # A unique temp file per writer, so concurrent saves never write into the same file
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.folder_path,
+                                                 prefix=self.cache_file.name + ".", suffix=".tmp",
+                                                 delete=False) as f:
+                    temp_file = Path(f.name)
+                    json.dump({'version': self.CACHE_VERSION, 'entries': self.entries}, f)
+                os.replace(temp_file, self.cache_file)
+                self._dirty = False
+                self._cleared = False
+                logging.debug(f"Saved {len(self.entries)} cached PDF reports to {self.cache_file}")
+            except Exception as e:
+                # Read-only or network folders just run without a persistent cache
+                logging.warning(f"Could not write PDF report cache {self.cache_file}: {e}")
+                try:
+                    if temp_file is not None and temp_file.exists():
+                        temp_file.unlink()
+                except OSError:
+                    pass
@@ -1,21 +1,37 @@
+import fnmatch
 import logging
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Iterable, Optional, Tuple
 import PyPDF2
+from .pdf_report_cache import PDFReportCache
+from .utils import Utils
 try:
     import fitz  # PyMuPDF
 except ImportError:
     fitz = None  # PyMuPDF not available
 
 
+def _extract_report_file(pdf_path: str) -> Optional[Dict[str, str]]:
+    """Process-pool entry point: extract one report with the same logic as the serial path"""
+    return PDFReportReader()._extract_from_pdf(Path(pdf_path))
+
+
 class PDFReportReader:
     """Reads pole analysis PDF reports to extract structure type and loading data"""
     
-    def __init__(self, existing_reports_folder: str = "", proposed_reports_folder: str = "", ignore_keywords: list = None):
+    def __init__(self, existing_reports_folder: str = "", proposed_reports_folder: str = "", ignore_keywords: list = None,
+                 use_cache: bool = True):
         self.existing_reports_folder = Path(existing_reports_folder) if existing_reports_folder else None
         self.proposed_reports_folder = Path(proposed_reports_folder) if proposed_reports_folder else None
         self.ignore_keywords = ignore_keywords or []
+        self.use_cache = use_cache  # False bypasses the on-disk report cache entirely
+        self._pole_data_cache = {}  # pole number -> result of extract_pole_data / extract_all
+        self._folder_indexes = {}  # folder path -> filename index built by _get_folder_index
+        self._report_caches = {}  # folder path -> PDFReportCache
         
     def extract_pole_data(self, pole_number: int) -> Dict[str, Optional[str]]:
         """
@@ -27,31 +43,158 @@ class PDFReportReader:
         Returns:
             Dictionary with keys: 'structure_type', 'existing_load', 'proposed_load'
         """
-        result = {
-            'structure_type': None,
-            'existing_load': None,
-            'proposed_load': None
-        }
+        if pole_number in self._pole_data_cache:
+            return dict(self._pole_data_cache[pole_number])
         
         # Format pole number as 3-digit string (e.g., 1 -> "001")
         pole_str = f"{pole_number:03d}"
         
+        existing_data = None
+        proposed_data = None
+        
         # Extract from existing reports
         if self.existing_reports_folder and self.existing_reports_folder.exists():
             existing_data = self._extract_from_folder(self.existing_reports_folder, pole_str)
-            if existing_data:
-                result['structure_type'] = existing_data.get('structure_type')
-                result['existing_load'] = existing_data.get('loading')
         
         # Extract from proposed reports
         if self.proposed_reports_folder and self.proposed_reports_folder.exists():
             proposed_data = self._extract_from_folder(self.proposed_reports_folder, pole_str)
-            if proposed_data:
-                if not result['structure_type']:
-                    result['structure_type'] = proposed_data.get('structure_type')
-                result['proposed_load'] = proposed_data.get('loading')
+        
+        result = self._combine_pole_data(existing_data, proposed_data)
+        self._pole_data_cache[pole_number] = result
+        return dict(result)
+    
+    @staticmethod
+    def _combine_pole_data(existing_data: Optional[Dict[str, str]], proposed_data: Optional[Dict[str, str]]) -> Dict[str, Optional[str]]:
+        """Merge existing/proposed report data into the extract_pole_data result"""
+        result = {
+            'structure_type': None,
+            'existing_load': None,
+            'proposed_load': None
+        }
+        if existing_data:
+            result['structure_type'] = existing_data.get('structure_type')
+            result['existing_load'] = existing_data.get('loading')
+        if proposed_data:
+            if not result['structure_type']:
+                result['structure_type'] = proposed_data.get('structure_type')
+            result['proposed_load'] = proposed_data.get('loading')
         return result
     
+    def extract_all(self, pole_numbers: Iterable[int], max_workers: Optional[int] = None,
+                    progress_callback: Optional[Callable[[int, int], object]] = None) -> Dict[int, Dict[str, Optional[str]]]:
+        """
+        Extract data for many poles, fanning PDF text extraction out over a process pool
+        
+        Report files are located up front, each distinct PDF is parsed once in a worker
+        process, and results are combined exactly as extract_pole_data does. Results are
+        kept so later extract_pole_data calls for these poles do not touch the PDFs again.
+        
+        Args:
+            pole_numbers: Pole numbers to extract (e.g., [1, 2, 15])
+            max_workers: Worker process count (default: CPU count, capped at 8); 1 runs serially
+            progress_callback: Called as progress_callback(completed_reports, total_reports)
+            
+        Returns:
+            Dictionary of pole number -> {'structure_type', 'existing_load', 'proposed_load'}
+        """
+        pole_numbers = sorted({int(n) for n in pole_numbers if n is not None})
+        
+        # Locate the report files for every pole (cheap, filesystem only)
+        pole_files = {}
+        for pole_number in pole_numbers:
+            if pole_number in self._pole_data_cache:
+                continue
+            pole_str = f"{pole_number:03d}"
+            existing_file = None
+            proposed_file = None
+            if self.existing_reports_folder and self.existing_reports_folder.exists():
+                existing_file = self._find_report_file(self.existing_reports_folder, pole_str)
+            if self.proposed_reports_folder and self.proposed_reports_folder.exists():
+                proposed_file = self._find_report_file(self.proposed_reports_folder, pole_str)
+            pole_files[pole_number] = (existing_file, proposed_file)
+        
+        report_files = sorted({str(f) for files in pole_files.values() for f in files if f is not None})
+        
+        # Reports unchanged since an earlier run come straight from the on-disk cache
+        report_data = {}
+        for path in report_files:
+            cached = self._get_cached_report(Path(path))
+            if cached is not None:
+                report_data[path] = cached
+        cached_count = len(report_data)
+        report_files = [path for path in report_files if path not in report_data]
+        
+        total = len(report_files)
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
+        max_workers = max(1, min(int(max_workers), total or 1))
+        
+        logging.info(f"Extracting {total} PDF reports for {len(pole_files)} poles using {max_workers} worker(s)"
+                     f" ({cached_count} reused from cache)")
+        completed = 0
+        stopped = False
+        
+        def report_done(path, data):
+            # Returns False when the caller asked to stop
+            nonlocal completed
+            report_data[path] = data
+            self._store_cached_report(Path(path), data)
+            completed += 1
+            if progress_callback:
+                return progress_callback(completed, total) is not False
+            return True
+        
+        if max_workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {executor.submit(_extract_report_file, path): path for path in report_files}
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            logging.error(f"Error processing PDF {Path(path).name}: {e}")
+                            data = None
+                        if not report_done(path, data):
+                            stopped = True
+                            for pending in futures:
+                                pending.cancel()
+                            break
+            except Exception as e:
+                logging.warning(f"Parallel PDF extraction unavailable ({e}), continuing serially")
+        
+        # Serial path (single worker, or whatever the pool did not finish)
+        if not stopped:
+            for path in report_files:
+                if path in report_data:
+                    continue
+                try:
+                    data = self._extract_from_pdf(Path(path))
+                except Exception as e:
+                    logging.error(f"Error processing PDF {Path(path).name}: {e}")
+                    data = None
+                if not report_done(path, data):
+                    stopped = True
+                    break
+        
+        if stopped:
+            logging.info(f"PDF extraction stopped after {completed} of {total} reports")
+        
+        for pole_number, (existing_file, proposed_file) in pole_files.items():
+            files = [str(f) for f in (existing_file, proposed_file) if f is not None]
+            if any(f not in report_data for f in files):
+                continue  # Not extracted (stopped early); extract_pole_data will read it on demand
+            existing_data = report_data.get(str(existing_file)) if existing_file else None
+            proposed_data = report_data.get(str(proposed_file)) if proposed_file else None
+            self._pole_data_cache[pole_number] = self._combine_pole_data(existing_data, proposed_data)
+        
+        self.save_cache()
+        return {
+            pole_number: dict(self._pole_data_cache[pole_number])
+            for pole_number in pole_numbers if pole_number in self._pole_data_cache
+        }
+    
     def _extract_from_folder(self, folder_path: Path, pole_str: str) -> Optional[Dict[str, str]]:
         """
         Extract data from a specific folder for a given pole
@@ -63,38 +206,181 @@ class PDFReportReader:
         Returns:
             Dictionary with extracted data or None if no matching file found
         """
-        matching_files = []
+        pdf_file = self._find_report_file(folder_path, pole_str)
+        if pdf_file is None:
+            return None
         
-        # Try the newest pattern first: 300_590833786_EXISTING_Analysis Report.pdf
-        newest_pattern = f"{pole_str}_*.pdf"
-        matching_files = list(folder_path.glob(newest_pattern))
+        cached = self._get_cached_report(pdf_file)
+        if cached is not None:
+            return cached
         
-        # If no files found with newest pattern, try the new pattern: Pole_307 _590833849_PROPOSED_Analysis Report.pdf
-        if not matching_files:
-            new_pattern = f"Pole_{pole_str}_*.pdf"
-            matching_files = list(folder_path.glob(new_pattern))
+        try:
+            data = self._extract_from_pdf(pdf_file)
+        except Exception as e:
+            logging.error(f"Error processing PDF {pdf_file.name}: {e}")
+            return None
+        self._store_cached_report(pdf_file, data)
+        return data
+    
+    def _get_report_cache(self, folder_path: Path) -> Optional[PDFReportCache]:
+        """Get the on-disk cache for a reports folder (None when caching is bypassed)"""
+        if not self.use_cache:
+            return None
+        folder_key = str(folder_path)
+        if folder_key not in self._report_caches:
+            self._report_caches[folder_key] = PDFReportCache(folder_path)
+        return self._report_caches[folder_key]
+    
+    def _get_cached_report(self, pdf_path: Path) -> Optional[Dict[str, str]]:
+        """Get previously extracted data for an unchanged report file"""
+        cache = self._get_report_cache(pdf_path.parent)
+        return cache.get(pdf_path) if cache else None
+    
+    def _store_cached_report(self, pdf_path: Path, data: Optional[Dict[str, str]]):
+        """Remember extracted data for a report file (failed extractions are not cached)"""
+        cache = self._get_report_cache(pdf_path.parent)
+        if cache and data is not None:
+            cache.put(pdf_path, data)
+    
+    def save_cache(self):
+        """Write new cache entries back to the reports folders and drop stale ones"""
+        for cache in self._report_caches.values():
+            cache.save()
+            if cache.hits or cache.misses:
+                logging.info(f"PDF report cache {cache.folder_path}: {cache.hits} hits, {cache.misses} misses")
+    
+    def clear_cache(self):
+        """Discard all cached report data, in memory and on disk"""
+        self._pole_data_cache = {}
+        for folder_path in [self.existing_reports_folder, self.proposed_reports_folder]:
+            cache = self._get_report_cache(folder_path) if folder_path and folder_path.exists() else None
+            if cache:
+                cache.clear()
+        self.save_cache()
+    
+    def _find_report_file(self, folder_path: Path, pole_str: str) -> Optional[Path]:
+        """
+        Find the report PDF for a pole in a folder
         
-        # If no files found with new pattern, try the old pattern: Reports_Pole_001_*.pdf
-        if not matching_files:
-            old_pattern = f"Reports_Pole_{pole_str}_*.pdf"
-            matching_files = list(folder_path.glob(old_pattern))
+        Args:
+            folder_path: Path to the reports folder
+            pole_str: Pole number as 3-digit string (e.g., "001")
+            
+        Returns:
+            Path of the first matching PDF, or None if no matching file found
+        """
+        index = self._get_folder_index(folder_path)
         
-        # Try normalized pole search (handles cases like "056 PCO" -> "056")
-        if not matching_files:
-            matching_files = self._find_files_with_normalized_pole(folder_path, pole_str)
+        # Same order as before: 300_590833786_EXISTING_Analysis Report.pdf,
+        # Pole_307_590833849_PROPOSED_Analysis Report.pdf, Reports_Pole_001_*.pdf,
+        # then the normalized pole search (handles cases like "056 PCO" -> "056")
+        for key in ('by_prefix', 'by_pole_prefix', 'by_reports_prefix', 'by_normalized_pole'):
+            file_name = index[key].get(pole_str)
+            if file_name:
+                return folder_path / file_name
         
-        if not matching_files:
-            return None
+        return None
+    
+    def _get_folder_index(self, folder_path: Path) -> Dict[str, object]:
+        """Return the filename index for a reports folder, building it on first use"""
+        folder_key = str(folder_path)
+        if folder_key not in self._folder_indexes:
+            self._folder_indexes[folder_key] = self._build_folder_index(folder_path)
+        return self._folder_indexes[folder_key]
+    
+    def refresh_folder_indexes(self):
+        """Forget folder listings (e.g. after reports were added) so they are re-scanned on next use"""
+        self._folder_indexes = {}
+        self._pole_data_cache = {}
+    
+    def _build_folder_index(self, folder_path: Path) -> Dict[str, object]:
+        """
+        List a reports folder once and map pole numbers to report files for every naming convention
         
-        pdf_file = matching_files[0]
+        Conventions: '300_590833786_EXISTING_Analysis Report.pdf', '118 PCO_346094539_EXISTING.PDF',
+        'Pole_307_590833849_PROPOSED_Analysis Report.pdf' and 'Reports_Pole_001_*.pdf'.
+        Matching uses fnmatch (like Path.glob) and keeps directory order, so the first
+        file found for a pole is the same one the glob-based lookup returned.
         
+        Args:
+            folder_path: Path to the reports folder
+            
+        Returns:
+            Dictionary of lookup tables (pole string -> file name) plus the pattern file lists
+        """
+        index = {
+            'by_prefix': {},
+            'by_pole_prefix': {},
+            'by_reports_prefix': {},
+            'by_normalized_pole': {},
+            'pattern_files': []
+        }
         try:
-            return self._extract_from_pdf(pdf_file)
-        except Exception as e:
-            logging.error(f"Error processing PDF {pdf_file.name}: {e}")
-            return None
+            with os.scandir(folder_path) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        except OSError as e:
+            logging.warning(f"Could not list reports folder {folder_path}: {e}")
+            return index
+        
+        pdf_names = [name for name in names if fnmatch.fnmatch(name, "*.pdf")]
+        for name in pdf_names:
+            # NNN_*.pdf
+            if '_' in name:
+                index['by_prefix'].setdefault(name.split('_', 1)[0], name)
+            # Pole_NNN_*.pdf
+            if fnmatch.fnmatch(name, "Pole_*_*.pdf"):
+                index['by_pole_prefix'].setdefault(name[len("Pole_"):].split('_', 1)[0], name)
+            # Reports_Pole_NNN_*.pdf
+            if fnmatch.fnmatch(name, "Reports_Pole_*_*.pdf"):
+                index['by_reports_prefix'].setdefault(name[len("Reports_Pole_"):].split('_', 1)[0], name)
+        
+        # Files considered by the normalized search, in the order the three globs returned them
+        pattern_files = (
+            [name for name in pdf_names if fnmatch.fnmatch(name, "*_*_*.pdf")] +
+            [name for name in pdf_names if fnmatch.fnmatch(name, "Reports_Pole_*_*.pdf")] +
+            [name for name in pdf_names if fnmatch.fnmatch(name, "Pole_*_*.pdf")]
+        )
+        index['pattern_files'] = pattern_files
+        
+        ignore_keywords = self.ignore_keywords or ["PCO", "AT&T", "Foreign Pole", "Unknown", "Xcel"]
+        for name in pattern_files:
+            pole_part = self._extract_pole_part(name)
+            if not pole_part:
+                continue
+            # Normalize the pole part by removing ignore keywords
+            normalized_pole = Utils.normalize_scid_cached(pole_part, ignore_keywords)
+            try:
+                normalized_pole_3digit = f"{int(normalized_pole):03d}"
+            except (TypeError, ValueError):
+                logging.debug(f"Skipping report '{name}': pole part '{pole_part}' is not numeric")
+                continue
+            index['by_normalized_pole'].setdefault(normalized_pole_3digit, name)
+        
+        logging.debug(f"Indexed {len(pdf_names)} PDF reports in {folder_path}")
+        return index
     
-    def _extract_from_pdf(self, pdf_path: Path) -> Dict[str, str]:
+    @staticmethod
+    def _extract_pole_part(file_name: str) -> Optional[str]:
+        """Extract the raw pole part of a report file name (before normalization)"""
+        # Newest pattern: 300_590833786_EXISTING_Analysis Report.pdf
+        newest_match = re.search(r'^(\d{3})_', file_name)
+        if newest_match:
+            return newest_match.group(1)
+        # Pattern with space: 118 PCO_346094539_EXISTING.PDF
+        space_pattern_match = re.search(r'^(\d{3})\s+\w+_', file_name)
+        if space_pattern_match:
+            return space_pattern_match.group(1)
+        # Old pattern: Reports_Pole_056 PCO_...
+        old_match = re.search(r'Reports_Pole_([^_]+)_', file_name)
+        if old_match:
+            return old_match.group(1)
+        # New pattern: Pole_307 _590833849_PROPOSED_...
+        new_match = re.search(r'Pole_([^_\s]+)', file_name)
+        if new_match:
+            return new_match.group(1)
+        return None
+    
+    def _extract_from_pdf(self, pdf_path: Path) -> Optional[Dict[str, str]]:
         """
         Extract structure type and loading data from a PDF file
         
@@ -102,7 +388,8 @@ class PDFReportReader:
             pdf_path: Path to the PDF file
             
         Returns:
-            Dictionary with extracted data
+            Dictionary with extracted data, or None when the file could not be read (locked,
+            partly synced, damaged); failures are not cached, so the file is read again next run
         """
         result = {
             'structure_type': None,
@@ -111,10 +398,17 @@ class PDFReportReader:
         
         try:
             # Try PyMuPDF first (better text extraction)
-            text = self._extract_text_pymupdf(pdf_path)
-            if not text:
-                # Fallback to PyPDF2
-                text = self._extract_text_pypdf2(pdf_path)
+            try:
+                text, image_only = self._extract_first_page_text(pdf_path, raise_errors=True)
+            except Exception as e:
+                logging.debug(f"PyMuPDF extraction failed: {e}")
+                text, image_only = "", False
+            if image_only:
+                # Scanned report: no text layer, so PyPDF2 would find nothing either
+                logging.debug(f"PDF {pdf_path.name} has no text layer, skipping text extraction")
+            elif not text:
+                # Fallback to PyPDF2; if it cannot open the file either, the read failed
+                text = self._extract_text_pypdf2(pdf_path, raise_errors=True)
             
             if text:
                 result['structure_type'] = self._extract_structure_type(text)
@@ -122,28 +416,123 @@ class PDFReportReader:
             
         except Exception as e:
             logging.error(f"Error extracting text from PDF {pdf_path}: {e}")
+            return None
         
         return result
     
-    def _extract_text_pymupdf(self, pdf_path: Path) -> str:
-        """Extract text using PyMuPDF (fitz)"""
+    def _extract_first_page_text(self, pdf_path: Path, raise_errors: bool = False) -> Tuple[str, bool]:
+        """
+        Extract the first page's text with PyMuPDF
+        
+        Only page 0 is read (the Structure Type and Pole Capacity Utilization blocks are
+        always on it). A page that has no fonts is reported as image-only before any text
+        extraction is attempted, so the caller can skip the PyPDF2 fallback for it.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            raise_errors: Re-raise PyMuPDF errors instead of returning empty text
+            
+        Returns:
+            Tuple of (text, image_only); text is "" when PyMuPDF is unavailable or fails
+        """
         if fitz is None:
             logging.debug("PyMuPDF not available, skipping PyMuPDF extraction")
-            return ""
+            return "", False
         
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            if len(doc) > 0:
-                text = doc[0].get_text()
-            doc.close()
-            return text
+            with fitz.open(pdf_path) as doc:
+                if doc.page_count == 0:
+                    return "", False
+                page = doc.load_page(0)
+                if not page.get_fonts():
+                    # No font resources means the page cannot carry a text layer
+                    return "", bool(page.get_images())
+                return page.get_text("text"), False
         except Exception as e:
+            if raise_errors:
+                raise
             logging.debug(f"PyMuPDF extraction failed: {e}")
-            return ""
+            return "", False
+    
+    def _extract_text_pymupdf(self, pdf_path: Path) -> str:
+        """Extract text using PyMuPDF (fitz)"""
+        text, _ = self._extract_first_page_text(pdf_path)
+        return text
+    
+    def _extract_text_without_image_check(self, pdf_path: Path) -> str:
+        """
+        Previous extraction path, kept for benchmarking: the same first-page PyMuPDF text, but
+        any empty result (including an image-only scan) is parsed again with PyPDF2
+        """
+        text = ""
+        if fitz is not None:
+            try:
+                doc = fitz.open(pdf_path)
+                if len(doc) > 0:
+                    text = doc[0].get_text()
+                doc.close()
+            except Exception as e:
+                logging.debug(f"PyMuPDF extraction failed: {e}")
+        if not text:
+            text = self._extract_text_pypdf2(pdf_path)
+        return text
+    
+    def benchmark_extraction(self, pdf_paths: Iterable, repeat: int = 3) -> Dict[str, float]:
+        """
+        Time extraction with and without the image-only check
+        
+        Both paths read the same first-page text layer; the difference is that image-only scans
+        are no longer parsed a second time with PyPDF2, so the gain depends on how many of the
+        files are scans.
+        
+        Args:
+            pdf_paths: PDF files to extract (e.g. a sample of a reports folder)
+            repeat: Number of passes over the files for each path (best pass is kept)
+            
+        Returns:
+            Dictionary with 'files', 'previous_path_s', 'image_check_s', 'speedup' and
+            'mismatches' (files whose extracted structure type/loading differ)
+        """
+        pdf_paths = [Path(p) for p in pdf_paths]
+        
+        def best_time(extract):
+            best = None
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                for pdf_path in pdf_paths:
+                    extract(pdf_path)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            return best or 0.0
+        
+        def checked_text(pdf_path):
+            text, image_only = self._extract_first_page_text(pdf_path)
+            return text if text or image_only else self._extract_text_pypdf2(pdf_path)
+        
+        previous_time = best_time(self._extract_text_without_image_check)
+        checked_time = best_time(checked_text)
+        
+        mismatches = 0
+        for pdf_path in pdf_paths:
+            old_text = self._extract_text_without_image_check(pdf_path)
+            new_text = checked_text(pdf_path)
+            if (self._extract_structure_type(old_text), self._extract_loading(old_text)) != \
+                    (self._extract_structure_type(new_text), self._extract_loading(new_text)):
+                mismatches += 1
+        
+        results = {
+            'files': len(pdf_paths),
+            'previous_path_s': previous_time,
+            'image_check_s': checked_time,
+            'speedup': (previous_time / checked_time) if checked_time else 0.0,
+            'mismatches': mismatches
+        }
+        logging.info(f"PDF extraction benchmark on {len(pdf_paths)} files: previous path {previous_time:.3f}s, "
+                     f"with image-only check {checked_time:.3f}s ({results['speedup']:.1f}x), {mismatches} mismatches")
+        return results
     
-    def _extract_text_pypdf2(self, pdf_path: Path) -> str:
-        """Extract text using PyPDF2 (fallback)"""
+    def _extract_text_pypdf2(self, pdf_path: Path, raise_errors: bool = False) -> str:
+        """Extract text using PyPDF2 (fallback); raise_errors re-raises instead of returning """""
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -151,6 +540,8 @@ class PDFReportReader:
                     page = pdf_reader.pages[0]
                     return page.extract_text()
         except Exception as e:
+            if raise_errors:
+                raise
             logging.debug(f"PyPDF2 extraction failed: {e}")
         return ""
     
@@ -233,55 +624,9 @@ class PDFReportReader:
         Returns:
             List of matching PDF files
         """
-        from .utils import Utils
-        
-        # Use ignore keywords from instance variable
-        ignore_keywords = self.ignore_keywords
-        if not ignore_keywords:
-            # Default ignore keywords if not set
-            ignore_keywords = ["PCO", "AT&T", "Foreign Pole", "Unknown", "Xcel"]
-        
-        matching_files = []
-        
-        # Get all PDF files in the folder - check all patterns
-        newest_pattern_files = list(folder_path.glob("*_*_*.pdf"))  # 300_590833786_EXISTING_Analysis Report.pdf
-        old_pattern_files = list(folder_path.glob("Reports_Pole_*_*.pdf"))
-        new_pattern_files = list(folder_path.glob("Pole_*_*.pdf"))
-        all_pdf_files = newest_pattern_files + old_pattern_files + new_pattern_files
-        
-        for pdf_file in all_pdf_files:
-            pole_part = None
-            
-            # Try to extract pole part from newest pattern: 300_590833786_EXISTING_Analysis Report.pdf
-            newest_match = re.search(r'^(\d{3})_', pdf_file.name)
-            if newest_match:
-                pole_part = newest_match.group(1)
-            else:
-                # Try to extract pole part from pattern with space: 118 PCO_346094539_EXISTING.PDF
-                space_pattern_match = re.search(r'^(\d{3})\s+\w+_', pdf_file.name)
-                if space_pattern_match:
-                    pole_part = space_pattern_match.group(1)
-                else:
-                    # Try to extract pole part from old pattern: Reports_Pole_056 PCO_...
-                    old_match = re.search(r'Reports_Pole_([^_]+)_', pdf_file.name)
-                    if old_match:
-                        pole_part = old_match.group(1)
-                    else:
-                        # Try to extract pole part from new pattern: Pole_307 _590833849_PROPOSED_...
-                        new_match = re.search(r'Pole_([^_\s]+)', pdf_file.name)
-                        if new_match:
-                            pole_part = new_match.group(1)
-            
-            if pole_part:
-                # Normalize the pole part by removing ignore keywords
-                normalized_pole = Utils.normalize_scid(pole_part, ignore_keywords)
-                
-                # Check if normalized pole matches our target pole
-                normalized_pole_3digit = f"{int(normalized_pole):03d}"
-                if normalized_pole_3digit == pole_str:
-                    matching_files.append(pdf_file)
-        
-        return matching_files
+        index = self._get_folder_index(folder_path)
+        file_name = index['by_normalized_pole'].get(pole_str)
+        return [folder_path / file_name] if file_name else []
     
     def get_available_poles(self) -> set:
         """
@@ -294,35 +639,18 @@ class PDFReportReader:
         
         for folder_path in [self.existing_reports_folder, self.proposed_reports_folder]:
             if folder_path and folder_path.exists():
-                # Look for all PDF files matching all patterns
-                newest_pattern_files = list(folder_path.glob("*_*_*.pdf"))  # 300_590833786_EXISTING_Analysis Report.pdf
-                old_pattern_files = list(folder_path.glob("Reports_Pole_*_*.pdf"))
-                new_pattern_files = list(folder_path.glob("Pole_*_*.pdf"))
-                pdf_files = newest_pattern_files + old_pattern_files + new_pattern_files
-                
-                for pdf_file in pdf_files:
+                for file_name in self._get_folder_index(folder_path)['pattern_files']:
                     # Try to extract pole number from newest pattern first: 300_590833786_EXISTING_Analysis Report.pdf
-                    newest_match = re.search(r'^(\d{3})_', pdf_file.name)
-                    if newest_match:
-                        pole_num = int(newest_match.group(1))
-                        poles.add(pole_num)
-                    else:
-                        # Try to extract pole number from pattern with space: 118 PCO_346094539_EXISTING.PDF
-                        space_pattern_match = re.search(r'^(\d{3})\s+\w+_', pdf_file.name)
-                        if space_pattern_match:
-                            pole_num = int(space_pattern_match.group(1))
-                            poles.add(pole_num)
-                        else:
-                            # Try to extract pole number from old pattern
-                            old_match = re.search(r'Reports_Pole_(\d{3})_', pdf_file.name)
-                            if old_match:
-                                pole_num = int(old_match.group(1))
-                                poles.add(pole_num)
-                            else:
-                                # Try to extract pole number from new pattern
-                                new_match = re.search(r'Pole_(\d{3})', pdf_file.name)
-                                if new_match:
-                                    pole_num = int(new_match.group(1))
-                                    poles.add(pole_num)
+                    match = (
+                        re.search(r'^(\d{3})_', file_name) or
+                        # Pattern with space: 118 PCO_346094539_EXISTING.PDF
+                        re.search(r'^(\d{3})\s+\w+_', file_name) or
+                        # Old pattern
+                        re.search(r'Reports_Pole_(\d{3})_', file_name) or
+                        # New pattern
+                        re.search(r'Pole_(\d{3})', file_name)
+                    )
+                    if match:
+                        poles.add(int(match.group(1)))
         
         return poles
@@ -7,12 +7,21 @@ from openpyxl import load_workbook
 
 from .utils import Utils
 from .pdf_report_reader import PDFReportReader
+from .template_patch_writer import TemplatePatchWriter, TemplatePatchError
+from .template_schema import TemplateSchema
+from .template_session import TemplateSession
+from .qc_comparison import QCComparisonEngine
+from .run_profiler import RunProfiler
 
 
 class PoleDataProcessor:
     """Handles pole data processing and Excel output"""
     
-    def __init__(self, config, geocoder=None, mapping_data=None, attachment_reader=None, qc_reader=None, pdf_reader=None, alden_qc_reader=None):
+    # "height (provider)" entries in All_Comm_Heights
+    _COMM_HEIGHT_PROVIDER_PATTERN = re.compile(r"(\d+'\s*\d*\"?)\s*\(([^)]+)\)")
+    
+    def __init__(self, config, geocoder=None, mapping_data=None, attachment_reader=None, qc_reader=None, pdf_reader=None, alden_qc_reader=None,
+                 profiler=None):
         self.config = config
         self.geocoder = geocoder
         self.mapping_data = mapping_data or []
@@ -22,7 +31,15 @@ class PoleDataProcessor:
         self.alden_qc_reader = alden_qc_reader
         self.template_scids = None  # Will store SCIDs from template
         self.template_scids_by_sheet = {}  # Will store SCIDs from template organized by sheet
-    
+        self._connection_index = None  # Unordered SCID pair -> connection rows, built per process_data run
+        self._section_index = None  # connection_id -> section rows with precomputed POA heights
+        self._attachment_labels = None  # Per-row attachment classification, built once per run
+        self._attachment_labels_source = None
+        self._run_context = None  # Mapping/config-derived lookups shared by every output row of a run
+        self._template_schema = None  # Header/column lookups for the workbook being written
+        self.template_session = None  # Loaded template shared by read_template_scids and write_output
+        self.profiler = profiler or RunProfiler(enabled=False)  # Times the stages of process_data/write_output
+
     def _is_end_marker(self, value):
         """Check if a value represents an END marker in the template."""
         if value is None:
@@ -72,22 +89,14 @@ class PoleDataProcessor:
     def read_template_scids(self, template_file_path):
         """Read SCIDs from Pole and To Pole columns in all sheets of template file"""
         try:
-            import pandas as pd
-            from pathlib import Path
-            from openpyxl import load_workbook
-            
             template_path = Path(template_file_path)
             if not template_path.exists():
                 logging.error(f"Template file not found: {template_file_path}")
                 return None
             
-            # Load workbook to get all sheet names
-            if template_path.suffix.lower() == '.xlsm':
-                wb = load_workbook(template_file_path, keep_vba=True)
-            else:
-                wb = load_workbook(template_file_path)
-            
-            sheet_names = wb.sheetnames
+            # Open the template once; write_output reuses the same workbook
+            self.template_session = TemplateSession(template_path)
+            sheet_names = self.template_session.workbook.sheetnames
             
             # Dictionary to store connections per sheet
             self.template_scids_by_sheet = {}
@@ -96,10 +105,7 @@ class PoleDataProcessor:
             for sheet_name in sheet_names:
                 try:
                     logging.debug(f"Reading worksheet '{sheet_name}'")
-                    if template_path.suffix.lower() == '.xlsm':
-                        df = pd.read_excel(template_file_path, sheet_name=sheet_name, keep_vba=True)
-                    else:
-                        df = pd.read_excel(template_file_path, sheet_name=sheet_name)
+                    df = self.template_session.read_sheet_frame(sheet_name)
                     
                     # Look for Pole and To Pole columns with more flexible matching
                     pole_col = None
@@ -170,148 +176,117 @@ class PoleDataProcessor:
             logging.error(f"Error reading template SCIDs: {e}")
             return None
     
+    def prefetch_pdf_data(self, progress_callback=None):
+        """
+        Extract PDF report data for every template pole up front using the reader's process pool
+        
+        Later extract_pole_data calls for these poles are served from the reader's results.
+        
+        Args:
+            progress_callback: Called as progress_callback(completed_reports, total_reports)
+            
+        Returns:
+            dict: Pole number -> extracted PDF data (empty if there is no PDF reader or template)
+        """
+        if not self.pdf_reader or not hasattr(self.pdf_reader, 'extract_all'):
+            return {}
+        
+        template_rows = []
+        if self.template_scids_by_sheet:
+            for sheet_scids in self.template_scids_by_sheet.values():
+                template_rows.extend(sheet_scids)
+        elif self.template_scids:
+            template_rows = self.template_scids
+        
+        ignore_keywords = self.config.get('ignore_scid_keywords', [])
+        pole_numbers = set()
+        for pole_scid, _, _ in template_rows:
+            # Rows look up PDFs by the normalized SCID; template-only rows use the raw value
+            for scid in (Utils.normalize_scid_cached(pole_scid, ignore_keywords), pole_scid):
+                pole_number = self._extract_pole_number_from_scid(scid)
+                if pole_number:
+                    pole_numbers.add(pole_number)
+        
+        if not pole_numbers:
+            return {}
+        
+        max_workers = self.config.get('processing_options', {}).get('pdf_workers')
+        try:
+            return self.pdf_reader.extract_all(pole_numbers, max_workers=max_workers, progress_callback=progress_callback)
+        except Exception as e:
+            logging.error(f"Error prefetching PDF report data: {e}")
+            return {}
+    
     def _build_multi_sheet_template_rows(self, connections_df, mappings, sections_df):
         """Build rows based on all template SCIDs from all sheets"""
-        temp_rows = {}
-        
         # Collect all template connections from all sheets
         all_template_scids = []
         for sheet_name, sheet_scids in self.template_scids_by_sheet.items():
             all_template_scids.extend(sheet_scids)
         
-        # Create connection span map to ensure consistent span distances
-        connection_span_map = {}
-        for row_idx, conn in connections_df.iterrows():
-            n1, n2 = str(conn['node_id_1']).strip(), str(conn['node_id_2']).strip()
-            if n1 in mappings['node_id_to_scid'] and n2 in mappings['node_id_to_scid']:
-                scid1 = mappings['node_id_to_scid'][n1]
-                scid2 = mappings['node_id_to_scid'][n2]
-                connection_key = tuple(sorted([scid1, scid2]))
-                span_distance = conn.get('span_distance', '')
-                
-                if connection_key not in connection_span_map:
-                    connection_span_map[connection_key] = span_distance
-                    logging.debug(f"  Added to span map: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
-                else:
-                    existing_span = connection_span_map[connection_key]
-                    if existing_span != span_distance:
-                        logging.warning(f"  CONFLICT: {scid1}<->{scid2} already has span '{existing_span}', ignoring new span '{span_distance}' (row {row_idx})")
-                    else:
-                        logging.debug(f"  Duplicate: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
-        
-        for pole_scid, to_pole_scid, excel_row in all_template_scids:
-            # Normalize SCIDs using the same logic as the main processing
-            ignore_keywords = self.config.get('ignore_scid_keywords', [])
-            pole_scid_norm = Utils.normalize_scid(pole_scid, ignore_keywords)
-            to_pole_scid_norm = Utils.normalize_scid(to_pole_scid, ignore_keywords)
-            
-            # Find the connection data for this pair
-            conn_info = self._find_connection_data(pole_scid_norm, to_pole_scid_norm, connections_df, mappings, connection_span_map)
-            
-            if conn_info:
-                # Get pole node data
-                pole_node_data = mappings['scid_to_node'].get(pole_scid_norm)
-                if pole_node_data is not None:
-                    # Create the output row
-                    row_data = self._create_output_row(
-                        pole_scid_norm, to_pole_scid_norm, conn_info, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                    
-                    if row_data:
-                        # Validate that both Pole and To Pole SCIDs are valid before creating row
-                        if not pole_scid or not to_pole_scid or pole_scid.strip() == '' or to_pole_scid.strip() == '':
-                            logging.warning(f"Skipping template row creation: invalid Pole/To Pole values - Pole='{pole_scid}', To Pole='{to_pole_scid}'")
-                        else:
-                            # Use the original template SCIDs in the output
-                            row_data['Pole'] = pole_scid
-                            row_data['To Pole'] = to_pole_scid
-                            # Store the Excel row number for precise positioning
-                            row_data['_excel_row'] = excel_row
-                            temp_rows[pole_scid_norm] = row_data
-                            logging.debug(f"Created template-based row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
-                    else:
-                        logging.warning(f"Could not create row data for template connection {pole_scid} -> {to_pole_scid}")
-                else:
-                    logging.warning(f"Pole node data not found for template SCID: {pole_scid}")
-            else:
-                logging.warning(f"Connection data not found for template connection {pole_scid} -> {to_pole_scid}")
+        temp_rows = self._build_rows_for_template_scids(all_template_scids, connections_df, mappings, sections_df)
         
         logging.info(f"Created {len(temp_rows)} rows from {len(self.template_scids_by_sheet)} template sheets")
         return temp_rows
     
     def _build_template_based_rows(self, connections_df, mappings, sections_df):
         """Build rows based on template SCIDs instead of all connections"""
-        temp_rows = {}
-        
         logging.info(f"Processing {len(self.template_scids)} connections from template")
         
-        # Create connection span map to ensure consistent span distances
-        connection_span_map = {}
-        logging.debug("Creating connection span map for template processing...")
-        for row_idx, conn in connections_df.iterrows():
-            n1, n2 = str(conn['node_id_1']).strip(), str(conn['node_id_2']).strip()
-            if n1 in mappings['node_id_to_scid'] and n2 in mappings['node_id_to_scid']:
-                scid1 = mappings['node_id_to_scid'][n1]
-                scid2 = mappings['node_id_to_scid'][n2]
-                connection_key = tuple(sorted([scid1, scid2]))
-                span_distance = conn.get('span_distance', '')
-                
-                if connection_key not in connection_span_map:
-                    connection_span_map[connection_key] = span_distance
-                    logging.debug(f"  Added to span map: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
-                else:
-                    existing_span = connection_span_map[connection_key]
-                    if existing_span != span_distance:
-                        logging.warning(f"  CONFLICT: {scid1}<->{scid2} already has span '{existing_span}', ignoring new span '{span_distance}' (row {row_idx})")
-                    else:
-                        logging.debug(f"  Duplicate: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
+        temp_rows = self._build_rows_for_template_scids(self.template_scids, connections_df, mappings, sections_df)
+        
+        logging.info(f"Created {len(temp_rows)} rows from template connections")
+        return temp_rows
+    
+    def _build_rows_for_template_scids(self, template_scids, connections_df, mappings, sections_df):
+        """Build temp rows (keyed by normalized pole SCID) for template connections in one batch"""
+        temp_rows = {}
+        ignore_keywords = self.config.get('ignore_scid_keywords', [])
         
-        for pole_scid, to_pole_scid, excel_row in self.template_scids:
+        # Resolve every template connection first, then build all rows in one batch
+        pending = []
+        row_requests = []
+        for pole_scid, to_pole_scid, excel_row in template_scids:
             # Normalize SCIDs using the same logic as the main processing
-            ignore_keywords = self.config.get('ignore_scid_keywords', [])
-            pole_scid_norm = Utils.normalize_scid(pole_scid, ignore_keywords)
-            to_pole_scid_norm = Utils.normalize_scid(to_pole_scid, ignore_keywords)
+            pole_scid_norm = Utils.normalize_scid_cached(pole_scid, ignore_keywords)
+            to_pole_scid_norm = Utils.normalize_scid_cached(to_pole_scid, ignore_keywords)
             
             # Find the connection data for this pair
-            conn_info = self._find_connection_data(pole_scid_norm, to_pole_scid_norm, connections_df, mappings, connection_span_map)
+            conn_info = self._find_connection_data(pole_scid_norm, to_pole_scid_norm, connections_df, mappings)
             
             if conn_info:
                 # Get pole node data
                 pole_node_data = mappings['scid_to_node'].get(pole_scid_norm)
                 if pole_node_data is not None:
-                    # Create the output row
-                    row_data = self._create_output_row(
-                        pole_scid_norm, to_pole_scid_norm, conn_info, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                    
-                    if row_data:
-                        # Validate that both Pole and To Pole SCIDs are valid before creating row
-                        if not pole_scid or not to_pole_scid or pole_scid.strip() == '' or to_pole_scid.strip() == '':
-                            logging.warning(f"Skipping template row creation: invalid Pole/To Pole values - Pole='{pole_scid}', To Pole='{to_pole_scid}'")
-                        else:
-                            # Use the original template SCIDs in the output
-                            row_data['Pole'] = pole_scid
-                            row_data['To Pole'] = to_pole_scid
-                            # Store the Excel row number for precise positioning
-                            row_data['_excel_row'] = excel_row
-                            temp_rows[pole_scid_norm] = row_data
-                            logging.debug(f"Created template-based row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
-                    else:
-                        logging.warning(f"Could not create row data for template connection {pole_scid} -> {to_pole_scid}")
+                    pending.append((pole_scid, to_pole_scid, excel_row, pole_scid_norm))
+                    row_requests.append((pole_scid_norm, to_pole_scid_norm, conn_info, pole_node_data))
                 else:
                     logging.warning(f"Pole node data not found for template SCID: {pole_scid}")
             else:
                 logging.warning(f"Connection data not found for template connection {pole_scid} -> {to_pole_scid}")
         
-        logging.info(f"Created {len(temp_rows)} rows from template connections")
+        rows = self._create_output_rows(row_requests, mappings['scid_to_row'], sections_df)
+        
+        for (pole_scid, to_pole_scid, excel_row, pole_scid_norm), row_data in zip(pending, rows):
+            if row_data:
+                # Validate that both Pole and To Pole SCIDs are valid before creating row
+                if not pole_scid or not to_pole_scid or pole_scid.strip() == '' or to_pole_scid.strip() == '':
+                    logging.warning(f"Skipping template row creation: invalid Pole/To Pole values - Pole='{pole_scid}', To Pole='{to_pole_scid}'")
+                else:
+                    # Use the original template SCIDs in the output
+                    row_data['Pole'] = pole_scid
+                    row_data['To Pole'] = to_pole_scid
+                    # Store the Excel row number for precise positioning
+                    row_data['_excel_row'] = excel_row
+                    temp_rows[pole_scid_norm] = row_data
+                    logging.debug(f"Created template-based row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
+            else:
+                logging.warning(f"Could not create row data for template connection {pole_scid} -> {to_pole_scid}")
+        
         return temp_rows
     
     def _process_multi_sheet_template_connections(self, connections_df, mappings, sections_df):
         """Process connections from all sheets in template"""
-        result_data = []
-        
         # Collect all template connections from all sheets
         all_template_scids = []
         for sheet_name, sheet_scids in self.template_scids_by_sheet.items():
@@ -320,76 +295,31 @@ class PoleDataProcessor:
         
         logging.info(f"Processing {len(all_template_scids)} total template connections from {len(self.template_scids_by_sheet)} sheets")
         
-        for pole_scid, to_pole_scid, excel_row in all_template_scids:
-            # Normalize SCIDs using the same logic as the main processing
-            ignore_keywords = self.config.get('ignore_scid_keywords', [])
-            pole_scid_norm = Utils.normalize_scid(pole_scid, ignore_keywords)
-            to_pole_scid_norm = Utils.normalize_scid(to_pole_scid, ignore_keywords)
-            
-            logging.info(f"Processing template connection: {pole_scid} -> {to_pole_scid} (normalized: {pole_scid_norm} -> {to_pole_scid_norm})")
-            
-            # Check if To Pole is N/A or empty - treat as invalid connection
-            is_invalid_connection = (
-                not to_pole_scid or 
-                self._is_end_marker(to_pole_scid) or
-                to_pole_scid.upper() == "N/A" or 
-                to_pole_scid == "nan" or 
-                to_pole_scid.strip() == ""
-            )
-            
-            # Find the connection data for this pair (only if not invalid)
-            conn_info = None
-            if not is_invalid_connection:
-                conn_info = self._find_connection_data(pole_scid_norm, to_pole_scid_norm, connections_df, mappings)
-            
-            # Get pole node data
-            pole_node_data = mappings['scid_to_node'].get(pole_scid_norm)
-            if pole_node_data is not None:
-                if conn_info:
-                    # Create the output row with connection data
-                    row_data = self._create_output_row(
-                        pole_scid_norm, to_pole_scid_norm, conn_info, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                else:
-                    # Create the output row without connection data (pole-only data)
-                    if is_invalid_connection:
-                        logging.info(f"Invalid To Pole value '{to_pole_scid}' for {pole_scid}, creating pole-only row")
-                    else:
-                        logging.info(f"No valid connection found for {pole_scid} -> {to_pole_scid}, creating pole-only row")
-                    row_data = self._create_pole_only_row(
-                        pole_scid_norm, to_pole_scid_norm, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                
-                if row_data:
-                    # Use the original template SCIDs in the output
-                    row_data['Pole'] = pole_scid
-                    row_data['To Pole'] = to_pole_scid
-                    row_data = self._apply_end_marker(row_data)
-                    # Store the Excel row number for precise positioning
-                    row_data['_excel_row'] = excel_row
-                    result_data.append(row_data)
-                    logging.debug(f"Created template-based output row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
-                else:
-                    logging.warning(f"Could not create output row for template connection {pole_scid} -> {to_pole_scid}")
-            else:
-                logging.warning(f"Pole node data not found for template SCID: {pole_scid}")
+        result_data = self._process_connections_for_template_scids(all_template_scids, connections_df, mappings, sections_df)
         
         logging.info(f"Generated {len(result_data)} output rows from {len(self.template_scids_by_sheet)} template sheets")
         return result_data
     
     def _process_template_based_connections(self, connections_df, mappings, sections_df):
         """Process only the connections specified in the template"""
-        result_data = []
-        
         logging.info(f"Processing {len(self.template_scids)} template connections for output generation")
         
-        for pole_scid, to_pole_scid, excel_row in self.template_scids:
+        result_data = self._process_connections_for_template_scids(self.template_scids, connections_df, mappings, sections_df)
+        
+        logging.info(f"Generated {len(result_data)} output rows from template connections")
+        return result_data
+    
+    def _process_connections_for_template_scids(self, template_scids, connections_df, mappings, sections_df):
+        """Create output rows, in template order, for template connections (connection rows built in one batch)"""
+        ignore_keywords = self.config.get('ignore_scid_keywords', [])
+        
+        # Resolve every template connection first; rows with connection data are built in one batch
+        planned = []
+        row_requests = []
+        for pole_scid, to_pole_scid, excel_row in template_scids:
             # Normalize SCIDs using the same logic as the main processing
-            ignore_keywords = self.config.get('ignore_scid_keywords', [])
-            pole_scid_norm = Utils.normalize_scid(pole_scid, ignore_keywords)
-            to_pole_scid_norm = Utils.normalize_scid(to_pole_scid, ignore_keywords)
+            pole_scid_norm = Utils.normalize_scid_cached(pole_scid, ignore_keywords)
+            to_pole_scid_norm = Utils.normalize_scid_cached(to_pole_scid, ignore_keywords)
             
             logging.info(f"Processing template connection: {pole_scid} -> {to_pole_scid} (normalized: {pole_scid_norm} -> {to_pole_scid_norm})")
             
@@ -409,39 +339,48 @@ class PoleDataProcessor:
             
             # Get pole node data
             pole_node_data = mappings['scid_to_node'].get(pole_scid_norm)
-            if pole_node_data is not None:
-                if conn_info:
-                    # Create the output row with connection data
-                    row_data = self._create_output_row(
-                        pole_scid_norm, to_pole_scid_norm, conn_info, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                else:
-                    # Create the output row without connection data (pole-only data)
-                    if is_invalid_connection:
-                        logging.info(f"Invalid To Pole value '{to_pole_scid}' for {pole_scid}, creating pole-only row")
-                    else:
-                        logging.info(f"No valid connection found for {pole_scid} -> {to_pole_scid}, creating pole-only row")
-                    row_data = self._create_pole_only_row(
-                        pole_scid_norm, to_pole_scid_norm, 
-                        pole_node_data, mappings['scid_to_row'], sections_df
-                    )
-                
-                if row_data:
-                    # Use the original template SCIDs in the output
-                    row_data['Pole'] = pole_scid
-                    row_data['To Pole'] = to_pole_scid
-                    row_data = self._apply_end_marker(row_data)
-                    # Store the Excel row number for precise positioning
-                    row_data['_excel_row'] = excel_row
-                    result_data.append(row_data)
-                    logging.debug(f"Created template-based output row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
+            if pole_node_data is None:
+                logging.warning(f"Pole node data not found for template SCID: {pole_scid}")
+                continue
+            
+            request_index = None
+            if conn_info:
+                request_index = len(row_requests)
+                row_requests.append((pole_scid_norm, to_pole_scid_norm, conn_info, pole_node_data))
+            planned.append((pole_scid, to_pole_scid, excel_row, pole_scid_norm, to_pole_scid_norm,
+                            pole_node_data, is_invalid_connection, request_index))
+        
+        connection_rows = self._create_output_rows(row_requests, mappings['scid_to_row'], sections_df)
+        
+        result_data = []
+        for (pole_scid, to_pole_scid, excel_row, pole_scid_norm, to_pole_scid_norm,
+             pole_node_data, is_invalid_connection, request_index) in planned:
+            if request_index is not None:
+                # Output row with connection data
+                row_data = connection_rows[request_index]
+            else:
+                # Create the output row without connection data (pole-only data)
+                if is_invalid_connection:
+                    logging.info(f"Invalid To Pole value '{to_pole_scid}' for {pole_scid}, creating pole-only row")
                 else:
-                    logging.warning(f"Could not create output row for template connection {pole_scid} -> {to_pole_scid}")
+                    logging.info(f"No valid connection found for {pole_scid} -> {to_pole_scid}, creating pole-only row")
+                row_data = self._create_pole_only_row(
+                    pole_scid_norm, to_pole_scid_norm, 
+                    pole_node_data, mappings['scid_to_row'], sections_df
+                )
+            
+            if row_data:
+                # Use the original template SCIDs in the output
+                row_data['Pole'] = pole_scid
+                row_data['To Pole'] = to_pole_scid
+                row_data = self._apply_end_marker(row_data)
+                # Store the Excel row number for precise positioning
+                row_data['_excel_row'] = excel_row
+                result_data.append(row_data)
+                logging.debug(f"Created template-based output row for {pole_scid} -> {to_pole_scid} at Excel row {excel_row}")
             else:
-                logging.warning(f"Pole node data not found for template SCID: {pole_scid}")
+                logging.warning(f"Could not create output row for template connection {pole_scid} -> {to_pole_scid}")
         
-        logging.info(f"Generated {len(result_data)} output rows from template connections")
         return result_data
     
     def _create_pole_only_row(self, pole_scid, to_pole_scid, pole_node_data, scid_to_row, sections_df):
@@ -504,45 +443,104 @@ class PoleDataProcessor:
             logging.error(f"Error creating pole-only row for {pole_scid} -> {to_pole_scid}: {e}")
             return None
     
+    @staticmethod
+    def _connection_key(scid1, scid2):
+        """Unordered key for a pole pair so A->B and B->A resolve to the same connection"""
+        return frozenset((scid1, scid2))
+    
+    def _build_connection_index(self, connections_df, mappings):
+        """
+        Build an unordered-pair index of connections keyed by normalized SCIDs
+        
+        Each key maps to the list of connection rows (in sheet order) whose node ids
+        both resolve through mappings['node_id_to_scid']. The first row is what a
+        sequential scan would have matched, and its span distance is the one kept
+        when duplicate rows disagree.
+        
+        Args:
+            connections_df: DataFrame from the 'connections' sheet
+            mappings: Lookup mappings from _create_mappings (may be empty)
+            
+        Returns:
+            dict: {frozenset({scid1, scid2}): [conn_info, ...]}
+        """
+        connection_index = {}
+        if connections_df is None or connections_df.empty:
+            return connection_index
+        if 'node_id_1' not in connections_df.columns or 'node_id_2' not in connections_df.columns:
+            logging.warning("Connections data is missing node_id_1/node_id_2 columns - connection index is empty")
+            return connection_index
+        
+        node_id_to_scid = mappings.get('node_id_to_scid', {}) if isinstance(mappings, dict) else {}
+        if not node_id_to_scid:
+            return connection_index
+        
+        node1_ids = connections_df['node_id_1'].astype(str).str.strip()
+        node2_ids = connections_df['node_id_2'].astype(str).str.strip()
+        connection_ids = connections_df['connection_id'] if 'connection_id' in connections_df.columns else [''] * len(connections_df)
+        span_distances = connections_df['span_distance'] if 'span_distance' in connections_df.columns else [''] * len(connections_df)
+        
+        for row_idx, n1, n2, connection_id, span_distance in zip(
+            connections_df.index, node1_ids, node2_ids, connection_ids, span_distances
+        ):
+            if n1 not in node_id_to_scid or n2 not in node_id_to_scid:
+                continue
+            scid1 = node_id_to_scid[n1]
+            scid2 = node_id_to_scid[n2]
+            connection_key = self._connection_key(scid1, scid2)
+            conn_info = {
+                'connection_id': connection_id,
+                'span_distance': span_distance,
+                'node1_id': n1,
+                'node2_id': n2,
+                'original_scid1': scid1,
+                'original_scid2': scid2
+            }
+            
+            existing = connection_index.get(connection_key)
+            if existing is None:
+                connection_index[connection_key] = [conn_info]
+                logging.debug(f"  Added to connection index: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
+            else:
+                existing_span = existing[0]['span_distance']
+                if existing_span != span_distance:
+                    logging.warning(f"  CONFLICT: {scid1}<->{scid2} already has span '{existing_span}', ignoring new span '{span_distance}' (row {row_idx})")
+                else:
+                    logging.debug(f"  Duplicate: {scid1}<->{scid2} = '{span_distance}' (row {row_idx})")
+                existing.append(conn_info)
+        
+        logging.info(f"Connection index built with {len(connection_index)} unique connections from {len(connections_df)} rows")
+        return connection_index
+    
     def _find_connection_data(self, pole_scid, to_pole_scid, connections_df, mappings, connection_span_map=None):
         """Find connection data for a specific pole pair"""
         logging.debug(f"Looking for connection data: {pole_scid} <-> {to_pole_scid}")
         
-        # Look for connection in both directions
-        for row_idx, conn in connections_df.iterrows():
-            n1, n2 = str(conn['node_id_1']).strip(), str(conn['node_id_2']).strip()
-            if n1 in mappings['node_id_to_scid'] and n2 in mappings['node_id_to_scid']:
-                scid1 = mappings['node_id_to_scid'][n1]
-                scid2 = mappings['node_id_to_scid'][n2]
-                
-                # Check if this connection matches what we're looking for
-                if (scid1 == pole_scid and scid2 == to_pole_scid) or (scid1 == to_pole_scid and scid2 == pole_scid):
-                    # Use corrected span distance if available, otherwise use original
-                    connection_key = tuple(sorted([scid1, scid2]))
-                    if connection_span_map and connection_key in connection_span_map:
-                        span_distance = connection_span_map[connection_key]
-                        logging.debug(f"Using span distance from connection_span_map: {connection_key} = '{span_distance}'")
-                    else:
-                        span_distance = conn.get('span_distance', '')
-                        logging.debug(f"Using span distance from connection row: '{span_distance}'")
-                    
-                    conn_info = {
-                        'connection_id': conn.get('connection_id', ''),
-                        'span_distance': span_distance,
-                        'node1_id': n1,
-                        'node2_id': n2,
-                        'original_scid1': scid1,
-                        'original_scid2': scid2
-                    }
-                    logging.debug(f"✓ MATCH: {pole_scid} <-> {to_pole_scid} found in row {row_idx}: span_distance='{conn_info['span_distance']}', connection_id='{conn_info['connection_id']}', node_ids=({n1},{n2}), original_scids=({scid1},{scid2})")
-                    return conn_info
-                else:
-                    # Log potential matches for debugging common node issues
-                    if pole_scid in [scid1, scid2] or to_pole_scid in [scid1, scid2]:
-                        logging.debug(f"  Partial match in row {row_idx}: {scid1} <-> {scid2} (looking for {pole_scid} <-> {to_pole_scid})")
+        connection_index = self._connection_index
+        if connection_index is None:
+            # Called outside process_data - build a one-off index for this lookup
+            connection_index = self._build_connection_index(connections_df, mappings)
         
-        logging.debug(f"✗ NO MATCH: No connection data found for {pole_scid} <-> {to_pole_scid}")
-        return None
+        connection_key = self._connection_key(pole_scid, to_pole_scid)
+        matches = connection_index.get(connection_key)
+        if not matches:
+            logging.debug(f"✗ NO MATCH: No connection data found for {pole_scid} <-> {to_pole_scid}")
+            return None
+        
+        # First row in sheet order wins, matching the previous sequential scan
+        conn_info = dict(matches[0])
+        
+        # Use corrected span distance if available, otherwise use original
+        if connection_span_map:
+            scid1, scid2 = conn_info['original_scid1'], conn_info['original_scid2']
+            for span_key in (connection_key, (scid1, scid2), (scid2, scid1)):
+                if span_key in connection_span_map:
+                    conn_info['span_distance'] = connection_span_map[span_key]
+                    break
+            logging.debug(f"Using span distance from connection_span_map: {pole_scid}<->{to_pole_scid} = '{conn_info['span_distance']}'")
+        
+        logging.debug(f"✓ MATCH: {pole_scid} <-> {to_pole_scid}: span_distance='{conn_info['span_distance']}', connection_id='{conn_info['connection_id']}', node_ids=({conn_info['node1_id']},{conn_info['node2_id']}), original_scids=({conn_info['original_scid1']},{conn_info['original_scid2']})")
+        return conn_info
     
     def process_data(self, nodes_df, connections_df, sections_df, progress_callback=None, 
                     manual_routes=None, clear_existing_routes=False):
@@ -550,6 +548,13 @@ class PoleDataProcessor:
         if progress_callback:
             progress_callback(40, "Filtering pole data...")
         
+        # Lookup indexes are rebuilt for every run so they never outlive their source frames
+        self._connection_index = None
+        self._section_index = None
+        self._attachment_labels = None
+        self._attachment_labels_source = None
+        self._run_context = None
+        
         # Handle empty nodes_df - template-only processing
         if nodes_df.empty:
             logging.info("No nodes data available - processing template-only with PDF data")
@@ -557,12 +562,16 @@ class PoleDataProcessor:
                 total_connections = sum(len(scids) for scids in self.template_scids_by_sheet.values())
                 logging.info(f"Using multi-sheet template SCIDs for processing: {total_connections} total connections from {len(self.template_scids_by_sheet)} sheets")
                 # Process template-based connections without nodes data
-                result_data = self._process_template_only_connections(connections_df, sections_df)
+                with self.profiler.stage("row building") as stage:
+                    result_data = self._process_template_only_connections(connections_df, sections_df)
+                    stage['rows'] = len(result_data)
                 return result_data
             elif self.template_scids:
                 logging.info(f"Using template SCIDs for processing: {len(self.template_scids)} connections")
                 # Process template-based connections without nodes data
-                result_data = self._process_template_only_connections(connections_df, sections_df)
+                with self.profiler.stage("row building") as stage:
+                    result_data = self._process_template_only_connections(connections_df, sections_df)
+                    stage['rows'] = len(result_data)
                 return result_data
             else:
                 logging.warning("No template connections found and no nodes data - cannot process")
@@ -570,10 +579,9 @@ class PoleDataProcessor:
         
         # Single data source: No caching needed for alternative lookups
         
-        # Normalize SCIDs and filter nodes
-        nodes_df = nodes_df.copy()
+        # Normalize SCIDs (skipped if the caller already normalized this frame) and filter nodes
         ignore_keywords = self.config.get('ignore_scid_keywords', [])
-        nodes_df['scid'] = nodes_df['scid'].apply(lambda x: Utils.normalize_scid(x, ignore_keywords))
+        nodes_df = Utils.normalize_nodes_scids(nodes_df, ignore_keywords)
         nodes_df = nodes_df.drop_duplicates(subset='scid')
         
         # Sort nodes by SCID numerically
@@ -589,11 +597,15 @@ class PoleDataProcessor:
             # Try template-only processing if available
             if hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
                 logging.info("Falling back to multi-sheet template-only processing")
-                result_data = self._process_template_only_connections(connections_df, sections_df)
+                with self.profiler.stage("row building") as stage:
+                    result_data = self._process_template_only_connections(connections_df, sections_df)
+                    stage['rows'] = len(result_data)
                 return result_data
             elif self.template_scids:
                 logging.info("Falling back to template-only processing")
-                result_data = self._process_template_only_connections(connections_df, sections_df)
+                with self.profiler.stage("row building") as stage:
+                    result_data = self._process_template_only_connections(connections_df, sections_df)
+                    stage['rows'] = len(result_data)
                 return result_data
             else:
                 raise ValueError("No valid pole or reference data found")
@@ -603,32 +615,37 @@ class PoleDataProcessor:
         references_count = len(filtered[filtered['node_type'].str.strip().str.lower().eq('reference')])
         logging.info(f"Found {poles_count} valid poles and {references_count} valid references")
         
-        # Create mappings
-        mappings = self._create_mappings(nodes_df, filtered)
-        
         if progress_callback:
             if not progress_callback(50, "Building connections..."):
                 return []  # Stop processing if requested
         
-        # Build temp rows - use template SCIDs if available, otherwise use all connections
-        # Note: For multi-sheet templates, temp_rows are not used in the main processing path
-        if hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
-            # Multi-sheet template - build rows from all sheets
-            temp_rows = self._build_multi_sheet_template_rows(connections_df, mappings, sections_df)
-        elif self.template_scids:
-            temp_rows = self._build_template_based_rows(connections_df, mappings, sections_df)
-        else:
-            temp_rows = self._build_temp_rows(connections_df, mappings, manual_routes, clear_existing_routes)
-        
-        # If QC file is active, only keep poles mentioned in QC file
-        if self.qc_reader and self.qc_reader.is_active():
-            qc_scids = self.qc_reader.get_qc_scids()
-            original_count = len(temp_rows)
-            temp_rows = {scid: data for scid, data in temp_rows.items() if scid in qc_scids}
-            logging.info(f"QC filtering: reduced from {original_count} to {len(temp_rows)} poles (only QC SCIDs)")
+        with self.profiler.stage("connection processing", rows=len(connections_df)) as stage:
+            # Create mappings
+            mappings = self._create_mappings(nodes_df, filtered)
+            
+            # Index connections once so every template/QC lookup is a dict hit
+            self._connection_index = self._build_connection_index(connections_df, mappings)
             
-            if not temp_rows:
-                logging.warning("No poles found after QC filtering - check that QC SCIDs match pole SCIDs in data")
+            # Build temp rows - use template SCIDs if available, otherwise use all connections
+            # Note: For multi-sheet templates, temp_rows are not used in the main processing path
+            if hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
+                # Multi-sheet template - build rows from all sheets
+                temp_rows = self._build_multi_sheet_template_rows(connections_df, mappings, sections_df)
+            elif self.template_scids:
+                temp_rows = self._build_template_based_rows(connections_df, mappings, sections_df)
+            else:
+                temp_rows = self._build_temp_rows(connections_df, mappings, manual_routes, clear_existing_routes)
+            
+            # If QC file is active, only keep poles mentioned in QC file
+            if self.qc_reader and self.qc_reader.is_active():
+                qc_scids = self.qc_reader.get_qc_scids()
+                original_count = len(temp_rows)
+                temp_rows = {scid: data for scid, data in temp_rows.items() if scid in qc_scids}
+                logging.info(f"QC filtering: reduced from {original_count} to {len(temp_rows)} poles (only QC SCIDs)")
+                
+                if not temp_rows:
+                    logging.warning("No poles found after QC filtering - check that QC SCIDs match pole SCIDs in data")
+            stage['poles'] = len(temp_rows)
         
         if progress_callback:
             if not progress_callback(70, "Processing connections..."):
@@ -637,24 +654,26 @@ class PoleDataProcessor:
         # Process connections to generate output rows (one row per connection involving a pole)
         result_data = []
         
-        # If QC file is active, generate output based on QC connections only
-        if self.qc_reader and self.qc_reader.is_active():
-            logging.info("QC file is active - filtering output to QC connections only")
-            result_data = self._process_qc_filtered_connections(
-                connections_df, mappings, sections_df
-            )
-        elif hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
-            # Use multi-sheet template-based processing - process all template connections from all sheets
-            logging.info(f"Using multi-sheet template-based processing - processing {len(self.template_scids_by_sheet)} sheets")
-            result_data = self._process_multi_sheet_template_connections(connections_df, mappings, sections_df)
-        elif self.template_scids:
-            # Use single-sheet template-based processing - only process connections from template
-            logging.info("Using single-sheet template-based processing - processing only template connections")
-            result_data = self._process_template_based_connections(connections_df, mappings, sections_df)
-        else:
-            # No template connections found - cannot process without template
-            logging.error("No template connections found - cannot process without template file")
-            return []
+        with self.profiler.stage("row building") as stage:
+            # If QC file is active, generate output based on QC connections only
+            if self.qc_reader and self.qc_reader.is_active():
+                logging.info("QC file is active - filtering output to QC connections only")
+                result_data = self._process_qc_filtered_connections(
+                    connections_df, mappings, sections_df
+                )
+            elif hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
+                # Use multi-sheet template-based processing - process all template connections from all sheets
+                logging.info(f"Using multi-sheet template-based processing - processing {len(self.template_scids_by_sheet)} sheets")
+                result_data = self._process_multi_sheet_template_connections(connections_df, mappings, sections_df)
+            elif self.template_scids:
+                # Use single-sheet template-based processing - only process connections from template
+                logging.info("Using single-sheet template-based processing - processing only template connections")
+                result_data = self._process_template_based_connections(connections_df, mappings, sections_df)
+            else:
+                # No template connections found - cannot process without template
+                logging.error("No template connections found - cannot process without template file")
+                return []
+            stage['rows'] = len(result_data)
         
         # Filter results based on manual routes if specified
         if manual_routes:
@@ -718,6 +737,7 @@ class PoleDataProcessor:
         
         # Create empty mappings for template-only processing
         mappings = []
+        self._connection_index = self._build_connection_index(connections_df, mappings)
         
         for pole_scid, to_pole_scid, excel_row in template_scids_to_process:
             logging.debug(f"Processing template connection: {pole_scid} <-> {to_pole_scid}")
@@ -1233,276 +1253,361 @@ class PoleDataProcessor:
 
     def _create_output_row(self, pole_scid, to_pole_scid, conn_info, pole_node_data, scid_to_row, sections_df):
         """Create an output row for a connection involving a pole"""
-        try:
-            # Validate that both Pole and To Pole SCIDs are valid
-            if (not pole_scid or not to_pole_scid or 
-                pole_scid.strip() == '' or to_pole_scid.strip() == '' or 
-                self._is_end_marker(to_pole_scid)):
-                logging.warning(f"Skipping row creation: invalid Pole/To Pole values - Pole='{pole_scid}', To Pole='{to_pole_scid}'")
-                return None
-            
-            # Get pole data from the pole_scid (this should always be a pole, not a reference)
-            node = scid_to_row.get(pole_scid, pole_node_data)
-            
-            # Determine connection type by checking if to_pole_scid is a reference
-            to_pole_data = scid_to_row.get(to_pole_scid, {})
-            to_pole_type = str(to_pole_data.get('node_type', '')).strip().lower()
-            is_pole_to_reference = (to_pole_type == 'reference')
-            
-            logging.debug(f"Connection {pole_scid} -> {to_pole_scid}: to_pole_type='{to_pole_type}', is_pole_to_reference={is_pole_to_reference}")
-            
-            # Find section data for this connection
-            connection_id = conn_info.get('connection_id', '')
-            section = self._find_section(connection_id, sections_df, pole_scid, to_pole_scid)
-            logging.debug(f"Section lookup for {pole_scid} -> {to_pole_scid}: connection_id='{connection_id}', section found: {section is not None}")
-            
-            # Single data source: Only use section data from 'sections' sheet via connection_id
-            # No fallback mechanisms - if no section found, create empty section
-            
-            # Create empty section if none found
-            if section is None:
-                section = pd.Series()
-            
-            # Get mapped elements for processing
-            mapped_elements = self._get_mapped_elements()
-            
-            # Process attachments and midspan data - pass connection type info
-            result = self._process_attachments(node, section, mapped_elements, pole_scid, is_pole_to_reference)
-            
-            # Add basic connection information
-            result['Pole'] = pole_scid
-            result['To Pole'] = to_pole_scid
+        return self._create_output_rows([(pole_scid, to_pole_scid, conn_info, pole_node_data)], scid_to_row, sections_df)[0]
+    
+    def _create_output_rows(self, row_requests, scid_to_row, sections_df):
+        """
+        Create output rows for many connections in one pass
+        
+        Mapped elements and keyword sets come from the run context, sections for every pair
+        are resolved up front from the section index, and pole-level fields (address, PDF
+        data, guy info, notes, ...) are built once per pole and shared by all of its spans.
+        
+        Args:
+            row_requests: List of (pole_scid, to_pole_scid, conn_info, pole_node_data) tuples
+            scid_to_row: Normalized SCID -> node row mapping
+            sections_df: Sections sheet
             
-            # Get the initial span length and format it
-            initial_span_distance = conn_info.get('span_distance', '')
-            final_span_str = initial_span_distance
-
-            # Special debugging for connections involving poles 10, 11, 12
-            if any(pole in [pole_scid, to_pole_scid] for pole in ['10', '11', '12']):
-                logging.info(f"  SPAN ASSIGNMENT DEBUG: {pole_scid} -> {to_pole_scid}: initial_span='{initial_span_distance}', connection_id='{conn_info.get('connection_id', '')}'")
-
-            # If QC is active, apply tolerance to get the final span length
-            if self.qc_reader and self.qc_reader.is_active():
-                tolerance = self.config.get('processing_options', {}).get('span_length_tolerance', 3)
-                qc_span_str = self.qc_reader.get_qc_span_length(pole_scid, to_pole_scid)
-                final_span_str = self._apply_span_length_tolerance(initial_span_distance, qc_span_str, tolerance)
-                logging.info(f"Span tolerance applied for {pole_scid} -> {to_pole_scid}: "
-                             f"Excel='{initial_span_distance}', QC='{qc_span_str}', Final='{final_span_str}'")
+        Returns:
+            List with one output row dict (or None if the row could not be created) per request
+        """
+        context = self._get_run_context()
+        mapped_elements = context['mapped_elements']
+        pole_fields_cache = context['pole_fields']
+        
+        # Resolve every pair's section before building rows: (section or None, lookup failed)
+        sections = []
+        for pole_scid, to_pole_scid, conn_info, _ in row_requests:
+            section, failed = None, False
+            if self._is_valid_row_pair(pole_scid, to_pole_scid):
+                try:
+                    section = self._find_section(conn_info.get('connection_id', ''), sections_df, pole_scid, to_pole_scid)
+                except Exception as e:
+                    # Same handling as any other row error: log it and skip the row
+                    logging.error(f"Error creating output row for {pole_scid} -> {to_pole_scid}: {e}")
+                    failed = True
+            sections.append((section, failed))
+        
+        rows = []
+        for (pole_scid, to_pole_scid, conn_info, pole_node_data), (section, section_failed) in zip(row_requests, sections):
+            try:
+                # Validate that both Pole and To Pole SCIDs are valid
+                if not self._is_valid_row_pair(pole_scid, to_pole_scid):
+                    logging.warning(f"Skipping row creation: invalid Pole/To Pole values - Pole='{pole_scid}', To Pole='{to_pole_scid}'")
+                    rows.append(None)
+                    continue
+                
+                if section_failed:
+                    rows.append(None)
+                    continue
+                
+                # Get pole data from the pole_scid (this should always be a pole, not a reference)
+                node = scid_to_row.get(pole_scid, pole_node_data)
+                
+                # Determine connection type by checking if to_pole_scid is a reference
+                to_pole_data = scid_to_row.get(to_pole_scid, {})
+                to_pole_type = str(to_pole_data.get('node_type', '')).strip().lower()
+                is_pole_to_reference = (to_pole_type == 'reference')
+                
+                logging.debug(f"Connection {pole_scid} -> {to_pole_scid}: to_pole_type='{to_pole_type}', is_pole_to_reference={is_pole_to_reference}")
+                logging.debug(f"Section lookup for {pole_scid} -> {to_pole_scid}: connection_id='{conn_info.get('connection_id', '')}', section found: {section is not None}")
+                
+                # Single data source: Only use section data from 'sections' sheet via connection_id
+                # No fallback mechanisms - if no section found, create empty section
+                if section is None:
+                    section = pd.Series()
+                
+                # Process attachments and midspan data - pass connection type info
+                result = self._process_attachments(node, section, mapped_elements, pole_scid, is_pole_to_reference)
+                
+                # Add basic connection information
+                result['Pole'] = pole_scid
+                result['To Pole'] = to_pole_scid
+                
+                # Get the initial span length and format it
+                initial_span_distance = conn_info.get('span_distance', '')
+                final_span_str = initial_span_distance
                 
                 # Special debugging for connections involving poles 10, 11, 12
                 if any(pole in [pole_scid, to_pole_scid] for pole in ['10', '11', '12']):
-                    logging.info(f"  QC SPAN DEBUG: {pole_scid} -> {to_pole_scid}: QC_span='{qc_span_str}', final_span='{final_span_str}'")
-
-            result['Span Length'] = self._format_span_distance(final_span_str)
-            
-            # Final span length assignment logging for debugging
-            if any(pole in [pole_scid, to_pole_scid] for pole in ['10', '11', '12']):
-                logging.info(f"  FINAL SPAN ASSIGNMENT: {pole_scid} -> {to_pole_scid}: result['Span Length']='{result['Span Length']}'")
-            
-            # Span length parsing (tension calculation removed)
-            span_length_for_tension = self._parse_span_length(final_span_str)
-
-            # Add pole information
-            result['Address'] = self._get_pole_address(node)
-            result['Pole Height/Class'] = self._format_pole_height_class(node)
-            result['Existing Risers'] = self._count_existing_risers(node, pole_scid)
-            
-            # Add coordinates if available
-            if node and 'latitude' in node:
-                result['Latitude'] = Utils.round_coordinate(node['latitude'])
-            if node and 'longitude' in node:
-                result['Longitude'] = Utils.round_coordinate(node['longitude'])
-            
-            # Add pole tag from 'pole_tag_tagtext' column in nodes sheet
-            if node and 'pole_tag_tagtext' in node:
-                result['Pole Tag'] = node['pole_tag_tagtext']
-            else:
-                result['Pole Tag'] = ''  # Leave blank if not found
-            
-            # Add PDF report data (Structure Type, Existing Load, Proposed Load)
-            if self.pdf_reader:
-                try:
-                    pole_number = self._extract_pole_number_from_scid(pole_scid)
-                    if pole_number:
-                        pdf_data = self.pdf_reader.extract_pole_data(pole_number)
-                        result['Structure Type'] = Utils.clean_structure_type(pdf_data.get('structure_type', ''))
-                        result['Existing Load'] = pdf_data.get('existing_load', '')
-                        result['Proposed Load'] = pdf_data.get('proposed_load', '')
-                    else:
-                        result['Structure Type'] = ''
-                        result['Existing Load'] = ''
-                        result['Proposed Load'] = ''
-                except Exception as e:
-                    logging.error(f"Error extracting PDF data for {pole_scid}: {e}")
-                    result['Structure Type'] = ''
-                    result['Existing Load'] = ''
-                    result['Proposed Load'] = ''
-            else:
-                result['Structure Type'] = ''
-                result['Existing Load'] = ''
-                result['Proposed Load'] = ''
-            
-            # Add guy information - use same priority order as Notes field
-            guy_note = ''
-            if node:
-                # Use mr_note only
-                mr_note = node.get('mr_note', '')
-                guy_note = str(mr_note) if pd.notna(mr_note) else ''
-
-            guy_info = self._extract_guy_info(guy_note)
-            result['Guy Info'] = guy_info
-            
-            # Add Map field (can be customized based on requirements)
-            result['Map'] = ''  # Empty for now, can be populated based on business logic
-            
-            # Add Line No. (will be set during output writing)
-            result['Line No.'] = ''
-            
-            # Extract individual telecom provider heights from All_Comm_Heights
-            all_comm_heights = result.get('All_Comm_Heights', '')
-            
-            # Initialize telecom provider fields - preserve existing values from attachment processing
-            if 'Proposed MetroNet' not in result:
-                result['Proposed MetroNet'] = ''
-            if 'Verizon' not in result:
-                result['Verizon'] = ''
-            if 'AT&T' not in result:
-                result['AT&T'] = ''
-            if 'Comcast' not in result:
-                result['Comcast'] = ''
-            if 'Zayo' not in result:
-                result['Zayo'] = ''
-            if 'Jackson ISD' not in result:
-                result['Jackson ISD'] = ''
-            
-            # Parse individual heights from All_Comm_Heights - only if not already populated
-            # Skip provider-specific parsing for pole-to-reference connections
-            if all_comm_heights and not is_pole_to_reference:
-                import re
-                # Pattern to match "height (provider)" format
-                height_pattern = r"(\d+'\s*\d*\"?)\s*\(([^)]+)\)"
-                matches = re.findall(height_pattern, all_comm_heights)
+                    logging.info(f"  SPAN ASSIGNMENT DEBUG: {pole_scid} -> {to_pole_scid}: initial_span='{initial_span_distance}', connection_id='{conn_info.get('connection_id', '')}'")
                 
-                for height, provider in matches:
-                    # Clean up height formatting - ensure proper format
-                    height = height.strip()
-                    # Apply output formatting based on configuration
-                    height = self._format_height_for_output(height)
+                # If QC is active, apply tolerance to get the final span length
+                if self.qc_reader and self.qc_reader.is_active():
+                    tolerance = self.config.get('processing_options', {}).get('span_length_tolerance', 3)
+                    qc_span_str = self.qc_reader.get_qc_span_length(pole_scid, to_pole_scid)
+                    final_span_str = self._apply_span_length_tolerance(initial_span_distance, qc_span_str, tolerance)
+                    logging.info(f"Span tolerance applied for {pole_scid} -> {to_pole_scid}: "
+                                 f"Excel='{initial_span_distance}', QC='{qc_span_str}', Final='{final_span_str}'")
                     
-                    provider = provider.strip()
-                    if 'MetroNet' in provider and not result['Proposed MetroNet']:
-                        result['Proposed MetroNet'] = height
-                    elif 'Verizon' in provider and not result['Verizon']:
-                        result['Verizon'] = height
-                    elif 'AT&T' in provider and not result['AT&T']:
-                        result['AT&T'] = height
-                    elif 'Comcast' in provider and not result['Comcast']:
-                        result['Comcast'] = height
-                    elif 'Zayo' in provider and not result['Zayo']:
-                        result['Zayo'] = height
-                    elif 'Jackson' in provider and not result['Jackson ISD']:
-                        result['Jackson ISD'] = height
-            elif all_comm_heights and is_pole_to_reference:
-                # For pole-to-reference connections, skip provider-specific field population
-                logging.debug(f"Skipping provider-specific field parsing for pole-to-reference connection (SCID {pole_scid})")
-            
-            # Tension calculation functionality has been removed
-            result['Cable Type 1'] = ''
-            result['Cable Diameter 1'] = ''
-            result['Cable Type 2'] = ''
-            result['Cable Diameter 2'] = ''
-            result['Total Bundle Diameter'] = ''
-            
-            # Add guy fields from guy_info
-            if guy_info and (guy_info['leads'] or guy_info['directions']):
-                result['Guy Size'] = ', '.join(guy_info['sizes']) if guy_info['sizes'] else ''
-                result['Guy Lead'] = ', '.join(guy_info['leads']) if guy_info['leads'] else ''
-                result['Guy Direction'] = ', '.join(guy_info['directions']) if guy_info['directions'] else ''
-            else:
-                result['Guy Size'] = ''
-                result['Guy Lead'] = ''
-                result['Guy Direction'] = ''
-            
-            # Add notes field - check multiple possible note fields
-            notes = ''
-            if node:
-                # Use mr_note only
-                mr_note = node.get('mr_note', '')
-                notes = str(mr_note) if pd.notna(mr_note) else ''
+                    # Special debugging for connections involving poles 10, 11, 12
+                    if any(pole in [pole_scid, to_pole_scid] for pole in ['10', '11', '12']):
+                        logging.info(f"  QC SPAN DEBUG: {pole_scid} -> {to_pole_scid}: QC_span='{qc_span_str}', final_span='{final_span_str}'")
+                
+                result['Span Length'] = self._format_span_distance(final_span_str)
+                
+                # Final span length assignment logging for debugging
+                if any(pole in [pole_scid, to_pole_scid] for pole in ['10', '11', '12']):
+                    logging.info(f"  FINAL SPAN ASSIGNMENT: {pole_scid} -> {to_pole_scid}: result['Span Length']='{result['Span Length']}'")
+                
+                # Pole-level fields are the same for every span from this pole
+                cached = pole_fields_cache.get(pole_scid)
+                if cached is None or cached[0] is not node:
+                    cached = (node, self._build_pole_level_fields(node, pole_scid))
+                    pole_fields_cache[pole_scid] = cached
+                pole_fields = cached[1]
+                
+                # Address, height/class, risers, coordinates, pole tag and PDF report data
+                result.update(pole_fields['pole'])
+                
+                guy_info = pole_fields['guy_info']
+                result['Guy Info'] = {key: list(values) for key, values in guy_info.items()}
+                
+                # Add Map field (can be customized based on requirements)
+                result['Map'] = ''  # Empty for now, can be populated based on business logic
+                
+                # Add Line No. (will be set during output writing)
+                result['Line No.'] = ''
+                
+                self._apply_comm_provider_heights(result, pole_scid, is_pole_to_reference)
+                
+                # Tension calculation functionality has been removed
+                result['Cable Type 1'] = ''
+                result['Cable Diameter 1'] = ''
+                result['Cable Type 2'] = ''
+                result['Cable Diameter 2'] = ''
+                result['Total Bundle Diameter'] = ''
+                
+                # Guy fields, notes and New Guy Required
+                result.update(pole_fields['notes'])
+                
+                rows.append(result)
+                
+            except Exception as e:
+                logging.error(f"Error creating output row for {pole_scid} -> {to_pole_scid}: {e}")
+                rows.append(None)
+        
+        return rows
+    
+    def _is_valid_row_pair(self, pole_scid, to_pole_scid):
+        """Check that a Pole/To Pole pair can produce an output row"""
+        return not (not pole_scid or not to_pole_scid or
+                    pole_scid.strip() == '' or to_pole_scid.strip() == '' or
+                    self._is_end_marker(to_pole_scid))
+    
+    def _build_pole_level_fields(self, node, pole_scid):
+        """Build the output fields that depend only on the pole, not on the span"""
+        pole = {}
+        pole['Address'] = self._get_pole_address(node)
+        pole['Pole Height/Class'] = self._format_pole_height_class(node)
+        pole['Existing Risers'] = self._count_existing_risers(node, pole_scid)
+        
+        # Add coordinates if available
+        if node and 'latitude' in node:
+            pole['Latitude'] = Utils.round_coordinate(node['latitude'])
+        if node and 'longitude' in node:
+            pole['Longitude'] = Utils.round_coordinate(node['longitude'])
+        
+        # Add pole tag from 'pole_tag_tagtext' column in nodes sheet
+        if node and 'pole_tag_tagtext' in node:
+            pole['Pole Tag'] = node['pole_tag_tagtext']
+        else:
+            pole['Pole Tag'] = ''  # Leave blank if not found
+        
+        # Add PDF report data (Structure Type, Existing Load, Proposed Load)
+        pole['Structure Type'] = ''
+        pole['Existing Load'] = ''
+        pole['Proposed Load'] = ''
+        if self.pdf_reader:
+            try:
+                pole_number = self._extract_pole_number_from_scid(pole_scid)
+                if pole_number:
+                    pdf_data = self.pdf_reader.extract_pole_data(pole_number)
+                    pole['Structure Type'] = Utils.clean_structure_type(pdf_data.get('structure_type', ''))
+                    pole['Existing Load'] = pdf_data.get('existing_load', '')
+                    pole['Proposed Load'] = pdf_data.get('proposed_load', '')
+            except Exception as e:
+                logging.error(f"Error extracting PDF data for {pole_scid}: {e}")
+                pole['Structure Type'] = ''
+                pole['Existing Load'] = ''
+                pole['Proposed Load'] = ''
+        
+        # Guy information and notes both come from mr_note only
+        notes = ''
+        if node:
+            mr_note = node.get('mr_note', '')
+            notes = str(mr_note) if pd.notna(mr_note) else ''
+        guy_info = self._extract_guy_info(notes)
+        
+        note_fields = {}
+        if guy_info and (guy_info['leads'] or guy_info['directions']):
+            note_fields['Guy Size'] = ', '.join(guy_info['sizes']) if guy_info['sizes'] else ''
+            note_fields['Guy Lead'] = ', '.join(guy_info['leads']) if guy_info['leads'] else ''
+            note_fields['Guy Direction'] = ', '.join(guy_info['directions']) if guy_info['directions'] else ''
+        else:
+            note_fields['Guy Size'] = ''
+            note_fields['Guy Lead'] = ''
+            note_fields['Guy Direction'] = ''
+        note_fields['Notes'] = notes
+        
+        # Add New Guy Required field based on MR Notes
+        note_fields['Guy Needed'] = self._determine_new_guy_required(notes)
+        
+        return {'pole': pole, 'guy_info': guy_info, 'notes': note_fields}
+    
+    def _apply_comm_provider_heights(self, result, pole_scid, is_pole_to_reference):
+        """Fill the individual telecom provider columns from All_Comm_Heights"""
+        # Extract individual telecom provider heights from All_Comm_Heights
+        all_comm_heights = result.get('All_Comm_Heights', '')
+        
+        # Initialize telecom provider fields - preserve existing values from attachment processing
+        for provider_field in ('Proposed MetroNet', 'Verizon', 'AT&T', 'Comcast', 'Zayo', 'Jackson ISD'):
+            if provider_field not in result:
+                result[provider_field] = ''
+        
+        # Parse individual heights from All_Comm_Heights - only if not already populated
+        # Skip provider-specific parsing for pole-to-reference connections
+        if all_comm_heights and not is_pole_to_reference:
+            # Pattern to match "height (provider)" format
+            matches = self._COMM_HEIGHT_PROVIDER_PATTERN.findall(all_comm_heights)
+            
+            for height, provider in matches:
+                # Clean up height formatting - ensure proper format
+                height = height.strip()
+                # Apply output formatting based on configuration
+                height = self._format_height_for_output(height)
+                
+                provider = provider.strip()
+                if 'MetroNet' in provider and not result['Proposed MetroNet']:
+                    result['Proposed MetroNet'] = height
+                elif 'Verizon' in provider and not result['Verizon']:
+                    result['Verizon'] = height
+                elif 'AT&T' in provider and not result['AT&T']:
+                    result['AT&T'] = height
+                elif 'Comcast' in provider and not result['Comcast']:
+                    result['Comcast'] = height
+                elif 'Zayo' in provider and not result['Zayo']:
+                    result['Zayo'] = height
+                elif 'Jackson' in provider and not result['Jackson ISD']:
+                    result['Jackson ISD'] = height
+        elif all_comm_heights and is_pole_to_reference:
+            # For pole-to-reference connections, skip provider-specific field population
+            logging.debug(f"Skipping provider-specific field parsing for pole-to-reference connection (SCID {pole_scid})")
 
-            result['Notes'] = notes
-            
-            # Add New Guy Required field based on MR Notes
-            result['Guy Needed'] = self._determine_new_guy_required(notes)
-            
-            return result
+    def _build_section_index(self, sections_df):
+        """
+        Precompute section lookups so _find_section is a dict hit per output row
+        
+        Groups section rows by connection_id (and by connection_id plus the pole/to-pole
+        columns when the sheet has them) and parses every POA_*HT column once to get
+        the lowest attachment height of each section row.
+        
+        Args:
+            sections_df: DataFrame from the 'sections' sheet
             
-        except Exception as e:
-            logging.error(f"Error creating output row for {pole_scid} -> {to_pole_scid}: {e}")
-            return None
-
+        Returns:
+            dict: Index with group positions, per-row minimum heights and source frame
+        """
+        section_index = {
+            'source': sections_df,
+            'by_connection': {},
+            'by_pair': {},
+            'pole_cols': [],
+            'to_pole_cols': [],
+            'min_heights': [],
+            'has_heights': False
+        }
+        if sections_df is None or sections_df.empty:
+            return section_index
+        if 'connection_id' not in sections_df.columns:
+            logging.warning("Sections data has no connection_id column - section lookups will be empty")
+            return section_index
+        
+        pole_cols = [col for col in sections_df.columns if col.lower() in ['pole', 'from_pole', 'pole_scid', 'from_scid']]
+        to_pole_cols = [col for col in sections_df.columns if col.lower() in ['to_pole', 'to_scid']]
+        section_index['pole_cols'] = pole_cols
+        section_index['to_pole_cols'] = to_pole_cols
+        
+        # Positional row lists per connection_id, in sheet order
+        grouped = sections_df.groupby('connection_id', sort=False, dropna=False).indices
+        section_index['by_connection'] = {key: list(positions) for key, positions in grouped.items()}
+        
+        if pole_cols or to_pole_cols:
+            pair_cols = ['connection_id'] + pole_cols + to_pole_cols
+            grouped = sections_df.groupby(pair_cols, sort=False, dropna=False).indices
+            section_index['by_pair'] = {key: list(positions) for key, positions in grouped.items()}
+        
+        # Lowest parsed POA height per section row (inf when a row has no parseable height)
+        height_cols = [col for col in sections_df.columns if col.startswith("POA_") and col.endswith("HT")]
+        if height_cols:
+            parsed = pd.DataFrame(
+                {col: Utils.parse_height_decimal_series(sections_df[col]) for col in height_cols}
+            )
+            min_heights = parsed.min(axis=1, skipna=True).fillna(float('inf'))
+            section_index['min_heights'] = min_heights.tolist()
+            section_index['has_heights'] = True
+        
+        logging.debug(f"Section index built: {len(section_index['by_connection'])} connections, {len(sections_df)} section rows")
+        return section_index
+    
     def _find_section(self, connection_id, sections_df, pole_scid=None, to_pole_scid=None):
         """Find section data for a connection_id, choosing section with lowest Proposed MetroNet height if multiple entries exist.
         If multiple rows match, further filter by pole_scid and to_pole_scid if columns exist."""
         if sections_df is None or sections_df.empty:
             return None
         
-        # Filter for matching connection_id
-        matching = sections_df[sections_df['connection_id'] == connection_id]
+        # Reuse the index for as long as we are handed the same sections frame
+        section_index = self._section_index
+        if section_index is None or section_index['source'] is not sections_df:
+            section_index = self._build_section_index(sections_df)
+            self._section_index = section_index
         
-        # If possible, further filter by pole_scid and to_pole_scid
-        pole_cols = [col for col in sections_df.columns if col.lower() in ['pole', 'from_pole', 'pole_scid', 'from_scid']]
-        to_pole_cols = [col for col in sections_df.columns if col.lower() in ['to_pole', 'to_scid']]
-        if pole_scid and to_pole_scid and not matching.empty:
-            for pole_col in pole_cols:
-                matching = matching[matching[pole_col] == pole_scid]
-            for to_pole_col in to_pole_cols:
-                matching = matching[matching[to_pole_col] == to_pole_scid]
-        
-        if matching.empty:
+        positions = section_index['by_connection'].get(connection_id)
+        if not positions:
             return None
         
-        if len(matching) == 1:
-            return matching.iloc[0]
+        # If possible, further filter by pole_scid and to_pole_scid
+        pole_cols = section_index['pole_cols']
+        to_pole_cols = section_index['to_pole_cols']
+        if pole_scid and to_pole_scid and (pole_cols or to_pole_cols):
+            pair_key = tuple([connection_id] + [pole_scid] * len(pole_cols) + [to_pole_scid] * len(to_pole_cols))
+            positions = section_index['by_pair'].get(pair_key)
+            if not positions:
+                return None
         
-        # Choose entry with lowest overall attachment height when multiple entries exist
-        if len(matching) > 1:
-            matching_copy = matching.copy()
-            
-            # Find all height columns (POA_*HT)
-            height_cols = [col for col in matching.columns if col.startswith("POA_") and col.endswith("HT")]
-            
-            if height_cols:
-                # Calculate the lowest height for each row across all height columns
-                min_heights = []
-                for idx in matching.index:
-                    row_heights = []
-                    for ht_col in height_cols:
-                        height_value = matching.loc[idx, ht_col]
-                        if pd.notna(height_value):
-                            try:
-                                height_decimal = Utils.parse_height_decimal(height_value)
-                                if height_decimal is not None:
-                                    row_heights.append(height_decimal)
-                            except:
-                                continue
-                    
-                    # Find the minimum height for this row
-                    min_height = min(row_heights) if row_heights else float('inf')
-                    min_heights.append(min_height)
-                
-                # Find the row with the overall lowest height
-                if min_heights and any(h != float('inf') for h in min_heights):
-                    min_idx = min_heights.index(min(min_heights))
-                    return matching.iloc[min_idx]
-            
-            # If no valid heights found, return first entry
-            return matching.iloc[0]
+        if len(positions) == 1:
+            return sections_df.iloc[positions[0]]
         
-        return matching.iloc[0]
+        # Choose entry with lowest overall attachment height when multiple entries exist
+        if section_index['has_heights']:
+            min_heights = [section_index['min_heights'][pos] for pos in positions]
+            lowest = min(min_heights)
+            if lowest != float('inf'):
+                return sections_df.iloc[positions[min_heights.index(lowest)]]
+        
+        # If no valid heights found, return first entry
+        return sections_df.iloc[positions[0]]
+    
+    def _get_run_context(self):
+        """Lookups derived from the mapping and config, computed once per run and shared by every row"""
+        if self._run_context is None:
+            self._run_context = {
+                'mapped_elements': self._build_mapped_elements(),
+                'proposed_keywords': self._build_proposed_company_keywords(),
+                'street_light_keywords': self._build_street_light_keywords(),
+                'metronet_matches': {},  # lower-cased owner -> _match_metronet result
+                'provider_matches': {},  # lower-cased owner -> _match_telecom_provider result
+                'pole_fields': {},  # pole SCID -> (node, pole-level output fields)
+                'pole_attachments': {},  # pole SCID -> span-independent attachment results
+            }
+        return self._run_context
     
     def _get_mapped_elements(self):
         """Get mapped providers and comm options from mapping data"""
+        return self._get_run_context()['mapped_elements']
+    
+    def _build_mapped_elements(self):
+        """Derive mapped providers and comm options from mapping data"""
         mapped = {
             'providers': set(),
             'midspan': set(),
@@ -1527,16 +1632,327 @@ class PoleDataProcessor:
         
         return mapped
     
+    @staticmethod
+    def _build_comm_keyword_regex(comm_keywords):
+        """Compile comm keyword rules into one regex over stripped, lower-cased measured text.
+        
+        'guy' and plain keywords must match the whole text; keywords ending in '*'
+        match anywhere as a substring.
+        """
+        exact = []
+        partial = []
+        for kw in comm_keywords:
+            kw_clean = str(kw).strip().lower()
+            if kw_clean != 'guy' and kw_clean.endswith('*'):
+                partial.append(re.escape(kw_clean[:-1]))
+            else:
+                exact.append(re.escape(kw_clean))
+        
+        patterns = []
+        if exact:
+            patterns.append(r'^(?:' + '|'.join(exact) + r')\Z')
+        if partial:
+            patterns.append(r'(?:' + '|'.join(partial) + r')')
+        return '|'.join(patterns) if patterns else None
+    
+    def _classify_attachments(self, table):
+        """
+        Label every row of the attachment table in one vectorized pass
+        
+        Args:
+            table: AttachmentDataReader.attachment_table (with normalized columns)
+            
+        Returns:
+            DataFrame indexed like `table` with columns: comm, provider, metronet,
+            power, power_keyword, equipment, streetlight, riser
+        """
+        labels = pd.DataFrame(index=table.index)
+        if table.empty:
+            for col in ['comm', 'metronet', 'power', 'equipment', 'streetlight', 'riser']:
+                labels[col] = pd.Series(dtype=bool)
+            labels['provider'] = pd.Series(dtype=object)
+            labels['power_keyword'] = pd.Series(dtype=object)
+            return labels
+        
+        company_norm = table['_company_norm']
+        measured_norm = table['_measured_norm']
+        company_str = table['company'].astype(str).str.strip()
+        company_blank = company_norm.eq('')
+        no_rows = pd.Series(False, index=table.index)
+        
+        power_company = self.config.get("power_company", "").strip().lower()
+        if power_company:
+            power_company_pattern = r'\b' + re.escape(power_company) + r'\b'
+            company_is_power = company_norm.str.contains(power_company_pattern, na=False, regex=True)
+            power_or_blank = company_is_power | company_blank
+            # _is_telecom_company: any non-blank company that is not the power company
+            telecom_company = ~company_blank & ~company_norm.str.contains(power_company, na=False, regex=False)
+        else:
+            company_is_power = no_rows
+            power_or_blank = pd.Series(True, index=table.index)
+            telecom_company = ~company_blank
+        
+        # Communication: comm keyword rules AND telecom company AND not the proposed company
+        comm_keywords = self.config.get("comm_keywords", ['catv com', 'telco com', 'fiber optic com', 'insulator', 'power guy', 'communication', 'comm'])
+        comm_pattern = self._build_comm_keyword_regex(comm_keywords)
+        comm_by_keyword = measured_norm.str.contains(comm_pattern, na=False, regex=True) if comm_pattern else no_rows
+        proposed_company = self.config.get("proposed_company", "").strip().lower()
+        is_proposed = company_norm.str.contains(proposed_company, na=False, regex=False) if proposed_company else no_rows
+        labels['comm'] = comm_by_keyword & telecom_company & ~is_proposed
+        
+        # Provider and MetroNet matching only depend on the company text, so resolve each distinct value once
+        provider_by_company = {}
+        metronet_by_company = {}
+        for company in company_str.unique():
+            provider = self._match_telecom_provider(company) or company
+            provider_by_company[company] = provider
+            metronet_by_company[company] = bool(provider) and self._match_metronet(provider)
+        labels['provider'] = company_str.map(provider_by_company).where(labels['comm'], '')
+        labels['metronet'] = company_str.map(metronet_by_company).astype(bool)
+        
+        # Power: power company (or blank) rows whose measured text contains a power keyword;
+        # riser keywords only count when the company is the power company. The matched keyword
+        # (original spelling, longest first as in find_power_attachment) is kept for the output.
+        keyword_map = [(kw.strip().lower(), kw) for kw in self.config.get("power_keywords", []) if isinstance(kw, str) and kw.strip()]
+        power_keyword = pd.Series(None, index=table.index, dtype=object)
+        if keyword_map:
+            keywords_by_length = sorted(keyword_map, key=lambda x: len(x[0]), reverse=True)
+            
+            def longest_power_keyword(text):
+                return next((original for lower, original in keywords_by_length if lower in text), None)
+            
+            keyword_pattern = '|'.join(re.escape(lower) for lower, _ in keyword_map)
+            candidates = power_or_blank & measured_norm.str.contains(keyword_pattern, na=False, regex=True)
+            # Only rows that mention a power keyword are scanned for the longest match
+            matched = measured_norm[candidates].map(longest_power_keyword)
+            requires_power = matched.map(lambda kw: isinstance(kw, str) and 'riser' in kw.lower()).astype(bool)
+            matched = matched[~(requires_power & ~company_is_power[matched.index])]
+            power_keyword[matched.index] = matched
+        labels['power_keyword'] = power_keyword
+        labels['power'] = power_keyword.notna()
+        
+        # Power equipment: same company rule, any equipment keyword (riser keywords need the power company)
+        equipment_keywords = [kw.strip().lower() for kw in self.config.get("power_equipment_keywords", []) if isinstance(kw, str) and kw.strip()]
+        equipment = no_rows
+        for kw in equipment_keywords:
+            kw_mask = measured_norm.str.contains(kw, na=False, regex=False)
+            if 'riser' in kw:
+                kw_mask &= company_is_power
+            equipment = equipment | kw_mask
+        labels['equipment'] = power_or_blank & equipment
+        
+        # Street light: configured keywords ('*' wildcard), limited to power company rows
+        street_keywords = self._get_street_light_keywords()
+        require_power_company = self._keywords_require_power_company(street_keywords)
+        if require_power_company and not power_company:
+            labels['streetlight'] = no_rows
+        else:
+            if power_company:
+                street_company = company_is_power if require_power_company else power_or_blank
+            else:
+                street_company = pd.Series(True, index=table.index)
+            keyword_pattern = self._build_keyword_regex(street_keywords)
+            street_measured = measured_norm.str.contains(keyword_pattern or 'street', na=False, regex=bool(keyword_pattern))
+            requires_mask = measured_norm.map(
+                lambda text: self._measurement_requires_power_company(text, street_keywords)
+            ).astype(bool)
+            labels['streetlight'] = street_company & street_measured & ~(requires_mask & ~company_is_power)
+        
+        # Existing risers: 'riser' in measured, excluding MetroNet risers
+        metronet_riser_keywords = [k.lower() for k in self.config.get("telecom_keywords", {}).get("Proposed MetroNet", [])]
+        is_riser = measured_norm.str.contains('riser', na=False, regex=False)
+        if metronet_riser_keywords:
+            metronet_pattern = '|'.join(re.escape(k) for k in metronet_riser_keywords)
+            is_metronet_riser = (
+                company_norm.str.contains(metronet_pattern, na=False, regex=True)
+                | measured_norm.str.contains(metronet_pattern, na=False, regex=True)
+            )
+            is_riser &= ~is_metronet_riser
+        labels['riser'] = is_riser
+        
+        logging.debug(
+            f"Classified {len(labels)} attachment rows: {int(labels['comm'].sum())} comm, {int(labels['power'].sum())} power, "
+            f"{int(labels['equipment'].sum())} equipment, {int(labels['streetlight'].sum())} street light, {int(labels['riser'].sum())} riser"
+        )
+        return labels
+    
+    def _get_scid_attachment_labels(self, scid):
+        """Return (attachment rows, row labels) for a SCID, classifying the whole table on first use"""
+        table = self.attachment_reader.attachment_table
+        if self._attachment_labels is None or self._attachment_labels_source is not table:
+            self._attachment_labels = self._classify_attachments(table)
+            self._attachment_labels_source = table
+        rows = self.attachment_reader.get_scid_rows(scid)
+        return rows, self._attachment_labels.loc[rows.index]
+    
     def _process_attachments(self, node, section, mapped_elements, scid, is_pole_to_reference=False):
         """Process all attachment data for a pole"""
-        # Initialize attachment dictionaries
-        attach = {p: "" for p in mapped_elements['providers']}
+        # Pole-level results are shared by every span from this pole; only midspan data is per row
+        pole_data = self._get_pole_attachments(scid, mapped_elements)
+        attach = dict(pole_data['attach'])
+        comm_attach = dict(pole_data['comm_attach'])
+        telecom_heights = pole_data['telecom_heights']
+        power_heights = pole_data['power_heights']
+        
         attach_midspan = {f"{p}_Midspan": "" for p in mapped_elements['midspan']}
-        comm_attach = {c: "" for c in mapped_elements['comm_attach']}
         comm_midspan = {f"{c}_Midspan": "" for c in mapped_elements['comm_midspan']}
         
         # Track midspan heights per provider for grouping (similar to pole attachments)
         provider_midspan_heights = {}  # provider -> list of (height_decimal, height_formatted)
+        power_midspan_heights = []
+        all_telecom_midspan = []
+        
+        # Process section data for midspan - for both pole-to-pole and pole-to-reference connections
+        midspan_processed_count = 0
+        for col in section.index:
+            if col.startswith("POA_") and not col.endswith("HT"):
+                owner = str(section[col])
+                ht_col = f"{col}HT"
+                if ht_col in section and pd.notna(section[ht_col]):
+                    fmt = Utils.parse_height_format(section[ht_col])
+                    dec = Utils.parse_height_decimal(section[ht_col])
+                    
+                    self._process_midspan(owner, fmt, dec, attach_midspan, 
+                                        power_midspan_heights, all_telecom_midspan, mapped_elements, provider_midspan_heights)
+                    midspan_processed_count += 1
+                    connection_type = "pole-to-reference" if is_pole_to_reference else "pole-to-pole"
+                    logging.debug(f"Processed midspan data for {connection_type} connection (SCID {scid}), {col}: owner='{owner}', height={fmt}")
+        
+        if midspan_processed_count > 0:
+            logging.debug(f"Total midspan entries processed for SCID {scid}: {midspan_processed_count}")
+        else:
+            logging.debug(f"No midspan data found in section for SCID {scid}")
+        
+        # Log connection type for debugging
+        connection_type = "pole-to-reference" if is_pole_to_reference else "pole-to-pole"
+        logging.debug(f"Processed {connection_type} connection (SCID {scid}): {midspan_processed_count} midspan entries")
+        
+        # Group provider midspan heights exactly like pole attachments (deduplicate and combine)
+        # First, collect all Proposed MetroNet synonyms into a single field (like pole attachments)
+        metronet_midspan_heights = []
+        for provider, height_list in provider_midspan_heights.items():
+            if height_list and self._match_metronet(provider):
+                metronet_midspan_heights.extend(height_list)
+        
+        # Populate Proposed MetroNet midspan field with all synonyms combined
+        if metronet_midspan_heights and "Proposed MetroNet" in mapped_elements['midspan']:
+            metronet_midspan_heights.sort(key=lambda x: x[0], reverse=True)
+            # Deduplicate identical heights for MetroNet midspan
+            unique_metronet_heights = []
+            seen_metronet_heights = set()
+            for h in metronet_midspan_heights:
+                if h[1] not in seen_metronet_heights:
+                    unique_metronet_heights.append(h[1])
+                    seen_metronet_heights.add(h[1])
+            combined_metronet_midspan = ', '.join(unique_metronet_heights)
+            attach_midspan["Proposed MetroNet_Midspan"] = combined_metronet_midspan
+            logging.info(f"Set Proposed MetroNet midspan for SCID {scid}: {combined_metronet_midspan}")
+        
+        # Populate other individual provider midspan fields (excluding Proposed MetroNet synonyms)
+        for provider, height_list in provider_midspan_heights.items():
+            if height_list and provider in mapped_elements['midspan'] and not self._match_metronet(provider):
+                # Sort heights from highest to lowest (like pole attachments)
+                height_list.sort(key=lambda x: x[0], reverse=True)
+                # Combine all heights for this provider (deduplicate identical heights)
+                unique_heights = []
+                seen_heights = set()
+                for h in height_list:
+                    if h[1] not in seen_heights:
+                        unique_heights.append(h[1])
+                        seen_heights.add(h[1])
+                combined_heights = ', '.join(unique_heights)
+                attach_midspan[f"{provider}_Midspan"] = combined_heights
+                logging.info(f"Set {provider} midspan for SCID {scid}: {combined_heights}")
+        
+        # Group midspan heights by provider (exactly like pole attachments) before assigning to comm fields
+        # This ensures multiple heights for the same provider are combined in the same comm field
+        midspan_processed_by_provider = {}  # provider -> list of (height_decimal, height_formatted)
+        
+        # Group all_telecom_midspan by provider
+        for height_decimal, height_formatted, owner in all_telecom_midspan:
+            # Match provider from owner string
+            matched_provider = self._match_telecom_provider(owner)
+            if matched_provider:
+                if matched_provider not in midspan_processed_by_provider:
+                    midspan_processed_by_provider[matched_provider] = []
+                midspan_processed_by_provider[matched_provider].append((height_decimal, height_formatted))
+        
+        # Collect all providers with their highest heights for sorting (like pole attachments)
+        provider_midspan_heights_for_comm = []
+        for provider, height_list in midspan_processed_by_provider.items():
+            if height_list:
+                # Sort heights from highest to lowest for this provider
+                height_list.sort(key=lambda x: x[0], reverse=True)
+                # Get the highest height for this provider
+                highest_height = height_list[0][0]  # height_decimal
+                # Combine all heights for this provider (deduplicate identical heights)
+                unique_heights = []
+                seen_heights = set()
+                for h in height_list:
+                    if h[1] not in seen_heights:
+                        unique_heights.append(h[1])
+                        seen_heights.add(h[1])
+                combined_heights = ', '.join(unique_heights)
+                provider_midspan_heights_for_comm.append((highest_height, provider, combined_heights))
+        
+        # Sort providers by their highest height (descending order)
+        provider_midspan_heights_for_comm.sort(key=lambda x: x[0], reverse=True)
+        
+        # Assign to comm midspan fields based on height order (exactly like pole attachments)
+        comm_field_index = 1
+        for highest_height, provider, combined_heights in provider_midspan_heights_for_comm:
+            comm_field = f"comm{comm_field_index}_Midspan"
+            if comm_field in comm_midspan:
+                comm_midspan[comm_field] = combined_heights
+                logging.info(f"Set {comm_field} ({provider}) midspan for SCID {scid}: {combined_heights} (highest: {highest_height:.2f}')")
+            
+            comm_field_index += 1
+            
+            # Stop if we've reached comm4 (assuming max 4 comm fields)
+            if comm_field_index > 4:
+                break
+        
+        # Calculate power heights
+        power_data = self._calculate_power_heights(power_heights, power_midspan_heights, telecom_heights)
+        
+        # Log final results for debugging
+        if any(attach.values()) or any(power_data.values()) or comm_attach.get('All_Comm_Heights') or any(comm_midspan.values()):
+            logging.info(f"Final attachments for SCID {scid}:")
+            for key, value in {**attach, **power_data, **comm_attach, **comm_midspan}.items():
+                if value:
+                    logging.info(f"  {key}: {value}")
+        
+        result = {**attach, **attach_midspan, **comm_attach, **comm_midspan, **power_data}
+        result['Power Equipments'] = pole_data['power_equipments']
+        # This is for the pre-existing field 'Streetlight (bottom of bracket)'
+        result['Streetlight (bottom of bracket)'] = pole_data['streetlight_bracket']
+        # This is for the new field 'Street Light Height'
+        result['Street Light Height'] = pole_data['street_light_height']
+        
+        return result
+    
+    def _get_pole_attachments(self, scid, mapped_elements):
+        """
+        Get the span-independent attachment results for a pole, computing them once per run
+        
+        Args:
+            scid: Pole SCID
+            mapped_elements: Mapped elements for this run
+            
+        Returns:
+            Dictionary with provider/comm attachment fields, comm and power heights, power
+            equipment and street light heights. Callers must copy the field dicts before changing them.
+        """
+        cache = self._get_run_context()['pole_attachments']
+        if scid not in cache:
+            cache[scid] = self._build_pole_attachments(scid, mapped_elements)
+        return cache[scid]
+    
+    def _build_pole_attachments(self, scid, mapped_elements):
+        """Collect power, power equipment, street light and comm attachments for a pole"""
+        # Initialize attachment dictionaries
+        attach = {p: "" for p in mapped_elements['providers']}
+        comm_attach = {c: "" for c in mapped_elements['comm_attach']}
         
         # Add new fields for comprehensive communication data
         comm_attach['All_Comm_Heights'] = ""
@@ -1545,16 +1961,16 @@ class PoleDataProcessor:
         # Process attachment data from new file format
         telecom_heights = []
         power_heights = []
-        power_midspan_heights = []
         all_telecom_attachments = []
-        all_telecom_midspan = []
+        power_equipment = None
         
         # Get power and telecom attachments from attachment reader
         if self.attachment_reader:
             logging.debug(f"Processing attachments for pole {scid}")
             
-            # Get power attachment (unchanged)
-            power_attachment = self.attachment_reader.find_power_attachment(scid, self.config["power_keywords"])
+            # Power and power equipment are picked from the rows the batch classifier labelled
+            raw_scid_data, scid_labels = self._get_scid_attachment_labels(scid)
+            power_attachment = self.attachment_reader.find_power_attachment(scid, self.config["power_keywords"], labels=scid_labels)
             if power_attachment:
                 # Store height, formatted height, and the keyword that matched
                 keyword = power_attachment.get('keyword', '')
@@ -1564,139 +1980,67 @@ class PoleDataProcessor:
                 logging.debug(f"No power attachment found for SCID {scid}")
             
             # Get power equipment (new functionality)
-            power_equipment = self.attachment_reader.find_power_equipment(scid, self.config.get("power_equipment_keywords", []))
+            power_equipment = self.attachment_reader.find_power_equipment(
+                scid, self.config.get("power_equipment_keywords", []), labels=scid_labels
+            )
             if power_equipment:
                 logging.info(f"Added power equipment for SCID {scid}: {power_equipment['equipment_count']} items")
             else:
                 logging.debug(f"No power equipment found for SCID {scid}")
             
-            # Process ALL communication attachments from raw SCID data directly (unified approach)
-            raw_scid_data = self.attachment_reader.get_scid_data(scid)
+            # Process ALL communication attachments from the labelled attachment table (unified approach)
             if not raw_scid_data.empty:
                 logging.debug(f"Processing raw SCID data for {scid}: {len(raw_scid_data)} rows")
-                logging.debug(f"Raw SCID data columns: {list(raw_scid_data.columns)}")
                 logging.debug(f"Raw SCID data sample: {raw_scid_data[['company', 'measured', 'height_in_inches']].head().to_dict('records')}")
-                # Look for ALL communication-related entries using configurable keywords
-                comm_keywords = self.config.get("comm_keywords", ['catv com', 'telco com', 'fiber optic com', 'insulator', 'power guy', 'communication', 'comm'])
-                logging.debug(f"Using communication keywords: {comm_keywords}")
                 processed_attachments = {}  # Track by provider for provider-specific fields
                 
-                for _, row in raw_scid_data.iterrows():
-                    measured = str(row.get('measured', '')).lower()
-                    company = str(row.get('company', '')).lower()
-                    
-                    # Check if this is a communication attachment
-                    # 1. Check if communication keywords match measured field (case-insensitive)
-                    # Support wildcard (*) for substring matching or exact match
-                    measured_clean = str(row.get('measured', '')).strip().lower()
-                    is_comm_by_keyword = False
-                    for kw in comm_keywords:
-                        kw_clean = kw.strip().lower()
-                        if kw_clean == 'guy':
-                            # Special case: Guy always exact match
-                            if kw_clean == measured_clean:
-                                is_comm_by_keyword = True
-                                break
-                        elif kw_clean.endswith('*'):
-                            # Wildcard match: substring
-                            if kw_clean[:-1] in measured_clean:
-                                is_comm_by_keyword = True
-                                break
-                        else:
-                            # Exact match
-                            if kw_clean == measured_clean:
-                                is_comm_by_keyword = True
-                                break
-                    
-                    # Debug: Show detailed matching for each keyword
-                    if measured_clean:  # Only debug if there's actual measured data
-                        logging.debug(f"Checking measured text: '{row.get('measured', '')}' -> cleaned: '{measured_clean}'")
-                        for kw in comm_keywords:
-                            kw_clean = kw.strip().lower()
-                            # Check for wildcard or exact match
-                            if kw_clean == 'guy':
-                                match_result = kw_clean == measured_clean
-                            elif kw_clean.endswith('*'):
-                                match_result = kw_clean[:-1] in measured_clean
+                # Rows were classified once for the whole table: comm keyword in measured AND
+                # telecom company AND not the proposed company. Only positive heights are used.
+                heights = raw_scid_data['_inches']
+                comm_index = raw_scid_data.index[scid_labels['comm'] & heights.notna() & (heights > 0)]
+                
+                for idx in comm_index:
+                    row = raw_scid_data.loc[idx]
+                    try:
+                        height_inches = float(row['_inches'])
+                        height_formatted = Utils.inches_to_feet_format(str(int(height_inches)))
+                        if not height_formatted:  # Only proceed if conversion was successful
+                            logging.warning(f"Failed to format height {height_inches} for SCID {scid}")
+                            continue
+                        
+                        # Apply output formatting based on configuration
+                        height_formatted = self._format_height_for_output(height_formatted)
+                        height_decimal = height_inches / 12
+                        
+                        # Provider was matched to configured telecom providers (or falls back to company name)
+                        company_str = str(row.get('company', '')).strip()
+                        provider = scid_labels.at[idx, 'provider']
+                        
+                        # Add to provider-specific processing (for provider fields)
+                        # Process attachments for both pole-to-pole AND pole-to-reference connections
+                        # Allow all communication companies to be processed, not just mapped providers
+                        if provider:
+                            if provider not in processed_attachments:
+                                processed_attachments[provider] = []
+                            processed_attachments[provider].append((height_decimal, height_formatted))
+                        
+                        # Add to comprehensive list for All_Comm_Heights
+                        provider_info = f"{company_str} - {row.get('measured', '')}" if company_str else row.get('measured', '')
+                        entry = (height_decimal, height_formatted, provider_info)
+                        
+                        # Check if this exact height is already captured
+                        height_exists = any(abs(height_decimal - existing[0]) < 0.01 for existing in all_telecom_attachments)
+                        
+                        if not height_exists:
+                            # Exclude Proposed MetroNet from comm1-4 columns
+                            if not scid_labels.at[idx, 'metronet']:
+                                all_telecom_attachments.append(entry)
+                                telecom_heights.append(height_decimal)
+                                logging.debug(f"Added comm attachment for SCID {scid}: {height_formatted} ({provider_info})")
                             else:
-                                match_result = kw_clean == measured_clean
-                            logging.debug(f"  Keyword '{kw}' -> '{kw_clean}' == '{measured_clean}' ? {match_result}")
-                    
-                    if is_comm_by_keyword:
-                        logging.debug(f"Communication keyword match: '{row.get('measured', '')}' -> '{measured_clean}' matches keywords: {comm_keywords}")
-                    
-                    # 2. Check if company name matches telecom providers or their synonyms
-                    is_comm_by_company = self._is_telecom_company(company)
-                    
-                    # 3. Check if this is the proposed company (should be excluded from comm1, comm2, etc.)
-                    proposed_company = self.config.get("proposed_company", "").strip().lower()
-                    is_proposed_company = proposed_company and proposed_company in company
-                    
-                    # BOTH conditions must be met: comm keyword in measured AND telecom company
-                    # BUT exclude proposed company from communication height processing
-                    is_comm = is_comm_by_keyword and is_comm_by_company and not is_proposed_company
-                    
-                    if is_comm:
-                        logging.debug(f"Found communication attachment: company='{row.get('company', '')}', measured='{row.get('measured', '')}', is_comm_by_keyword={is_comm_by_keyword}, is_comm_by_company={is_comm_by_company}, is_proposed_company={is_proposed_company}")
-                    
-                    if is_comm and 'height_in_inches' in row:
-                        try:
-                            height_value = row['height_in_inches']
-                            if pd.isna(height_value) or str(height_value).strip() == '':
-                                continue
-                                
-                            # Clean and convert height value
-                            height_str = str(height_value).replace('"', '').replace('″', '').strip()
-                            try:
-                                height_inches = float(pd.to_numeric(height_str, errors='coerce'))
-                                if not pd.isna(height_inches) and height_inches > 0:
-                                    height_formatted = Utils.inches_to_feet_format(str(int(height_inches)))
-                                    if height_formatted:  # Only proceed if conversion was successful
-                                        # Apply output formatting based on configuration
-                                        height_formatted = self._format_height_for_output(height_formatted)
-                                        height_decimal = height_inches / 12
-                                        
-                                        # Determine provider for this attachment
-                                        provider = None
-                                        company_str = str(row.get('company', '')).strip()
-                                        
-                                        # Match to configured telecom providers or fall back to company name
-                                        provider = self._match_telecom_provider(company_str)
-                                        if not provider:
-                                            provider = company_str if company_str else ""
-                                        
-                                        # Add to provider-specific processing (for provider fields)
-                                        # Process attachments for both pole-to-pole AND pole-to-reference connections
-                                        # Allow all communication companies to be processed, not just mapped providers
-                                        if provider:  # Remove restriction to mapped_elements['providers']
-                                            if provider not in processed_attachments:
-                                                processed_attachments[provider] = []
-                                            processed_attachments[provider].append((height_decimal, height_formatted))
-                                        
-                                        # Add to comprehensive list for All_Comm_Heights
-                                        provider_info = f"{company_str} - {row.get('measured', '')}" if company_str else row.get('measured', '')
-                                        entry = (height_decimal, height_formatted, provider_info)
-                                        
-                                        # Check if this exact height is already captured
-                                        existing_heights = [x[0] for x in all_telecom_attachments]
-                                        height_exists = any(abs(height_decimal - existing_height) < 0.01 for existing_height in existing_heights)
-                                        
-                                        if not height_exists:
-                                            # Exclude Proposed MetroNet from comm1-4 columns
-                                            if not self._match_metronet(provider):
-                                                all_telecom_attachments.append(entry)
-                                                telecom_heights.append(height_decimal)
-                                                logging.debug(f"Added comm attachment for SCID {scid}: {height_formatted} ({provider_info})")
-                                            else:
-                                                logging.debug(f"Excluded Proposed MetroNet from comm columns for SCID {scid}: {height_formatted} ({provider_info})")
-                                    else:
-                                        logging.warning(f"Failed to format height {height_inches} for SCID {scid}")
-                                else:
-                                    logging.debug(f"Invalid height value {height_value} for SCID {scid}")
-                            except Exception as e:
-                                logging.warning(f"Error processing comm attachment for SCID {scid}: {e}")
-                        except Exception as e:
-                            logging.warning(f"Error processing comm attachment for SCID {scid}: {e}")
+                                logging.debug(f"Excluded Proposed MetroNet from comm columns for SCID {scid}: {height_formatted} ({provider_info})")
+                    except Exception as e:
+                        logging.warning(f"Error processing comm attachment for SCID {scid}: {e}")
                 
                 # Process provider-specific attachments and assign to comm1, comm2, etc.
                 # Process attachments for both pole-to-pole AND pole-to-reference connections
@@ -1788,126 +2132,6 @@ class PoleDataProcessor:
         else:
             logging.warning("No attachment reader available - attachment data will not be processed")
         
-        # Process section data for midspan - for both pole-to-pole and pole-to-reference connections
-        midspan_processed_count = 0
-        for col in section.index:
-            if col.startswith("POA_") and not col.endswith("HT"):
-                owner = str(section[col])
-                ht_col = f"{col}HT"
-                if ht_col in section and pd.notna(section[ht_col]):
-                    fmt = Utils.parse_height_format(section[ht_col])
-                    dec = Utils.parse_height_decimal(section[ht_col])
-                    
-                    self._process_midspan(owner, fmt, dec, attach_midspan, 
-                                        power_midspan_heights, all_telecom_midspan, mapped_elements, provider_midspan_heights)
-                    midspan_processed_count += 1
-                    connection_type = "pole-to-reference" if is_pole_to_reference else "pole-to-pole"
-                    logging.debug(f"Processed midspan data for {connection_type} connection (SCID {scid}), {col}: owner='{owner}', height={fmt}")
-        
-        if midspan_processed_count > 0:
-            logging.debug(f"Total midspan entries processed for SCID {scid}: {midspan_processed_count}")
-        else:
-            logging.debug(f"No midspan data found in section for SCID {scid}")
-        
-        # Log connection type for debugging
-        connection_type = "pole-to-reference" if is_pole_to_reference else "pole-to-pole"
-        logging.debug(f"Processed {connection_type} connection (SCID {scid}): {midspan_processed_count} midspan entries")
-        
-        # Group provider midspan heights exactly like pole attachments (deduplicate and combine)
-        # First, collect all Proposed MetroNet synonyms into a single field (like pole attachments)
-        metronet_midspan_heights = []
-        for provider, height_list in provider_midspan_heights.items():
-            if height_list and self._match_metronet(provider):
-                metronet_midspan_heights.extend(height_list)
-        
-        # Populate Proposed MetroNet midspan field with all synonyms combined
-        if metronet_midspan_heights and "Proposed MetroNet" in mapped_elements['midspan']:
-            metronet_midspan_heights.sort(key=lambda x: x[0], reverse=True)
-            # Deduplicate identical heights for MetroNet midspan
-            unique_metronet_heights = []
-            seen_metronet_heights = set()
-            for h in metronet_midspan_heights:
-                if h[1] not in seen_metronet_heights:
-                    unique_metronet_heights.append(h[1])
-                    seen_metronet_heights.add(h[1])
-            combined_metronet_midspan = ', '.join(unique_metronet_heights)
-            attach_midspan["Proposed MetroNet_Midspan"] = combined_metronet_midspan
-            logging.info(f"Set Proposed MetroNet midspan for SCID {scid}: {combined_metronet_midspan}")
-        
-        # Populate other individual provider midspan fields (excluding Proposed MetroNet synonyms)
-        for provider, height_list in provider_midspan_heights.items():
-            if height_list and provider in mapped_elements['midspan'] and not self._match_metronet(provider):
-                # Sort heights from highest to lowest (like pole attachments)
-                height_list.sort(key=lambda x: x[0], reverse=True)
-                # Combine all heights for this provider (deduplicate identical heights)
-                unique_heights = []
-                seen_heights = set()
-                for h in height_list:
-                    if h[1] not in seen_heights:
-                        unique_heights.append(h[1])
-                        seen_heights.add(h[1])
-                combined_heights = ', '.join(unique_heights)
-                attach_midspan[f"{provider}_Midspan"] = combined_heights
-                logging.info(f"Set {provider} midspan for SCID {scid}: {combined_heights}")
-        
-        # Group midspan heights by provider (exactly like pole attachments) before assigning to comm fields
-        # This ensures multiple heights for the same provider are combined in the same comm field
-        midspan_processed_by_provider = {}  # provider -> list of (height_decimal, height_formatted)
-        
-        # Group all_telecom_midspan by provider
-        for height_decimal, height_formatted, owner in all_telecom_midspan:
-            # Match provider from owner string
-            matched_provider = self._match_telecom_provider(owner)
-            if matched_provider:
-                if matched_provider not in midspan_processed_by_provider:
-                    midspan_processed_by_provider[matched_provider] = []
-                midspan_processed_by_provider[matched_provider].append((height_decimal, height_formatted))
-        
-        # Collect all providers with their highest heights for sorting (like pole attachments)
-        provider_midspan_heights_for_comm = []
-        for provider, height_list in midspan_processed_by_provider.items():
-            if height_list:
-                # Sort heights from highest to lowest for this provider
-                height_list.sort(key=lambda x: x[0], reverse=True)
-                # Get the highest height for this provider
-                highest_height = height_list[0][0]  # height_decimal
-                # Combine all heights for this provider (deduplicate identical heights)
-                unique_heights = []
-                seen_heights = set()
-                for h in height_list:
-                    if h[1] not in seen_heights:
-                        unique_heights.append(h[1])
-                        seen_heights.add(h[1])
-                combined_heights = ', '.join(unique_heights)
-                provider_midspan_heights_for_comm.append((highest_height, provider, combined_heights))
-        
-        # Sort providers by their highest height (descending order)
-        provider_midspan_heights_for_comm.sort(key=lambda x: x[0], reverse=True)
-        
-        # Assign to comm midspan fields based on height order (exactly like pole attachments)
-        comm_field_index = 1
-        for highest_height, provider, combined_heights in provider_midspan_heights_for_comm:
-            comm_field = f"comm{comm_field_index}_Midspan"
-            if comm_field in comm_midspan:
-                comm_midspan[comm_field] = combined_heights
-                logging.info(f"Set {comm_field} ({provider}) midspan for SCID {scid}: {combined_heights} (highest: {highest_height:.2f}')")
-            
-            comm_field_index += 1
-            
-            # Stop if we've reached comm4 (assuming max 4 comm fields)
-            if comm_field_index > 4:
-                break
-        
-        # Calculate power heights
-        power_data = self._calculate_power_heights(power_heights, power_midspan_heights, telecom_heights)
-        
-        # Log final results for debugging
-        if any(attach.values()) or any(power_data.values()) or comm_attach.get('All_Comm_Heights') or any(comm_midspan.values()):
-            logging.info(f"Final attachments for SCID {scid}:")
-            for key, value in {**attach, **power_data, **comm_attach, **comm_midspan}.items():
-                if value:
-                    logging.info(f"  {key}: {value}")
-        
         # Add streetlight (bottom of bracket) height
         streetlight_from_find = self.attachment_reader.find_streetlight_attachment(scid) if self.attachment_reader else None
         
@@ -1915,91 +2139,31 @@ class PoleDataProcessor:
         street_light_height_processed = ""
         if self.attachment_reader:
             try:
-                df_scid_data = self.attachment_reader.get_scid_data(scid)
+                df_scid_data, scid_labels = self._get_scid_attachment_labels(scid)
                 if not df_scid_data.empty:
-                    street_keywords = self._get_street_light_keywords()
-                    require_power_company = self._keywords_require_power_company(street_keywords)
-                    power_company_config = self.config.get("power_company", "").strip().lower()
-
-                    if not power_company_config and require_power_company:
-                        logging.debug(f"SCID {scid}: Power company not configured. Skipping street light detection for riser keywords.")
-                    else:
-                        df_filtered = df_scid_data.copy()
-                        if power_company_config:
-                            df_filtered['company_stripped'] = df_filtered['company'].astype(str).str.strip().str.lower()
-                            power_company_pattern = r'\b' + re.escape(power_company_config) + r'\b'
-                            company_mask = df_filtered['company_stripped'].str.contains(power_company_pattern, na=False, regex=True)
-                            if require_power_company:
-                                df_filtered = df_filtered[company_mask]
-                            else:
-                                blank_mask = df_filtered['company_stripped'].eq('')
-                                df_filtered = df_filtered[company_mask | blank_mask]
-
-                        if not df_filtered.empty:
-                            df_filtered = df_filtered.copy()
-                            df_filtered['measured_stripped'] = df_filtered['measured'].astype(str).str.strip().str.lower()
-
-                            keyword_pattern = self._build_keyword_regex(street_keywords)
-                            if keyword_pattern:
-                                street_rows = df_filtered[df_filtered['measured_stripped'].str.contains(keyword_pattern, na=False, regex=True)]
-                            else:
-                                street_rows = df_filtered[df_filtered['measured_stripped'].str.contains('street', na=False)]
-
-                            if not street_rows.empty:
-                                street_rows = street_rows.copy()
-                                street_rows['company_stripped'] = street_rows['company'].astype(str).str.strip().str.lower()
-                                if power_company_config:
-                                    company_mask = street_rows['company_stripped'].str.contains(
-                                        power_company_pattern, na=False, regex=True
-                                    )
-                                else:
-                                    company_mask = pd.Series(False, index=street_rows.index)
-
-                                requires_mask = street_rows['measured_stripped'].apply(
-                                    lambda text: self._measurement_requires_power_company(text, street_keywords)
-                                )
-                                street_rows = street_rows[
-                                    ~(requires_mask & ~company_mask)
-                                ]
-
-                                if not street_rows.empty:
-                                    s_rows_copy = street_rows.copy()
-                                    s_rows_copy['height_numeric'] = pd.to_numeric(
-                                        s_rows_copy['height_in_inches'].astype(str).str.replace('"', '').str.replace('″', ''),
-                                        errors='coerce'
-                                    )
-                                    s_rows_copy = s_rows_copy.dropna(subset=['height_numeric'])
-                                    if not s_rows_copy.empty:
-                                        min_row = s_rows_copy.loc[s_rows_copy['height_numeric'].idxmin()]
-                                        street_light_height_processed = Utils.inches_to_feet_format(str(int(min_row['height_numeric'])))
-                                        street_light_height_processed = self._format_height_for_output(street_light_height_processed)
+                    street_heights = df_scid_data['_inches'][scid_labels['streetlight']].dropna()
+                    if not street_heights.empty:
+                        street_light_height_processed = Utils.inches_to_feet_format(str(int(street_heights.min())))
+                        street_light_height_processed = self._format_height_for_output(street_light_height_processed)
             except Exception as e:
                 logging.error(f"Error processing street light height for SCID {scid}: {e}")
         
-        result = {**attach, **attach_midspan, **comm_attach, **comm_midspan, **power_data}
-        
         # Add power equipment data
-        if self.attachment_reader:
-            power_equipment = self.attachment_reader.find_power_equipment(scid, self.config.get("power_equipment_keywords", []))
-            if power_equipment and power_equipment.get('equipment_list'):
-                result['Power Equipments'] = power_equipment['equipment_list']
-            else:
-                result['Power Equipments'] = ''
-                logging.debug(f"No Power Equipment data for SCID {scid}")
-        else:
-            result['Power Equipments'] = ''
-            logging.debug(f"No attachment reader available for Power Equipment extraction")
-        
-        # This is for the pre-existing field 'Streetlight (bottom of bracket)'
-        if streetlight_from_find:
-            result['Streetlight (bottom of bracket)'] = streetlight_from_find['height']
+        if power_equipment and power_equipment.get('equipment_list'):
+            power_equipments = power_equipment['equipment_list']
         else:
-            result['Streetlight (bottom of bracket)'] = ''
+            power_equipments = ''
+            logging.debug(f"No Power Equipment data for SCID {scid}")
         
-        # This is for the new field 'Street Light Height'
-        result['Street Light Height'] = street_light_height_processed if street_light_height_processed else ''
-        
-        return result
+        return {
+            'attach': attach,
+            'comm_attach': comm_attach,
+            'telecom_heights': telecom_heights,
+            'power_heights': power_heights,
+            'power_equipments': power_equipments,
+            'streetlight_bracket': streetlight_from_find['height'] if streetlight_from_find else '',
+            'street_light_height': street_light_height_processed if street_light_height_processed else '',
+        }
     
     def _process_midspan(self, owner, fmt, dec, attach_midspan, 
                         power_midspan_heights, all_telecom_midspan, mapped_elements, provider_midspan_heights=None):
@@ -2173,6 +2337,13 @@ class PoleDataProcessor:
         """Check if owner matches Proposed MetroNet (case insensitive) 
            For 'power guy' keyword, still requires company/owner name to be present."""
         owner_str = str(owner).lower()
+        matches = self._get_run_context()['metronet_matches']
+        if owner_str not in matches:
+            matches[owner_str] = self._owner_matches_metronet(owner, owner_str)
+        return matches[owner_str]
+    
+    def _owner_matches_metronet(self, owner, owner_str):
+        """Uncached _match_metronet"""
         keywords = self._get_proposed_company_keywords()
         
         logging.debug(f"_match_metronet called with owner='{owner}', owner_str='{owner_str}', keywords={keywords}")
@@ -2209,6 +2380,13 @@ class PoleDataProcessor:
     def _match_telecom_provider(self, owner):
         """Match owner to telecom provider (case insensitive)"""
         owner_str = str(owner).lower()
+        matches = self._get_run_context()['provider_matches']
+        if owner_str not in matches:
+            matches[owner_str] = self._owner_telecom_provider(owner_str)
+        return matches[owner_str]
+    
+    def _owner_telecom_provider(self, owner_str):
+        """Uncached _match_telecom_provider"""
         telecom_keywords = self.config.get("telecom_keywords", {})
         for provider, keywords in telecom_keywords.items():
             if any(k.lower() in owner_str for k in keywords):
@@ -2227,6 +2405,10 @@ class PoleDataProcessor:
 
     def _get_proposed_company_keywords(self):
         """Return a set of normalized keywords for the proposed company (MetroNet)."""
+        return self._get_run_context()['proposed_keywords']
+    
+    def _build_proposed_company_keywords(self):
+        """Derive the proposed company keywords from config"""
         keywords = set()
         proposed_company = self.config.get("proposed_company", "").strip().lower()
         
@@ -2249,6 +2431,10 @@ class PoleDataProcessor:
 
     def _get_street_light_keywords(self):
         """Get configured keywords for identifying street light measurements."""
+        return self._get_run_context()['street_light_keywords']
+    
+    def _build_street_light_keywords(self):
+        """Derive street light keywords from config"""
         configured = self.config.get("street_light_keywords", [])
         keywords = [kw.strip().lower() for kw in configured if isinstance(kw, str) and kw.strip()]
         if not keywords:
@@ -2345,7 +2531,8 @@ class PoleDataProcessor:
         # Use attachment data if available
         if self.attachment_reader and scid:
             try:
-                count = self.attachment_reader.count_existing_risers_from_attachments(scid)
+                _, scid_labels = self._get_scid_attachment_labels(scid)
+                count = int(scid_labels['riser'].sum())
                 logging.debug(f"Counted {count} existing risers from attachment data for SCID {scid}")
                 return str(count)
             except Exception as e:
@@ -2601,113 +2788,61 @@ class PoleDataProcessor:
                 logging.error(f"Output file '{output_file}' is missing or empty.")
                 return
 
-            # Attempt to load the workbook inside a try/except block to catch EOFError
-            try:
-                # Use keep_vba=True only for .xlsm files, not for .xlsx files
-                output_path = Path(output_file)
-                if output_path.suffix.lower() == '.xlsm':
-                    wb = load_workbook(output_file, keep_vba=True)
-                else:
-                    wb = load_workbook(output_file)
-            except EOFError as eof_error:
-                logging.error(f"EOFError encountered when loading workbook '{output_file}': {eof_error}. The template file may be corrupted.")
-                return
-            except Exception as e:
-                logging.error(f"Error loading workbook '{output_file}': {e}")
-                return
+            with self.profiler.stage("workbook write", rows=len(sorted_data)):
+                use_template_patch = self._use_template_patch_engine()
+                if use_template_patch:
+                    try:
+                        wb = TemplatePatchWriter(output_file)
+                        logging.info("Writing output by patching the template sheets in place")
+                    except Exception as e:
+                        logging.warning(f"Could not open '{output_file}' for template patching, using openpyxl instead: {e}")
+                        use_template_patch = False
+                if not use_template_patch:
+                    wb = self._checkout_template_workbook(output_file) or self._load_output_workbook(output_file)
+                    if wb is None:
+                        return
 
-            # Apply final span length tolerance check to all sheet data
-            if self.qc_reader and self.qc_reader.is_active():
-                logging.info("Applying final span length tolerance check to sheet data")
-                tolerance = self.config.get('processing_options', {}).get('span_length_tolerance', 3)
-                logging.info(f"Span length tolerance setting: {tolerance}")
+                # Apply final span length tolerance check to all sheet data
+                if self.qc_reader and self.qc_reader.is_active():
+                    logging.info("Applying final span length tolerance check to sheet data")
+                    tolerance = self.config.get('processing_options', {}).get('span_length_tolerance', 3)
+                    logging.info(f"Span length tolerance setting: {tolerance}")
                 
-                tolerance_updates = 0
-                for row_data in sorted_data:
-                    pole = row_data.get('Pole', '')
-                    to_pole = row_data.get('To Pole', '')
+                    tolerance_updates = 0
+                    for row_data in sorted_data:
+                        pole = row_data.get('Pole', '')
+                        to_pole = row_data.get('To Pole', '')
                     
-                    if pole and to_pole and not self._is_end_marker(to_pole):
-                        # Get QC span length
-                        qc_span = self.qc_reader.get_qc_span_length(pole, to_pole)
-                        excel_span = row_data.get('Span Length', '')
+                        if pole and to_pole and not self._is_end_marker(to_pole):
+                            # Get QC span length
+                            qc_span = self.qc_reader.get_qc_span_length(pole, to_pole)
+                            excel_span = row_data.get('Span Length', '')
                         
-                        # Log every connection for debugging
-                        if qc_span or excel_span:
-                            logging.info(f"Tolerance check: {pole} -> {to_pole}: Excel='{excel_span}', QC='{qc_span}'")
+                            # Log every connection for debugging
+                            if qc_span or excel_span:
+                                logging.info(f"Tolerance check: {pole} -> {to_pole}: Excel='{excel_span}', QC='{qc_span}'")
                         
-                        if qc_span and excel_span:
-                            # Apply tolerance check
-                            final_span = self._apply_span_length_tolerance(excel_span, qc_span, tolerance)
+                            if qc_span and excel_span:
+                                # Apply tolerance check
+                                final_span = self._apply_span_length_tolerance(excel_span, qc_span, tolerance)
                             
-                            # Always update with the final span length (tolerance method handles the logic)
-                            row_data['Span Length'] = final_span
+                                # Always update with the final span length (tolerance method handles the logic)
+                                row_data['Span Length'] = final_span
                             
-                            # Log the result for debugging
-                            if final_span != excel_span:
-                                logging.info(f"Final tolerance update: {pole} -> {to_pole}: '{excel_span}' -> '{final_span}' (QC: {qc_span}, tolerance: {tolerance})")
-                                tolerance_updates += 1
-                            else:
-                                logging.info(f"Excel span length retained: {pole} -> {to_pole}: '{excel_span}' (QC: {qc_span}, tolerance: {tolerance})")
+                                # Log the result for debugging
+                                if final_span != excel_span:
+                                    logging.info(f"Final tolerance update: {pole} -> {to_pole}: '{excel_span}' -> '{final_span}' (QC: {qc_span}, tolerance: {tolerance})")
+                                    tolerance_updates += 1
+                                else:
+                                    logging.info(f"Excel span length retained: {pole} -> {to_pole}: '{excel_span}' (QC: {qc_span}, tolerance: {tolerance})")
                     
-                    # Ensure END markers remain intact after any tolerance logic
-                    self._apply_end_marker(row_data)
+                        # Ensure END markers remain intact after any tolerance logic
+                        self._apply_end_marker(row_data)
                 
-                logging.info(f"Completed span length tolerance check: {tolerance_updates} updates applied")
+                    logging.info(f"Completed span length tolerance check: {tolerance_updates} updates applied")
             
-            # Write data to all sheets that have Pole/To Pole columns
-            sheets_written = 0
-            if hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
-                # Write to each sheet found in template
-                for sheet_name in self.template_scids_by_sheet.keys():
-                    if sheet_name in wb.sheetnames:
-                        ws = wb[sheet_name]
-                        
-                        # Filter data to only include rows that match this sheet's Pole/To Pole pairs
-                        sheet_scids = self.template_scids_by_sheet[sheet_name]
-                        sheet_pole_to_pole_pairs = {(str(pole).strip(), str(to_pole).strip()) for pole, to_pole, _ in sheet_scids}
-                        
-                        # Filter sorted_data to only include rows matching this sheet
-                        filtered_sorted_data = []
-                        for row_data in sorted_data:
-                            pole_val = str(row_data.get('Pole', '')).strip()
-                            to_pole_val = str(row_data.get('To Pole', '')).strip()
-                            if (pole_val, to_pole_val) in sheet_pole_to_pole_pairs:
-                                filtered_sorted_data.append(row_data)
-                        
-                        logging.info(f"Filtered to {len(filtered_sorted_data)} rows for sheet '{sheet_name}' (from {len(sorted_data)} total rows)")
-                        
-                        # Write data; using mapped writing if available, else a simple write
-                        if hasattr(self, 'mapping_data') and self.mapping_data:
-                            self._write_data_to_worksheet(ws, filtered_sorted_data, self.mapping_data, sheet_name)
-                        else:
-                            self._write_data_simple(ws, filtered_sorted_data, sheet_name)
-                        
-                        sheets_written += 1
-                    else:
-                        logging.warning(f"Sheet '{sheet_name}' not found in output workbook")
-            else:
-                # Fallback to single sheet mode (backward compatibility)
-                if hasattr(self, 'config') and self.config:
-                    worksheet_name = self.config.get('output_settings', {}).get('worksheet_name', 'Consumers pg1')
-                else:
-                    worksheet_name = 'Consumers pg1'
-
-                if worksheet_name in wb.sheetnames:
-                    ws = wb[worksheet_name]
-                else:
-                    ws = wb.active
-                    logging.warning(f"Worksheet '{worksheet_name}' not found, using '{ws.title}'")
-
-                # Write data; using mapped writing if available, else a simple write
-                if hasattr(self, 'mapping_data') and self.mapping_data:
-                    self._write_data_to_worksheet(ws, sorted_data, self.mapping_data, worksheet_name)
-                else:
-                    self._write_data_simple(ws, sorted_data, worksheet_name)
-                
-                sheets_written = 1
-            
-            logging.info(f"Wrote data to {sheets_written} sheet(s)")
+                sheets_written = self._write_result_sheets(wb, sorted_data)
+                logging.info(f"Wrote data to {sheets_written} sheet(s)")
 
             # Automatically populate QC sheet if QC reader is active
             if self.qc_reader and self.qc_reader.is_active():
@@ -2732,25 +2867,151 @@ class PoleDataProcessor:
             # Apply Alden QC comparison if Alden QC reader is active
             if self.alden_qc_reader and self.alden_qc_reader.is_active():
                 logging.info("Alden QC reader is active - performing Alden comparison")
-                self._apply_alden_qc_comparison(wb)
+                with self.profiler.stage("Alden comparison", rows=len(sorted_data)):
+                    self._apply_alden_qc_comparison(wb)
                 
-                # Populate "From Alden" sheet with data from Alden file
-                logging.info("Populating 'From Alden' sheet with Alden file data")
-                self._populate_from_alden_sheet(wb)
+                    # Populate "From Alden" sheet with data from Alden file
+                    logging.info("Populating 'From Alden' sheet with Alden file data")
+                    self._populate_from_alden_sheet(wb)
                 
-                # Apply highlighting to "From Alden" sheet comparing with processed data
-                logging.info("Applying highlighting to 'From Alden' sheet")
-                self._apply_from_alden_highlighting(wb)
+                    # Apply highlighting to "From Alden" sheet comparing with processed data
+                    logging.info("Applying highlighting to 'From Alden' sheet")
+                    self._apply_from_alden_highlighting(wb)
+            else:
+                logging.info("Alden QC reader not active - skipping Alden comparison")
+
+            with self.profiler.stage("save"):
+                if use_template_patch:
+                    try:
+                        wb.save(output_file)
+                    except TemplatePatchError as e:
+                        logging.warning(f"Template cannot be patched in place ({e}), writing with openpyxl instead")
+                        wb = self._load_output_workbook(output_file)
+                        if wb is None:
+                            return
+                        self._write_result_sheets(wb, sorted_data)
+                        wb.save(output_file)
+                else:
+                    wb.save(output_file)
+            logging.info(f"Successfully wrote {len(sorted_data)} records to {output_file}")
+
+        except Exception as e:
+            logging.error(f"Error writing output: {e}")
+            raise
+
+    def _use_template_patch_engine(self):
+        """
+        Check whether results should be written with the template-patching engine
+        
+        The engine is chosen with output_settings.output_engine = "template_patch". QC and
+        Alden comparisons edit formatting across the workbook, so they keep using openpyxl.
+        """
+        engine = self.config.get('output_settings', {}).get('output_engine', 'openpyxl')
+        if str(engine).strip().lower() != 'template_patch':
+            return False
+        if (self.qc_reader and self.qc_reader.is_active()) or (self.alden_qc_reader and self.alden_qc_reader.is_active()):
+            logging.info("QC comparison is active - writing output with openpyxl")
+            return False
+        return True
+    
+    def _get_template_schema(self, workbook):
+        """Get the header/column schema for an output workbook, building it on first use"""
+        if self._template_schema is None or self._template_schema.workbook is not workbook:
+            self._template_schema = TemplateSchema(workbook)
+        return self._template_schema
+    
+    def _checkout_template_workbook(self, output_file):
+        """Take the workbook loaded by read_template_scids for writing, if it suits the output file"""
+        session = self.template_session
+        if session is None or not session.can_write_to(output_file):
+            return None
+        try:
+            # The output file is a copy of the template, so saving the session's workbook over it is equivalent
+            wb = session.checkout_workbook()
+            logging.info(f"Writing output from the template loaded at startup ('{session.template_path.name}')")
+            return wb
+        except Exception as e:
+            logging.warning(f"Could not reuse the loaded template, reloading the output file: {e}")
+            return None
+    
+    def _load_output_workbook(self, output_file):
+        """Load the output workbook with openpyxl, or return None if it cannot be opened"""
+        # Attempt to load the workbook inside a try/except block to catch EOFError
+        try:
+            # Use keep_vba=True only for .xlsm files, not for .xlsx files
+            if Path(output_file).suffix.lower() == '.xlsm':
+                return load_workbook(output_file, keep_vba=True)
+            return load_workbook(output_file)
+        except EOFError as eof_error:
+            logging.error(f"EOFError encountered when loading workbook '{output_file}': {eof_error}. The template file may be corrupted.")
+        except Exception as e:
+            logging.error(f"Error loading workbook '{output_file}': {e}")
+        return None
+    
+    def _write_result_sheets(self, wb, sorted_data):
+        """
+        Write result rows to every template sheet that has Pole/To Pole columns
+        
+        Args:
+            wb: openpyxl Workbook or TemplatePatchWriter
+            sorted_data: Output rows in write order
+            
+        Returns:
+            Number of sheets written
+        """
+        sheets_written = 0
+        if hasattr(self, 'template_scids_by_sheet') and self.template_scids_by_sheet:
+            # Write to each sheet found in template
+            for sheet_name in self.template_scids_by_sheet.keys():
+                if sheet_name in wb.sheetnames:
+                    ws = wb[sheet_name]
+                    
+                    # Filter data to only include rows that match this sheet's Pole/To Pole pairs
+                    sheet_scids = self.template_scids_by_sheet[sheet_name]
+                    sheet_pole_to_pole_pairs = {(str(pole).strip(), str(to_pole).strip()) for pole, to_pole, _ in sheet_scids}
+                    
+                    # Filter sorted_data to only include rows matching this sheet
+                    filtered_sorted_data = []
+                    for row_data in sorted_data:
+                        pole_val = str(row_data.get('Pole', '')).strip()
+                        to_pole_val = str(row_data.get('To Pole', '')).strip()
+                        if (pole_val, to_pole_val) in sheet_pole_to_pole_pairs:
+                            filtered_sorted_data.append(row_data)
+                    
+                    logging.info(f"Filtered to {len(filtered_sorted_data)} rows for sheet '{sheet_name}' (from {len(sorted_data)} total rows)")
+                    
+                    # Write data; using mapped writing if available, else a simple write
+                    if hasattr(self, 'mapping_data') and self.mapping_data:
+                        self._write_data_to_worksheet(ws, filtered_sorted_data, self.mapping_data, sheet_name)
+                    else:
+                        self._write_data_simple(ws, filtered_sorted_data, sheet_name)
+                    
+                    sheets_written += 1
+                else:
+                    logging.warning(f"Sheet '{sheet_name}' not found in output workbook")
+        else:
+            # Fallback to single sheet mode (backward compatibility)
+            if hasattr(self, 'config') and self.config:
+                worksheet_name = self.config.get('output_settings', {}).get('worksheet_name', 'Consumers pg1')
             else:
-                logging.info("Alden QC reader not active - skipping Alden comparison")
-
-            wb.save(output_file)
-            logging.info(f"Successfully wrote {len(sorted_data)} records to {output_file}")
+                worksheet_name = 'Consumers pg1'
 
-        except Exception as e:
-            logging.error(f"Error writing output: {e}")
-            raise
+            if worksheet_name in wb.sheetnames:
+                ws = wb[worksheet_name]
+            else:
+                ws = wb.active
+                logging.warning(f"Worksheet '{worksheet_name}' not found, using '{ws.title}'")
 
+            # Write data; using mapped writing if available, else a simple write
+            if hasattr(self, 'mapping_data') and self.mapping_data:
+                self._write_data_to_worksheet(ws, sorted_data, self.mapping_data, worksheet_name)
+            else:
+                self._write_data_simple(ws, sorted_data, worksheet_name)
+            
+            sheets_written = 1
+        
+        return sheets_written
+    
     def _populate_qc_sheet(self, workbook):
         """Automatically populate QC sheet with data from QC file into existing columns"""
         try:
@@ -2778,10 +3039,10 @@ class PoleDataProcessor:
             header_row = None
             existing_headers = {}
             
-            for row_num in [1, 2, 3]:
+            schema = self._get_template_schema(qc_sheet.parent)
+            for row_num, header_cells in schema.header_rows(qc_sheet, max_columns=50):
                 headers_found = {}
-                for col_idx in range(1, min(qc_sheet.max_column + 1, 50)):  # Limit column scan to 50 columns
-                    cell_value = qc_sheet.cell(row=row_num, column=col_idx).value
+                for col_idx, cell_value in header_cells:  # Limit column scan to 50 columns
                     if cell_value:
                         # Clean header text (remove extra spaces, newlines)
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip()
@@ -2884,6 +3145,7 @@ class PoleDataProcessor:
                 if rows_written % 100 == 0:
                     logging.info(f"Populated {rows_written} QC rows...")
             
+            schema.invalidate(qc_sheet.title, data_start_row)
             logging.info(f"Successfully populated QC sheet with {rows_written} rows into {len(column_mapping)} matching columns")
             
         except Exception as e:
@@ -3064,7 +3326,6 @@ class PoleDataProcessor:
     
     def _write_data_to_worksheet(self, ws, sorted_data, mapping_data, sheet_name=None):
         """Write sorted_data to worksheet ws using mapping_data for column mapping."""
-        import re
         # Get config settings
         header_row = self.config.get("output_settings", {}).get("header_row", 1)
         data_start_row = self.config.get("output_settings", {}).get("data_start_row", header_row + 2)
@@ -3072,32 +3333,19 @@ class PoleDataProcessor:
         # Check if this is the Alden sheet
         is_alden_sheet = sheet_name and sheet_name.strip().lower() == "alden"
 
-        # Get headers from the worksheet
-        headers = []
-        for cell_obj in ws[header_row]:
-            if cell_obj.value:
-                header_text = re.sub(r"\s+", " ", str(cell_obj.value).replace("\n", " ")).strip()
-                headers.append(header_text)
-            else:
-                headers.append("")
-        col_map = {h: idx + 1 for idx, h in enumerate(headers) if h.strip()}
-
-        # Build mapping from internal key to Excel column name
-        internal_to_excel = {}
-        for element, attribute, output_col_name in mapping_data:
-            internal_key = self._get_internal_key(element, attribute)
-            if internal_key and output_col_name.strip():
-                internal_to_excel[internal_key] = output_col_name
-                logging.debug(f"Mapping {element}:{attribute} -> {internal_key} -> {output_col_name}")
-            else:
-                logging.debug(f"Skipping mapping {element}:{attribute} -> {internal_key} -> {output_col_name}")
+        # Header columns and mapping resolutions are shared by every sheet written to this workbook
+        schema = self._get_template_schema(ws.parent)
+        col_map = schema.column_map(ws, header_row)
+        internal_to_excel = schema.resolve_mapping(mapping_data, self._get_internal_key)
         
         successful_writes = 0
         missing_columns = set()
+        first_row_written = None
         
         for i, data_row_content in enumerate(sorted_data, start=1):
             # Use Excel row from template if available, otherwise use sequential
             excel_row = data_row_content.get('_excel_row', data_start_row + i - 1)
+            first_row_written = excel_row if first_row_written is None else min(first_row_written, excel_row)
             data_row_content['Line No.'] = i
             
             for internal_name, value in data_row_content.items():
@@ -3134,6 +3382,8 @@ class PoleDataProcessor:
                     logging.debug(f"Column not found: '{excel_col_name}' (internal: {internal_name}, available: {list(col_map.keys())})")
                     if False:  # Tension-related code removed
                         logging.warning(f"Column not found in worksheet: {excel_col_name} (internal: {internal_name})")
+        if first_row_written is not None:
+            schema.invalidate(ws.title, first_row_written)
         if missing_columns:
             logging.info(f"Note: Some mapped columns not found in template: {', '.join(sorted(missing_columns))}")
         else:
@@ -3170,6 +3420,9 @@ class PoleDataProcessor:
                     cell = ws.cell(row=row_idx, column=col_idx, value=value)
                     col_idx += 1
                 # Note: Removed conditional formatting/highlighting as requested
+        
+        if sorted_data:
+            self._get_template_schema(ws.parent).invalidate(ws.title)
 
     def _process_qc_filtered_connections(self, connections_df, mappings, sections_df):
         """Process connections when QC file is active - use EXACT QC Pole and ToPole values in specified order"""
@@ -3182,32 +3435,19 @@ class PoleDataProcessor:
         logging.info(f"Processing {len(qc_original_connections)} QC connections in specified order")
         logging.info("QC Mode: Using EXACT original Pole and ToPole format from QC file")
         
-        # Create lookup for connection data from Excel (bidirectional)
-        connection_lookup = {}
-        for _, conn in connections_df.iterrows():
-            n1, n2 = str(conn['node_id_1']).strip(), str(conn['node_id_2']).strip()
-            if n1 in mappings['node_id_to_scid'] and n2 in mappings['node_id_to_scid']:
-                scid1 = mappings['node_id_to_scid'][n1]
-                scid2 = mappings['node_id_to_scid'][n2]
-                
-                conn_info = {
-                    'connection_id': conn.get('connection_id', ''),
-                    'span_distance': conn.get('span_distance', ''),
-                    'node1_id': n1,
-                    'node2_id': n2
-                }
-                
-                # Store connection lookup (use sorted tuple as key to avoid duplication)
-                connection_key = tuple(sorted([scid1, scid2]))
-                connection_lookup[connection_key] = conn_info
+        # Bidirectional lookup for connection data from Excel
+        connection_index = self._connection_index
+        if connection_index is None:
+            connection_index = self._build_connection_index(connections_df, mappings)
         
         # Process QC connections in the exact order specified in QC file
         for i, (qc_pole_orig, qc_to_pole_orig) in enumerate(qc_original_connections):
             # Get the corresponding normalized versions for data lookup
             qc_pole_norm, qc_to_pole_norm = qc_normalized_connections[i]
             # Check if this connection exists in Excel data using normalized SCIDs
-            connection_key = tuple(sorted([qc_pole_norm, qc_to_pole_norm]))
-            conn_info = connection_lookup.get(connection_key)
+            matches = connection_index.get(self._connection_key(qc_pole_norm, qc_to_pole_norm))
+            # QC lookup has always kept the last connection row for a pair
+            conn_info = dict(matches[-1]) if matches else None
             
             if not conn_info:
                 logging.warning(f"QC connection {qc_pole_orig} -> {qc_to_pole_orig} not found in Excel data")
@@ -3397,7 +3637,6 @@ class PoleDataProcessor:
         """Compare Alden sheet data with Alden QC file and apply conditional formatting"""
         try:
             import re
-            from openpyxl.styles import PatternFill
             
             # Check if Alden sheet exists
             if "Alden" not in workbook.sheetnames:
@@ -3425,10 +3664,10 @@ class PoleDataProcessor:
             detected_header_row = None
             
             logging.debug(f"Searching for headers in Alden sheet. Max column: {alden_sheet.max_column}")
-            for row_num in [1, 2, 3]:
+            schema = self._get_template_schema(alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(alden_sheet):
                 headers_found = []
-                for col_idx in range(1, min(alden_sheet.max_column + 1, 100)):
-                    cell_value = alden_sheet.cell(row=row_num, column=col_idx).value
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip().lower()
                         headers_found.append((col_idx, header_text))
@@ -3493,609 +3732,27 @@ class PoleDataProcessor:
             max_row = alden_sheet.max_row
             logging.info(f"Data range: rows {data_start} to {max_row}")
             
-            # Define fill colors
-            match_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
-            mismatch_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-            not_found_fill = PatternFill(start_color="B3D9FF", end_color="B3D9FF", fill_type="solid")  # Light blue
-            
-            matches = 0
-            mismatches = 0
-            not_found = 0
-            metro_attach_matches = 0
-            metro_attach_mismatches = 0
-            metro_mid_matches = 0
-            metro_mid_mismatches = 0
-            power_attach_matches = 0
-            power_attach_mismatches = 0
-            power_mid_matches = 0
-            power_mid_mismatches = 0
-            power_type_matches = 0
-            power_type_mismatches = 0
-            comm1_attach_matches = 0
-            comm1_attach_mismatches = 0
-            comm1_mid_matches = 0
-            comm1_mid_mismatches = 0
-            comm2_attach_matches = 0
-            comm2_attach_mismatches = 0
-            comm2_mid_matches = 0
-            comm2_mid_mismatches = 0
-            comm3_attach_matches = 0
-            comm3_attach_mismatches = 0
-            comm3_mid_matches = 0
-            comm3_mid_mismatches = 0
-            
-            # Compare each data row
-            logging.debug(f"Starting comparison. Data start row: {data_start}, Max row: {max_row}")
-            for row_idx in range(data_start, max_row + 1):
-                pole_value = alden_sheet.cell(row=row_idx, column=pole_col).value
-                mr_notes_value = alden_sheet.cell(row=row_idx, column=mr_notes_col).value
-                
-                if not pole_value:
-                    continue
-                
-                pole_str = str(pole_value).strip()
-                
-                # Log first few poles for debugging
-                if row_idx <= data_start + 2:
-                    logging.info(f"Row {row_idx}: Pole={pole_str}, MR_Notes='{str(mr_notes_value)[:50] if mr_notes_value else 'None'}...'")
-                
-                # Check if pole exists in QC file first
-                if not self.alden_qc_reader.has_pole(pole_str):
-                    # Pole not found in QC file - highlight Pole cell with light blue
-                    not_found += 1
-                    alden_sheet.cell(row=row_idx, column=pole_col).fill = not_found_fill
-                    if row_idx <= data_start + 2:
-                        logging.info(f"  Pole {pole_str} not found in Alden QC file - highlighted in light blue")
-                    continue
-                
-                # Get MR notes from QC file (now we know the pole exists)
-                qc_mr_notes = self.alden_qc_reader.get_mr_notes(pole_str)
-                
-                # Normalize MR notes for comparison - extract text after colon if exists
-                template_notes_full = str(mr_notes_value).strip() if mr_notes_value else ""
-                # Extract notes after colon from template
-                if ':' in template_notes_full:
-                    template_notes = template_notes_full.split(':', 1)[1].strip()
-                else:
-                    template_notes = template_notes_full
-                
-                qc_notes_norm = qc_mr_notes.strip()
-                
-                # Check if they match
-                if template_notes == qc_notes_norm:
-                    # Match - apply green fill
-                    alden_sheet.cell(row=row_idx, column=mr_notes_col).fill = match_fill
-                    matches += 1
-                    logging.debug(f"Pole {pole_str}: Match")
-                else:
-                    # Mismatch - apply red fill
-                    alden_sheet.cell(row=row_idx, column=mr_notes_col).fill = mismatch_fill
-                    mismatches += 1
-                    logging.debug(f"Pole {pole_str}: Mismatch (template: '{template_notes[:50]}...' vs QC: '{qc_notes_norm[:50]}...')")
-                
-                # Compare MetroNet heights if columns exist
-                if metro_attach_col:
-                    result = self._compare_metronet_attachment_height(
-                        alden_sheet, row_idx, pole_str, metro_attach_col, match_fill, mismatch_fill)
-                    if result:
-                        metro_attach_matches += result.get('matches', 0)
-                        metro_attach_mismatches += result.get('mismatches', 0)
-                
-                if metro_mid_col:
-                    result = self._compare_metronet_midspan_height(
-                        alden_sheet, row_idx, pole_str, metro_mid_col, match_fill, mismatch_fill)
-                    if result:
-                        metro_mid_matches += result.get('matches', 0)
-                        metro_mid_mismatches += result.get('mismatches', 0)
-                
-                # Compare Power heights if columns exist
-                if power_attach_col:
-                    result = self._compare_power_attachment_height(
-                        alden_sheet, row_idx, pole_str, power_attach_col, match_fill, mismatch_fill, street_light_col)
-                    if result:
-                        power_attach_matches += result.get('matches', 0)
-                        power_attach_mismatches += result.get('mismatches', 0)
-                elif row_idx == data_start:  # Log only for first row if column not found
-                    logging.warning("'Lowest Power at Pole' column not detected in Alden sheet - power height comparison will be skipped")
-                
-                if power_mid_col:
-                    result = self._compare_power_midspan_height(
-                        alden_sheet, row_idx, pole_str, power_mid_col, match_fill, mismatch_fill)
-                    if result:
-                        power_mid_matches += result.get('matches', 0)
-                        power_mid_mismatches += result.get('mismatches', 0)
-                
-                # Compare Power Type if column exists
-                if power_type_col:
-                    result = self._compare_power_type(
-                        alden_sheet, row_idx, pole_str, power_type_col, match_fill, mismatch_fill)
-                    if result:
-                        power_type_matches += result.get('matches', 0)
-                        power_type_mismatches += result.get('mismatches', 0)
-                
-                # Compare Communication heights if columns exist
-                if comm1_col:
-                    result = self._compare_comm_attachment_height(
-                        alden_sheet, row_idx, pole_str, comm1_col, 1, match_fill, mismatch_fill)
-                    if result:
-                        comm1_attach_matches += result.get('matches', 0)
-                        comm1_attach_mismatches += result.get('mismatches', 0)
-                
-                if comm1_mid_col:
-                    result = self._compare_comm_midspan_height(
-                        alden_sheet, row_idx, pole_str, comm1_mid_col, 1, match_fill, mismatch_fill)
-                    if result:
-                        comm1_mid_matches += result.get('matches', 0)
-                        comm1_mid_mismatches += result.get('mismatches', 0)
-                
-                if comm2_col:
-                    result = self._compare_comm_attachment_height(
-                        alden_sheet, row_idx, pole_str, comm2_col, 2, match_fill, mismatch_fill)
-                    if result:
-                        comm2_attach_matches += result.get('matches', 0)
-                        comm2_attach_mismatches += result.get('mismatches', 0)
-                
-                if comm2_mid_col:
-                    result = self._compare_comm_midspan_height(
-                        alden_sheet, row_idx, pole_str, comm2_mid_col, 2, match_fill, mismatch_fill)
-                    if result:
-                        comm2_mid_matches += result.get('matches', 0)
-                        comm2_mid_mismatches += result.get('mismatches', 0)
-                
-                if comm3_col:
-                    result = self._compare_comm_attachment_height(
-                        alden_sheet, row_idx, pole_str, comm3_col, 3, match_fill, mismatch_fill)
-                    if result:
-                        comm3_attach_matches += result.get('matches', 0)
-                        comm3_attach_mismatches += result.get('mismatches', 0)
-                
-                if comm3_mid_col:
-                    result = self._compare_comm_midspan_height(
-                        alden_sheet, row_idx, pole_str, comm3_mid_col, 3, match_fill, mismatch_fill)
-                    if result:
-                        comm3_mid_matches += result.get('matches', 0)
-                        comm3_mid_mismatches += result.get('mismatches', 0)
-            
-            logging.info(f"Alden QC comparison complete: {matches} matches, {mismatches} mismatches, {not_found} poles not found")
-            if metro_attach_col:
-                logging.info(f"MetroNet Attachment heights: {metro_attach_matches} matches, {metro_attach_mismatches} mismatches")
-            if metro_mid_col:
-                logging.info(f"MetroNet Midspan heights: {metro_mid_matches} matches, {metro_mid_mismatches} mismatches")
-            if power_attach_col:
-                logging.info(f"Power Attachment heights: {power_attach_matches} matches, {power_attach_mismatches} mismatches")
-            if power_mid_col:
-                logging.info(f"Power Midspan heights: {power_mid_matches} matches, {power_mid_mismatches} mismatches")
-            if power_type_col:
-                logging.info(f"Power Type: {power_type_matches} matches, {power_type_mismatches} mismatches")
-            if comm1_col:
-                logging.info(f"Comm1 Attachment heights: {comm1_attach_matches} matches, {comm1_attach_mismatches} mismatches")
-            if comm1_mid_col:
-                logging.info(f"Comm1 Midspan heights: {comm1_mid_matches} matches, {comm1_mid_mismatches} mismatches")
-            if comm2_col:
-                logging.info(f"Comm2 Attachment heights: {comm2_attach_matches} matches, {comm2_attach_mismatches} mismatches")
-            if comm2_mid_col:
-                logging.info(f"Comm2 Midspan heights: {comm2_mid_matches} matches, {comm2_mid_mismatches} mismatches")
-            if comm3_col:
-                logging.info(f"Comm3 Attachment heights: {comm3_attach_matches} matches, {comm3_attach_mismatches} mismatches")
-            if comm3_mid_col:
-                logging.info(f"Comm3 Midspan heights: {comm3_mid_matches} matches, {comm3_mid_mismatches} mismatches")
+            engine = QCComparisonEngine(alden_sheet, self.config.get("power_keywords", []))
+            columns = {
+                'pole': pole_col, 'mr_notes': mr_notes_col, 'street_light': street_light_col,
+                'metro_attach': metro_attach_col, 'metro_mid': metro_mid_col,
+                'power_attach': power_attach_col, 'power_mid': power_mid_col, 'power_type': power_type_col,
+                'comm1': comm1_col, 'comm1_mid': comm1_mid_col, 'comm2': comm2_col, 'comm2_mid': comm2_mid_col,
+                'comm3': comm3_col, 'comm3_mid': comm3_mid_col,
+            }
+            results = engine.compare_with_reader(columns, data_start, self.alden_qc_reader)
+            
+            notes = results['mr_notes']
+            logging.info(f"Alden QC comparison complete: {notes['matches']} matches, {notes['mismatches']} mismatches, {results['not_found']} poles not found")
+            for field, label in QCComparisonEngine.FIELD_LABELS.items():
+                if field in results:
+                    logging.info(f"{label}: {results[field]['matches']} matches, {results[field]['mismatches']} mismatches")
             
         except Exception as e:
             logging.error(f"Error during Alden QC comparison: {e}")
             import traceback
             logging.error(traceback.format_exc())
     
-    def _compare_metronet_attachment_height(self, alden_sheet, row_idx, pole_str, col_idx, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare MetroNet attachment height from template with QC data
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_metronet_attachment_height(pole_str)
-            
-            if not qc_value:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: MetroNet attachment height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # If template is in Alden format (e.g., "22ft 1in"), convert QC to same format if needed
-            # If template is in decimal, convert both to decimal
-            # For now, do simple string comparison
-            if template_str == qc_str:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                logging.debug(f"Pole {pole_str}: MetroNet attachment height match '{template_str}'")
-                return {'matches': 1, 'mismatches': 0}
-            else:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: MetroNet attachment height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing MetroNet attachment height for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_metronet_midspan_height(self, alden_sheet, row_idx, pole_str, col_idx, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare MetroNet midspan height from template with QC data
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_metronet_midspan_height(pole_str)
-            
-            if not qc_value:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: MetroNet midspan height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # For multiple midspan values (comma-separated), check if any match
-            if ',' in qc_str:
-                qc_values = [v.strip() for v in qc_str.split(',')]
-                # Check if template value matches any of the QC values
-                if template_str in qc_values:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: MetroNet midspan height match '{template_str}' (QC: {qc_str})")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: MetroNet midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            else:
-                # Single value comparison
-                if template_str == qc_str:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: MetroNet midspan height match '{template_str}'")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: MetroNet midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing MetroNet midspan height for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_power_attachment_height(self, alden_sheet, row_idx, pole_str, col_idx, match_fill, mismatch_fill, street_light_col=None, data_reader=None):
-        """
-        Compare Power attachment height from template with QC data
-        Includes Street Light if it's lower than Power height for comparison
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_power_attachment_height(pole_str)
-            
-            if not qc_value:
-                # No QC data available, skip but log it for debugging
-                logging.debug(f"Pole {pole_str}: No QC power attachment height data available (skipping comparison)")
-                return None
-            
-            # Check if Street Light exists and is lower than Power
-            effective_template_value = template_value
-            if street_light_col:
-                street_light_value = alden_sheet.cell(row=row_idx, column=street_light_col).value
-                if street_light_value:
-                    try:
-                        # Convert both heights to decimal for comparison
-                        template_decimal = Utils.parse_height_decimal(str(template_value).strip()) if template_value else None
-                        street_light_decimal = Utils.parse_height_decimal(str(street_light_value).strip())
-                        
-                        if template_decimal and street_light_decimal and street_light_decimal > 0:
-                            # Use Street Light if it's lower
-                            if street_light_decimal < template_decimal:
-                                effective_template_value = street_light_value
-                                logging.debug(f"Pole {pole_str}: Using Street Light height {street_light_value} instead of Power {template_value} for comparison")
-                    except Exception as e:
-                        logging.debug(f"Error comparing Street Light height: {e}")
-            
-            if not effective_template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Power attachment height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(effective_template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # If template is in Alden format (e.g., "22ft 1in"), convert QC to same format if needed
-            # If template is in decimal, convert both to decimal
-            # For now, do simple string comparison
-            if template_str == qc_str:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                logging.debug(f"Pole {pole_str}: Power attachment height match '{template_str}'")
-                return {'matches': 1, 'mismatches': 0}
-            else:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Power attachment height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing Power attachment height for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_power_midspan_height(self, alden_sheet, row_idx, pole_str, col_idx, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare Power midspan height from template with QC data
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_power_midspan_height(pole_str)
-            
-            if not qc_value:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Power midspan height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # For multiple midspan values (comma-separated), check if any match
-            if ',' in qc_str:
-                qc_values = [v.strip() for v in qc_str.split(',')]
-                # Check if template value matches any of the QC values
-                if template_str in qc_values:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: Power midspan height match '{template_str}' (QC: {qc_str})")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: Power midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            else:
-                # Single value comparison
-                if template_str == qc_str:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: Power midspan height match '{template_str}'")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: Power midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing Power midspan height for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_power_type(self, alden_sheet, row_idx, pole_str, col_idx, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare Power Type from template with QC AttachmentType using substring matching
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_attachment_type = reader.get_power_attachment_type(pole_str)
-            
-            if not qc_attachment_type:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Power Type mismatch (template: empty vs QC: '{qc_attachment_type}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            template_str = str(template_value).strip()
-            qc_str = str(qc_attachment_type).strip()
-            
-            # Case-insensitive substring matching with intelligent keyword extraction
-            # Examples:
-            # - "Secondary Drip Loop" (template) matches "Secondary" (QC) → True
-            # - "Secondary" (template) matches "Power Secondary" (QC) → True
-            # - "Secondary Drip Loop" (template) matches "Power Secondary" (QC) → True
-            template_lower = template_str.lower()
-            qc_lower = qc_str.lower()
-            
-            # First check: simple substring matching (either contains the other)
-            is_match = (template_lower in qc_lower) or (qc_lower in template_lower)
-            
-            # Second check: extract base keywords and compare
-            # This handles cases like "Secondary Drip Loop" vs "Power Secondary"
-            # Both contain "Secondary" as a base keyword, so they should match
-            if not is_match:
-                import re
-                
-                # Get power keywords from config for base keyword extraction
-                power_keywords = self.config.get("power_keywords", [])
-                
-                # Extract words from both strings
-                template_words = set(re.findall(r'\b\w+\b', template_lower))
-                qc_words = set(re.findall(r'\b\w+\b', qc_lower))
-                
-                # Check if any power keyword matches between template and QC
-                # Normalize power keywords to lowercase for comparison
-                normalized_power_keywords = {kw.strip().lower() for kw in power_keywords if kw.strip()}
-                
-                # Find matching power keywords in both template and QC
-                template_keywords = template_words.intersection(normalized_power_keywords)
-                qc_keywords = qc_words.intersection(normalized_power_keywords)
-                
-                # If they share any power keyword, it's a match
-                if template_keywords and qc_keywords:
-                    is_match = len(template_keywords.intersection(qc_keywords)) > 0
-                
-                # Fallback: word boundary matching
-                if not is_match:
-                    template_word = r'\b' + re.escape(template_lower) + r'\b'
-                    qc_word = r'\b' + re.escape(qc_lower) + r'\b'
-                    is_match = (re.search(template_word, qc_lower) is not None) or (re.search(qc_word, template_lower) is not None)
-            
-            if is_match:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                logging.debug(f"Pole {pole_str}: Power Type match (template: '{template_str}' vs QC: '{qc_str}')")
-                return {'matches': 1, 'mismatches': 0}
-            else:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Power Type mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                return {'matches': 0, 'mismatches': 1}
-                
-        except Exception as e:
-            logging.error(f"Error comparing Power Type for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_comm_attachment_height(self, alden_sheet, row_idx, pole_str, col_idx, comm_number, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare communication attachment height from template with QC data
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_comm_attachment_height(pole_str, comm_number)
-            
-            if not qc_value:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Comm{comm_number} attachment height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # If template is in Alden format (e.g., "22ft 1in"), convert QC to same format if needed
-            # If template is in decimal, convert both to decimal
-            # For now, do simple string comparison
-            if template_str == qc_str:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                logging.debug(f"Pole {pole_str}: Comm{comm_number} attachment height match '{template_str}'")
-                return {'matches': 1, 'mismatches': 0}
-            else:
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Comm{comm_number} attachment height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing Comm{comm_number} attachment height for pole {pole_str}: {e}")
-            return None
-    
-    def _compare_comm_midspan_height(self, alden_sheet, row_idx, pole_str, col_idx, comm_number, match_fill, mismatch_fill, data_reader=None):
-        """
-        Compare communication midspan height from template with QC data
-        
-        Returns:
-            dict: {'matches': count, 'mismatches': count} or None if no comparison done
-        """
-        try:
-            from .utils import Utils
-            
-            # Use provided data_reader or fall back to self.alden_qc_reader
-            reader = data_reader if data_reader else self.alden_qc_reader
-            
-            template_value = alden_sheet.cell(row=row_idx, column=col_idx).value
-            qc_value = reader.get_comm_midspan_height(pole_str, comm_number)
-            
-            if not qc_value:
-                # No QC data available, skip
-                return None
-            
-            if not template_value:
-                # Template has no value but QC does - mismatch
-                alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                logging.debug(f"Pole {pole_str}: Comm{comm_number} midspan height mismatch (template: empty vs QC: '{qc_value}')")
-                return {'matches': 0, 'mismatches': 1}
-            
-            # Convert both to comparable format
-            template_str = str(template_value).strip()
-            qc_str = str(qc_value).strip()
-            
-            # For multiple midspan values (comma-separated), check if any match
-            if ',' in qc_str:
-                qc_values = [v.strip() for v in qc_str.split(',')]
-                # Check if template value matches any of the QC values
-                if template_str in qc_values:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: Comm{comm_number} midspan height match '{template_str}' (QC: {qc_str})")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: Comm{comm_number} midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            else:
-                # Single value comparison
-                if template_str == qc_str:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = match_fill
-                    logging.debug(f"Pole {pole_str}: Comm{comm_number} midspan height match '{template_str}'")
-                    return {'matches': 1, 'mismatches': 0}
-                else:
-                    alden_sheet.cell(row=row_idx, column=col_idx).fill = mismatch_fill
-                    logging.debug(f"Pole {pole_str}: Comm{comm_number} midspan height mismatch (template: '{template_str}' vs QC: '{qc_str}')")
-                    return {'matches': 0, 'mismatches': 1}
-            
-        except Exception as e:
-            logging.error(f"Error comparing Comm{comm_number} midspan height for pole {pole_str}: {e}")
-            return None
-
     def _populate_from_alden_sheet(self, workbook):
         """
         Create and populate 'From Alden' sheet with data from Alden file
@@ -4150,10 +3807,10 @@ class PoleDataProcessor:
             header_row = None
             template_headers = {}  # Map header name to column index
             
-            for row_num in [1, 2, 3]:
+            schema = self._get_template_schema(from_alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(from_alden_sheet):
                 headers_found = {}
-                for col_idx in range(1, min(from_alden_sheet.max_column + 1, 100)):
-                    cell_value = from_alden_sheet.cell(row=row_num, column=col_idx).value
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         # Normalize header text for matching
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip()
@@ -4225,6 +3882,7 @@ class PoleDataProcessor:
                 
                 rows_written += 1
             
+            schema.invalidate(sheet_name, data_start_row)
             logging.info(f"Successfully populated '{sheet_name}' sheet with {rows_written} rows from Alden file (only exact matching columns)")
             
         except Exception as e:
@@ -4286,16 +3944,8 @@ class PoleDataProcessor:
             alden_sheet: openpyxl worksheet for 'Alden' sheet
         """
         try:
-            import re
-            from openpyxl.styles import PatternFill
-            
             logging.info("Comparing 'From Alden' sheet with 'Alden' sheet to show equivalent highlighting")
             
-            # Define fill colors (same as Alden sheet comparison)
-            match_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Green
-            mismatch_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Red
-            not_found_fill = PatternFill(start_color="B3D9FF", end_color="B3D9FF", fill_type="solid")  # Blue
-            
             # Build lookup from Alden sheet: pole+company -> data
             alden_data = self._build_alden_sheet_lookup(alden_sheet)
             
@@ -4309,9 +3959,9 @@ class PoleDataProcessor:
             status_col = None  # Status
             detected_header_row = None
             
-            for row_num in [1, 2, 3]:
-                for col_idx in range(1, min(from_alden_sheet.max_column + 1, 100)):
-                    cell_value = from_alden_sheet.cell(row=row_num, column=col_idx).value
+            schema = self._get_template_schema(from_alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(from_alden_sheet):
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = str(cell_value).strip()
                         
@@ -4345,16 +3995,9 @@ class PoleDataProcessor:
             data_start = detected_header_row + 1 if detected_header_row else 2
             max_row = from_alden_sheet.max_row
             
-            # Group rows by pole to compare against consolidated Alden sheet data
-            # Alden sheet has one row per pole, but From Alden has multiple rows per pole (one per company/attachment)
-            poles_processed = set()
-            total_comparisons = 0
-            matches = 0
-            mismatches = 0
-            not_found = 0
-            skipped_not_in_field = 0
-            
-            logging.info(f"Starting row-by-row comparison - data rows {data_start} to {max_row}")
+            # From Alden has several rows per pole (one per company/attachment); the Alden
+            # sheet has one consolidated row per pole
+            logging.info(f"Starting row-by-row comparison - data rows {data_start} to {from_alden_sheet.max_row}")
             
             # Log sample of what we're comparing against
             if alden_data:
@@ -4362,184 +4005,14 @@ class PoleDataProcessor:
                 sample_data = alden_data[sample_pole]
                 logging.info(f"Sample Alden data for pole {sample_pole}: {list(sample_data.keys())}")
             
-            for row_idx in range(data_start, max_row + 1):
-                pole_value = from_alden_sheet.cell(row=row_idx, column=pole_col).value
-                if not pole_value:
-                    continue
-                
-                pole_str = str(pole_value).strip()
-                pole_normalized = self._normalize_pole_number(pole_str)
-                
-                # Log first occurrence of each pole
-                if pole_normalized not in poles_processed:
-                    poles_processed.add(pole_normalized)
-                    if len(poles_processed) <= 3:
-                        logging.info(f"  Processing pole {pole_str} (normalized: {pole_normalized})")
-                
-                # Check if pole exists in Alden sheet
-                if pole_normalized not in alden_data:
-                    not_found += 1
-                    from_alden_sheet.cell(row=row_idx, column=pole_col).fill = not_found_fill
-                    if len(poles_processed) <= 3:
-                        logging.info(f"    Row {row_idx}: Pole {pole_str} NOT found in Alden sheet (blue)")
-                    continue
-                
-                alden_pole_data = alden_data[pole_normalized]
-                
-                # Compare available fields
-                # MR Notes comparison (case-insensitive)
-                if mr_notes_col:
-                    from_alden_value = from_alden_sheet.cell(row=row_idx, column=mr_notes_col).value
-                    from_alden_notes = str(from_alden_value).strip() if from_alden_value else ""
-                    
-                    # Extract text after colon
-                    if ':' in from_alden_notes:
-                        from_alden_notes = from_alden_notes.split(':', 1)[1].strip()
-                    
-                    alden_notes = alden_pole_data.get('mr_notes', '')
-                    
-                    # Case-insensitive comparison
-                    if from_alden_notes.lower() == alden_notes.lower():
-                        from_alden_sheet.cell(row=row_idx, column=mr_notes_col).fill = match_fill
-                        matches += 1
-                    elif from_alden_notes or alden_notes:
-                        from_alden_sheet.cell(row=row_idx, column=mr_notes_col).fill = mismatch_fill
-                        mismatches += 1
-                    
-                    total_comparisons += 1
-                
-                # Get company and status for this row (needed for both height and midspan)
-                company = ""
-                if company_col:
-                    company = from_alden_sheet.cell(row=row_idx, column=company_col).value
-                    company = str(company).strip() if company else ""
-                
-                status = ""
-                if status_col:
-                    status = from_alden_sheet.cell(row=row_idx, column=status_col).value
-                    status = str(status).strip() if status else ""
-                
-                # Skip height and midspan comparison if Status = 'Not in Field' (case-insensitive)
-                skip_height_comparison = status.lower() == 'not in field'
-                
-                if skip_height_comparison:
-                    skipped_not_in_field += 1
-                    if len(poles_processed) <= 2:
-                        logging.info(f"    Row {row_idx}: Skipping height/midspan comparison (Status = 'Not in Field')")
-                
-                # Height comparison - map to appropriate field based on CompanyName (case-insensitive)
-                # Skip if Status = 'Not in Field'
-                if height_col and company and not skip_height_comparison:
-                    from_alden_height = from_alden_sheet.cell(row=row_idx, column=height_col).value
-                    from_alden_height_str = str(from_alden_height).strip() if from_alden_height else ""
-                    
-                    if from_alden_height_str and from_alden_height_str.lower() != 'nan':
-                        # Compare based on company (case-insensitive)
-                        found_match = False
-                        
-                        if "metronet fiber llc" in company.lower():
-                            alden_height = alden_pole_data.get('metro_attach', '')
-                            if alden_height and from_alden_height_str.lower() == alden_height.lower():
-                                from_alden_sheet.cell(row=row_idx, column=height_col).fill = match_fill
-                                matches += 1
-                                found_match = True
-                            elif alden_height:
-                                from_alden_sheet.cell(row=row_idx, column=height_col).fill = mismatch_fill
-                                mismatches += 1
-                                found_match = True
-                        elif "xcel energy" in company.lower():
-                            alden_height = alden_pole_data.get('power_attach', '')
-                            if alden_height and from_alden_height_str.lower() == alden_height.lower():
-                                from_alden_sheet.cell(row=row_idx, column=height_col).fill = match_fill
-                                matches += 1
-                                found_match = True
-                            elif alden_height:
-                                from_alden_sheet.cell(row=row_idx, column=height_col).fill = mismatch_fill
-                                mismatches += 1
-                                found_match = True
-                        else:
-                            # Check against comm columns for other companies
-                            comm_heights = [
-                                alden_pole_data.get('comm1_attach', ''),
-                                alden_pole_data.get('comm2_attach', ''),
-                                alden_pole_data.get('comm3_attach', '')
-                            ]
-                            comm_heights = [h for h in comm_heights if h and h.lower() != 'nan']
-                            
-                            if comm_heights:
-                                if any(from_alden_height_str.lower() == h.lower() for h in comm_heights):
-                                    from_alden_sheet.cell(row=row_idx, column=height_col).fill = match_fill
-                                    matches += 1
-                                    found_match = True
-                                    if len(poles_processed) <= 2:
-                                        logging.info(f"    Row {row_idx}: Height {from_alden_height_str} MATCHED in comm columns for company '{company}'")
-                                else:
-                                    from_alden_sheet.cell(row=row_idx, column=height_col).fill = mismatch_fill
-                                    mismatches += 1
-                                    found_match = True
-                                    if len(poles_processed) <= 2:
-                                        logging.info(f"    Row {row_idx}: Height {from_alden_height_str} MISMATCH for company '{company}' (comm heights: {comm_heights})")
-                        
-                        if found_match:
-                            total_comparisons += 1
-                
-                # MidSpan comparison - map to appropriate field based on CompanyName (case-insensitive)
-                # Skip if Status = 'Not in Field'
-                if midspan_col and company and not skip_height_comparison:
-                    from_alden_midspan = from_alden_sheet.cell(row=row_idx, column=midspan_col).value
-                    from_alden_midspan_str = str(from_alden_midspan).strip() if from_alden_midspan else ""
-                    
-                    if from_alden_midspan_str and from_alden_midspan_str.lower() != 'nan':
-                        # Compare based on company (case-insensitive)
-                        found_match = False
-                        
-                        if "metronet fiber llc" in company.lower():
-                            alden_midspan = alden_pole_data.get('metro_mid', '')
-                            if alden_midspan and from_alden_midspan_str.lower() == alden_midspan.lower():
-                                from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = match_fill
-                                matches += 1
-                                found_match = True
-                            elif alden_midspan:
-                                from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = mismatch_fill
-                                mismatches += 1
-                                found_match = True
-                        elif "xcel energy" in company.lower():
-                            alden_midspan = alden_pole_data.get('power_mid', '')
-                            if alden_midspan and from_alden_midspan_str.lower() == alden_midspan.lower():
-                                from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = match_fill
-                                matches += 1
-                                found_match = True
-                            elif alden_midspan:
-                                from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = mismatch_fill
-                                mismatches += 1
-                                found_match = True
-                        else:
-                            # Check against comm midspan columns for other companies
-                            comm_midspans = [
-                                alden_pole_data.get('comm1_mid', ''),
-                                alden_pole_data.get('comm2_mid', ''),
-                                alden_pole_data.get('comm3_mid', '')
-                            ]
-                            comm_midspans = [m for m in comm_midspans if m and m.lower() != 'nan']
-                            
-                            if comm_midspans:
-                                if any(from_alden_midspan_str.lower() == m.lower() for m in comm_midspans):
-                                    from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = match_fill
-                                    matches += 1
-                                    found_match = True
-                                    if len(poles_processed) <= 2:
-                                        logging.info(f"    Row {row_idx}: MidSpan {from_alden_midspan_str} MATCHED in comm columns for company '{company}'")
-                                else:
-                                    from_alden_sheet.cell(row=row_idx, column=midspan_col).fill = mismatch_fill
-                                    mismatches += 1
-                                    found_match = True
-                                    if len(poles_processed) <= 2:
-                                        logging.info(f"    Row {row_idx}: MidSpan {from_alden_midspan_str} MISMATCH for company '{company}' (comm midspans: {comm_midspans})")
-                        
-                        if found_match:
-                            total_comparisons += 1
+            engine = QCComparisonEngine(from_alden_sheet)
+            columns = {
+                'pole': pole_col, 'mr_notes': mr_notes_col, 'company': company_col,
+                'height': height_col, 'midspan': midspan_col, 'status': status_col,
+            }
+            results = engine.compare_rows_with_lookup(columns, data_start, alden_data, self._normalize_pole_number)
             
-            logging.info(f"'From Alden' comparison complete: {total_comparisons} field comparisons ({matches} matches, {mismatches} mismatches), {len(poles_processed)} unique poles processed, {not_found} rows with pole not found, {skipped_not_in_field} rows skipped (Status='Not in Field')")
+            logging.info(f"'From Alden' comparison complete: {results['total_comparisons']} field comparisons ({results['matches']} matches, {results['mismatches']} mismatches), {len(results['poles'])} unique poles processed, {results['not_found']} rows with pole not found, {results['skipped_not_in_field']} rows skipped (Status='Not in Field')")
             
         except Exception as e:
             logging.error(f"Error applying From Alden QC comparison: {e}")
@@ -4573,9 +4046,9 @@ class PoleDataProcessor:
             col_map = {}
             header_row = None
             
-            for row_num in [1, 2, 3]:
-                for col_idx in range(1, min(from_alden_sheet.max_column + 1, 100)):
-                    cell_value = from_alden_sheet.cell(row=row_num, column=col_idx).value
+            schema = self._get_template_schema(from_alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(from_alden_sheet):
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = str(cell_value).strip()
                         col_map[header_text] = col_idx
@@ -4822,9 +4295,9 @@ class PoleDataProcessor:
             comm3_mid_col = None
             header_row = None
             
-            for row_num in [1, 2, 3]:
-                for col_idx in range(1, min(alden_sheet.max_column + 1, 100)):
-                    cell_value = alden_sheet.cell(row=row_num, column=col_idx).value
+            schema = self._get_template_schema(alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(alden_sheet):
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip().lower()
                         if 'pole' in header_text and col_idx == 1:
@@ -4941,9 +4414,9 @@ class PoleDataProcessor:
             header_row = None
             
             # Find header row and columns
-            for row_num in [1, 2, 3]:
-                for col_idx in range(1, min(alden_sheet.max_column + 1, 100)):
-                    cell_value = alden_sheet.cell(row=row_num, column=col_idx).value
+            schema = self._get_template_schema(alden_sheet.parent)
+            for row_num, header_cells in schema.header_rows(alden_sheet):
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip().lower()
                         if 'pole' in header_text and col_idx == 1:
@@ -5097,7 +4570,6 @@ class PoleDataProcessor:
         """
         try:
             import re
-            from openpyxl.styles import PatternFill
             
             logging.info(f"Applying comparison to '{sheet_name}' sheet")
             
@@ -5118,10 +4590,10 @@ class PoleDataProcessor:
             comm3_mid_col = None
             detected_header_row = None
             
-            for row_num in [1, 2, 3]:
+            schema = self._get_template_schema(sheet.parent)
+            for row_num, header_cells in schema.header_rows(sheet):
                 headers_found = []
-                for col_idx in range(1, min(sheet.max_column + 1, 100)):
-                    cell_value = sheet.cell(row=row_num, column=col_idx).value
+                for col_idx, cell_value in header_cells:
                     if cell_value:
                         header_text = re.sub(r"\s+", " ", str(cell_value).replace("\n", " ")).strip().lower()
                         headers_found.append((col_idx, header_text))
@@ -5177,104 +4649,20 @@ class PoleDataProcessor:
             
             # Find data range
             data_start = detected_header_row + 1 if detected_header_row else 2
-            max_row = sheet.max_row
-            
-            # Define fill colors
-            match_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            mismatch_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-            not_found_fill = PatternFill(start_color="B3D9FF", end_color="B3D9FF", fill_type="solid")
-            
-            matches = 0
-            mismatches = 0
-            not_found = 0
-            
-            logging.info(f"Starting comparison for '{sheet_name}' - data rows {data_start} to {max_row}")
-            
-            # Compare each data row
-            for row_idx in range(data_start, max_row + 1):
-                pole_value = sheet.cell(row=row_idx, column=pole_col).value
-                if not pole_value:
-                    continue
-                
-                pole_str = str(pole_value).strip()
-                
-                # Log first few rows for debugging
-                if row_idx <= data_start + 2:
-                    logging.info(f"  Row {row_idx}: Pole={pole_str}")
-                
-                # Check if pole exists in data reader
-                if not data_reader.has_pole(pole_str):
-                    not_found += 1
-                    sheet.cell(row=row_idx, column=pole_col).fill = not_found_fill
-                    if row_idx <= data_start + 2:
-                        logging.info(f"    -> Pole {pole_str} NOT found in reference data (blue)")
-                    continue
-                
-                if row_idx <= data_start + 2:
-                    logging.info(f"    -> Pole {pole_str} found, comparing...")
-                
-                # Compare MR Notes
-                reader_mr_notes = data_reader.get_mr_notes(pole_str)
-                sheet_mr_notes_value = sheet.cell(row=row_idx, column=mr_notes_col).value
-                sheet_mr_notes = str(sheet_mr_notes_value).strip() if sheet_mr_notes_value else ""
-                
-                # Extract text after colon from sheet value
-                if ':' in sheet_mr_notes:
-                    sheet_mr_notes = sheet_mr_notes.split(':', 1)[1].strip()
-                
-                if sheet_mr_notes == reader_mr_notes:
-                    sheet.cell(row=row_idx, column=mr_notes_col).fill = match_fill
-                    matches += 1
-                else:
-                    sheet.cell(row=row_idx, column=mr_notes_col).fill = mismatch_fill
-                    mismatches += 1
-                
-                # Compare other fields using existing helper methods
-                if metro_attach_col:
-                    self._compare_metronet_attachment_height(
-                        sheet, row_idx, pole_str, metro_attach_col, match_fill, mismatch_fill, data_reader)
-                
-                if metro_mid_col:
-                    self._compare_metronet_midspan_height(
-                        sheet, row_idx, pole_str, metro_mid_col, match_fill, mismatch_fill, data_reader)
-                
-                if power_attach_col:
-                    self._compare_power_attachment_height(
-                        sheet, row_idx, pole_str, power_attach_col, match_fill, mismatch_fill, street_light_col, data_reader)
-                
-                if power_mid_col:
-                    self._compare_power_midspan_height(
-                        sheet, row_idx, pole_str, power_mid_col, match_fill, mismatch_fill, data_reader)
-                
-                if power_type_col:
-                    self._compare_power_type(
-                        sheet, row_idx, pole_str, power_type_col, match_fill, mismatch_fill, data_reader)
-                
-                if comm1_col:
-                    self._compare_comm_attachment_height(
-                        sheet, row_idx, pole_str, comm1_col, 1, match_fill, mismatch_fill, data_reader)
-                
-                if comm2_col:
-                    self._compare_comm_attachment_height(
-                        sheet, row_idx, pole_str, comm2_col, 2, match_fill, mismatch_fill, data_reader)
-                
-                if comm3_col:
-                    self._compare_comm_attachment_height(
-                        sheet, row_idx, pole_str, comm3_col, 3, match_fill, mismatch_fill, data_reader)
-                
-                if comm1_mid_col:
-                    self._compare_comm_midspan_height(
-                        sheet, row_idx, pole_str, comm1_mid_col, 1, match_fill, mismatch_fill, data_reader)
-                
-                if comm2_mid_col:
-                    self._compare_comm_midspan_height(
-                        sheet, row_idx, pole_str, comm2_mid_col, 2, match_fill, mismatch_fill, data_reader)
-                
-                if comm3_mid_col:
-                    self._compare_comm_midspan_height(
-                        sheet, row_idx, pole_str, comm3_mid_col, 3, match_fill, mismatch_fill, data_reader)
+            logging.info(f"Starting comparison for '{sheet_name}' - data rows {data_start} to {sheet.max_row}")
+            
+            engine = QCComparisonEngine(sheet, self.config.get("power_keywords", []))
+            columns = {
+                'pole': pole_col, 'mr_notes': mr_notes_col, 'street_light': street_light_col,
+                'metro_attach': metro_attach_col, 'metro_mid': metro_mid_col,
+                'power_attach': power_attach_col, 'power_mid': power_mid_col, 'power_type': power_type_col,
+                'comm1': comm1_col, 'comm1_mid': comm1_mid_col, 'comm2': comm2_col, 'comm2_mid': comm2_mid_col,
+                'comm3': comm3_col, 'comm3_mid': comm3_mid_col,
+            }
+            results = engine.compare_with_reader(columns, data_start, data_reader)
             
-            logging.info(f"'{sheet_name}' comparison complete: {matches} matches, {mismatches} mismatches, {not_found} poles not found")
+            notes = results['mr_notes']
+            logging.info(f"'{sheet_name}' comparison complete: {notes['matches']} matches, {notes['mismatches']} mismatches, {results['not_found']} poles not found")
             
         except Exception as e:
             logging.error(f"Error applying comparison to '{sheet_name}' sheet: {e}")
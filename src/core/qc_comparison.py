@@ -0,0 +1,330 @@
+import logging
+import re
+
+import pandas as pd
+from openpyxl.styles import PatternFill
+
+from .utils import Utils
+
+# Shared highlight styles: every compared cell points at the same fill entry
+MATCH_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
+MISMATCH_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
+NOT_FOUND_FILL = PatternFill(start_color="B3D9FF", end_color="B3D9FF", fill_type="solid")  # Light blue
+
+
+class QCComparisonEngine:
+    """
+    Column-at-a-time QC comparison and highlighting for one worksheet
+
+    The sheet's pole, notes and height columns are read once into a DataFrame, the QC
+    source is looked up once per pole and aligned to the sheet rows, and match/mismatch
+    masks are computed per column. Fills are then applied in bulk from the shared
+    MATCH_FILL / MISMATCH_FILL / NOT_FOUND_FILL styles.
+    """
+
+    # Field -> (comparison kind, reader getter, comm number), in highlighting order
+    READER_FIELDS = {
+        'metro_attach': ('exact', 'get_metronet_attachment_height', None),
+        'metro_mid': ('midspan', 'get_metronet_midspan_height', None),
+        'power_attach': ('power_attach', 'get_power_attachment_height', None),
+        'power_mid': ('midspan', 'get_power_midspan_height', None),
+        'power_type': ('power_type', 'get_power_attachment_type', None),
+        'comm1': ('exact', 'get_comm_attachment_height', 1),
+        'comm1_mid': ('midspan', 'get_comm_midspan_height', 1),
+        'comm2': ('exact', 'get_comm_attachment_height', 2),
+        'comm2_mid': ('midspan', 'get_comm_midspan_height', 2),
+        'comm3': ('exact', 'get_comm_attachment_height', 3),
+        'comm3_mid': ('midspan', 'get_comm_midspan_height', 3),
+    }
+
+    # Summary labels used when logging per-field results
+    FIELD_LABELS = {
+        'metro_attach': "MetroNet Attachment heights",
+        'metro_mid': "MetroNet Midspan heights",
+        'power_attach': "Power Attachment heights",
+        'power_mid': "Power Midspan heights",
+        'power_type': "Power Type",
+        'comm1': "Comm1 Attachment heights",
+        'comm1_mid': "Comm1 Midspan heights",
+        'comm2': "Comm2 Attachment heights",
+        'comm2_mid': "Comm2 Midspan heights",
+        'comm3': "Comm3 Attachment heights",
+        'comm3_mid': "Comm3 Midspan heights",
+    }
+
+    def __init__(self, sheet, power_keywords=None):
+        self.sheet = sheet
+        self.power_keywords = power_keywords or []
+
+    @staticmethod
+    def cell_text(values):
+        """str(value).strip() for truthy cell values, "" otherwise"""
+        return pd.Series([str(value).strip() if value else "" for value in values], index=values.index, dtype=object)
+
+    @staticmethod
+    def notes_after_colon(notes):
+        """Text after the first colon of each note (whole note when it has none)"""
+        has_colon = notes.str.contains(':', regex=False)
+        return notes.where(~has_colon, notes.str.split(':', n=1).str[1].str.strip())
+
+    def read_columns(self, columns, first_row, last_row=None):
+        """
+        Read raw cell values of the given columns for a block of rows
+
+        Args:
+            columns: Dictionary of field name -> 1-based column index (None entries are skipped)
+            first_row: First data row
+            last_row: Last data row (defaults to the sheet's max_row)
+
+        Returns:
+            DataFrame with a 'row' column and one object column per field
+        """
+        last_row = self.sheet.max_row if last_row is None else last_row
+        row_numbers = range(first_row, max(last_row + 1, first_row))
+        frame = pd.DataFrame({'row': row_numbers})
+        for name, col_idx in columns.items():
+            if not col_idx:
+                continue
+            values = [
+                row[0] for row in self.sheet.iter_rows(
+                    min_row=first_row, max_row=last_row, min_col=col_idx, max_col=col_idx, values_only=True
+                )
+            ] if len(row_numbers) else []
+            frame[name] = pd.Series(values, dtype=object)
+        return frame
+
+    def apply_fill(self, column, rows, fill):
+        """
+        Set one shared fill on a column's cells
+
+        Args:
+            column: 1-based column index
+            rows: Iterable of row numbers
+            fill: One of the shared fills
+        """
+        for row in rows:
+            self.sheet.cell(row=int(row), column=column).fill = fill
+
+    def apply_result(self, column, rows, matched):
+        """
+        Highlight compared cells green/red
+
+        Args:
+            column: 1-based column index
+            rows: Row numbers of the compared cells
+            matched: Boolean mask aligned with rows
+
+        Returns:
+            dict: {'matches': count, 'mismatches': count}
+        """
+        rows = pd.Series(rows).to_numpy()
+        matched = pd.Series(matched).to_numpy(dtype=bool)
+        self.apply_fill(column, rows[matched], MATCH_FILL)
+        self.apply_fill(column, rows[~matched], MISMATCH_FILL)
+        return {'matches': int(matched.sum()), 'mismatches': int((~matched).sum())}
+
+    def power_types_match(self, template_str, qc_str):
+        """
+        Case-insensitive power type match
+        - either contains the other ("Secondary Drip Loop" vs "Secondary")
+        - both share a configured power keyword ("Secondary Drip Loop" vs "Power Secondary")
+        - either appears as whole words in the other
+        """
+        template_lower = template_str.lower()
+        qc_lower = qc_str.lower()
+        if (template_lower in qc_lower) or (qc_lower in template_lower):
+            return True
+
+        template_words = set(re.findall(r'\b\w+\b', template_lower))
+        qc_words = set(re.findall(r'\b\w+\b', qc_lower))
+        normalized_power_keywords = {kw.strip().lower() for kw in self.power_keywords if kw.strip()}
+        template_keywords = template_words.intersection(normalized_power_keywords)
+        qc_keywords = qc_words.intersection(normalized_power_keywords)
+        if template_keywords and qc_keywords and template_keywords.intersection(qc_keywords):
+            return True
+
+        template_word = r'\b' + re.escape(template_lower) + r'\b'
+        qc_word = r'\b' + re.escape(qc_lower) + r'\b'
+        return (re.search(template_word, qc_lower) is not None) or (re.search(qc_word, template_lower) is not None)
+
+    def _reference_frame(self, poles, reader, fields):
+        """Look up the reader once per distinct pole: found flag, MR notes and each field's QC value (None when absent)"""
+        lookup = {}
+        for pole in pd.unique(poles):
+            if not reader.has_pole(pole):
+                lookup[pole] = (False, "") + (None,) * len(fields)
+                continue
+            values = []
+            for field in fields:
+                kind, getter, comm_number = self.READER_FIELDS[field]
+                value = getattr(reader, getter)(pole) if comm_number is None else getattr(reader, getter)(pole, comm_number)
+                values.append(str(value).strip() if value else None)
+            lookup[pole] = (True, reader.get_mr_notes(pole)) + tuple(values)
+        reference = pd.DataFrame.from_dict(lookup, orient='index', columns=['found', 'mr_notes', *fields])
+        return reference.reindex(poles.to_numpy()).set_axis(poles.index)
+
+    def compare_with_reader(self, columns, data_start, reader):
+        """
+        Compare a processed sheet (one row per pole) with a QC data reader
+
+        Args:
+            columns: Dictionary with 'pole', 'mr_notes', optional 'street_light' and any READER_FIELDS
+                     keys -> 1-based column index (None when the column is missing)
+            data_start: First data row
+            reader: Object with the alden_qc_reader interface (has_pole, get_mr_notes, get_*_height, ...)
+
+        Returns:
+            dict: {'mr_notes': counts, 'not_found': count, <field>: counts} where counts is
+                  {'matches': n, 'mismatches': n}
+        """
+        fields = [field for field in self.READER_FIELDS if columns.get(field)]
+        frame = self.read_columns(columns, data_start)
+        frame = frame[[bool(value) for value in frame['pole']]]
+        results = {'mr_notes': {'matches': 0, 'mismatches': 0}, 'not_found': 0}
+        results.update({field: {'matches': 0, 'mismatches': 0} for field in fields})
+        if frame.empty:
+            return results
+
+        poles = frame['pole'].map(lambda value: str(value).strip())
+        reference = self._reference_frame(poles, reader, fields)
+        found = reference['found'].astype(bool)
+
+        for row, pole, is_found in list(zip(frame['row'], poles, found))[:3]:
+            logging.info(f"  Row {row}: Pole={pole} {'found' if is_found else 'NOT found in reference data (blue)'}")
+
+        results['not_found'] = int((~found).sum())
+        self.apply_fill(columns['pole'], frame.loc[~found, 'row'], NOT_FOUND_FILL)
+        frame = frame[found]
+        reference = reference[found]
+        if frame.empty:
+            return results
+
+        notes = self.notes_after_colon(self.cell_text(frame['mr_notes']))
+        results['mr_notes'] = self.apply_result(columns['mr_notes'], frame['row'], notes == reference['mr_notes'])
+
+        for field in fields:
+            kind = self.READER_FIELDS[field][0]
+            compared = reference[field].notna()
+            qc_values = reference[field].fillna("")
+            template_values = frame[field]
+            if kind == 'power_attach' and columns.get('street_light'):
+                template_values = self._effective_power_values(template_values, frame['street_light'])
+
+            # No QC value: nothing to compare; empty template cell against a QC value: mismatch
+            template_text = self.cell_text(template_values)
+            has_template = pd.Series([bool(value) for value in template_values], index=template_values.index)
+
+            if kind == 'midspan':
+                matched = pd.Series([
+                    template in [part.strip() for part in qc.split(',')] if ',' in qc else template == qc
+                    for template, qc in zip(template_text, qc_values)
+                ], index=qc_values.index, dtype=bool)
+            elif kind == 'power_type':
+                pairs = {}
+                matched = pd.Series([
+                    pairs[(template, qc)] if (template, qc) in pairs
+                    else pairs.setdefault((template, qc), self.power_types_match(template, qc))
+                    for template, qc in zip(template_text, qc_values)
+                ], index=qc_values.index, dtype=bool)
+            else:
+                matched = template_text == qc_values
+
+            matched = matched & has_template
+            results[field] = self.apply_result(columns[field], frame.loc[compared, 'row'], matched[compared])
+        return results
+
+    @staticmethod
+    def _effective_power_values(power_values, street_light_values):
+        """Use the Street Light height where it is lower than the power height"""
+        power_text = QCComparisonEngine.cell_text(power_values)
+        street_light_text = QCComparisonEngine.cell_text(street_light_values)
+        power_decimal = Utils.parse_height_decimal_series(power_text.where(power_text != "", None))
+        street_light_decimal = Utils.parse_height_decimal_series(street_light_text.where(street_light_text != "", None))
+        power_decimal.index = power_values.index
+        street_light_decimal.index = power_values.index
+        lower = (
+            power_decimal.notna() & (power_decimal != 0)
+            & (street_light_decimal > 0) & (street_light_decimal < power_decimal)
+        )
+        return power_values.where(~lower, street_light_values)
+
+    def compare_rows_with_lookup(self, columns, data_start, lookup, normalize_pole):
+        """
+        Compare raw Alden rows (several per pole) with per-pole values from the Alden sheet
+
+        Heights/midspans are routed by CompanyName: MetroNet rows against the Metro columns,
+        Xcel rows against the Lowest Power columns and anything else against Comm1-3.
+        Rows with Status 'Not in Field' only get their MR notes compared.
+
+        Args:
+            columns: Dictionary with 'pole' and optional 'mr_notes', 'company', 'height',
+                     'midspan', 'status' -> 1-based column index
+            data_start: First data row
+            lookup: Dictionary normalized pole -> Alden sheet values (see _build_alden_sheet_lookup)
+            normalize_pole: Pole normalization function
+
+        Returns:
+            dict with matches, mismatches, total_comparisons, not_found, skipped_not_in_field
+            and the normalized poles seen (poles)
+        """
+        frame = self.read_columns(columns, data_start)
+        frame = frame[[bool(value) for value in frame['pole']]]
+        poles = frame['pole'].map(lambda value: normalize_pole(str(value).strip()))
+        results = {
+            'matches': 0, 'mismatches': 0, 'total_comparisons': 0,
+            'not_found': 0, 'skipped_not_in_field': 0, 'poles': list(dict.fromkeys(poles))
+        }
+        if frame.empty:
+            return results
+
+        found = poles.isin(list(lookup))
+        results['not_found'] = int((~found).sum())
+        self.apply_fill(columns['pole'], frame.loc[~found, 'row'], NOT_FOUND_FILL)
+        frame = frame[found]
+        if frame.empty:
+            return results
+        reference = pd.DataFrame.from_dict(lookup, orient='index').reindex(poles[found].to_numpy())
+        reference = reference.fillna("").set_axis(frame.index).apply(lambda column: column.str.lower())
+
+        def record(column, rows, matched):
+            counts = self.apply_result(column, rows, matched)
+            results['matches'] += counts['matches']
+            results['mismatches'] += counts['mismatches']
+            results['total_comparisons'] += counts['matches'] + counts['mismatches']
+
+        if columns.get('mr_notes'):
+            notes = self.notes_after_colon(self.cell_text(frame['mr_notes'])).str.lower()
+            equal = notes == reference['mr_notes']
+            differs = ~equal & ((notes != "") | (reference['mr_notes'] != ""))
+            record(columns['mr_notes'], frame.loc[equal | differs, 'row'], equal[equal | differs])
+            # Rows where both notes are empty still count as compared
+            results['total_comparisons'] += int((~(equal | differs)).sum())
+
+        company = self.cell_text(frame['company']).str.lower() if columns.get('company') else pd.Series("", index=frame.index)
+        status = self.cell_text(frame['status']).str.lower() if columns.get('status') else pd.Series("", index=frame.index)
+        not_in_field = status == 'not in field'
+        results['skipped_not_in_field'] = int(not_in_field.sum())
+        is_metronet = company.str.contains("metronet fiber llc", regex=False)
+        is_power = ~is_metronet & company.str.contains("xcel energy", regex=False)
+        is_comm = ~is_metronet & ~is_power
+
+        for field, metro_key, power_key, comm_keys in (
+            ('height', 'metro_attach', 'power_attach', ('comm1_attach', 'comm2_attach', 'comm3_attach')),
+            ('midspan', 'metro_mid', 'power_mid', ('comm1_mid', 'comm2_mid', 'comm3_mid')),
+        ):
+            if not columns.get(field):
+                continue
+            value = self.cell_text(frame[field]).str.lower()
+            eligible = (company != "") & ~not_in_field & (value != "") & (value != 'nan')
+            # MetroNet/Xcel rows compare against one value; others against any non-empty comm value
+            single_reference = reference[metro_key].where(is_metronet, reference[power_key])
+            single = eligible & (is_metronet | is_power) & (single_reference != "")
+            comm_valid = [(reference[key] != "") & (reference[key] != 'nan') for key in comm_keys]
+            comm_match = pd.Series(False, index=frame.index)
+            for key, valid in zip(comm_keys, comm_valid):
+                comm_match |= valid & (reference[key] == value)
+            multi = eligible & is_comm & pd.concat(comm_valid, axis=1).any(axis=1)
+            compared = single | multi
+            matched = (single & (value == single_reference)) | (multi & comm_match)
+            record(columns[field], frame.loc[compared, 'row'], matched[compared])
+        return results
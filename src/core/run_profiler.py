@@ -0,0 +1,232 @@
+import cProfile
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import psutil
+
+
+class MemorySampler:
+    """
+    Samples the resident memory of this process and its children (PDF workers) on a thread
+
+    Besides the overall peak, callers can open measurement windows (open_window/close_window)
+    to get the peak of a stretch of work; windows may overlap or nest.
+    """
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._windows = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _current_rss(self):
+        rss = self.process.memory_info().rss
+        for child in self.process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return rss
+
+    def sample(self):
+        """Take one sample now and fold it into the peak and every open window"""
+        rss = self._current_rss()
+        with self._lock:
+            self.peak_rss = max(self.peak_rss, rss)
+            for window in self._windows:
+                window['peak_rss'] = max(window['peak_rss'], rss)
+        return rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                pass
+
+    def start(self):
+        self.start_rss = self.peak_rss = self._current_rss()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.sample()
+
+    def open_window(self):
+        """Start tracking the peak of a stretch of work; returns the window to pass to close_window"""
+        rss = self._current_rss()
+        window = {'start_rss': rss, 'peak_rss': rss}
+        with self._lock:
+            self.peak_rss = max(self.peak_rss, rss)
+            self._windows.append(window)
+        return window
+
+    def close_window(self, window):
+        """Stop tracking a window (after a final sample) and return it"""
+        self.sample()
+        with self._lock:
+            self._windows.remove(window)
+        return window
+
+
+def process_cpu_seconds(process):
+    """User + system CPU of a process, including children it has waited for"""
+    times = process.cpu_times()
+    return (times.user + times.system
+            + getattr(times, 'children_user', 0.0) + getattr(times, 'children_system', 0.0))
+
+
+class RunProfiler:
+    """
+    Per-stage timing for one pipeline run
+
+    Each stage records wall time, CPU time (this process plus finished child processes), the
+    resident memory at its start and its peak (this process plus PDF workers) and any counts
+    the caller attaches, e.g. rows. A stage that runs more than once is accumulated under its
+    name. The optional cProfile dump covers the thread that calls start()/finish().
+
+    A disabled profiler measures nothing, so the pipeline can always wrap its stages.
+    """
+
+    def __init__(self, enabled=True, profile_file=None, sample_interval=0.1):
+        self.enabled = enabled
+        self.profile_file = profile_file if enabled else None
+        self.sample_interval = sample_interval
+        self.stages = {}
+        self.started_at = None
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.sampler = None
+        self._process = None
+        self._profile = None
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def start(self):
+        """Start the run clock, the memory sampler and, if requested, cProfile"""
+        if not self.enabled:
+            return
+        self.started_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._process = psutil.Process()
+        self.sampler = MemorySampler(self.sample_interval)
+        self.sampler.start()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = process_cpu_seconds(self._process)
+        if self.profile_file:
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as e:
+                # Another profiler is already active on this thread
+                logging.warning(f"cProfile not started: {e}")
+                self._profile = None
+
+    def finish(self):
+        """Stop measuring and write the cProfile dump, if one was requested"""
+        if not self.enabled or self.sampler is None:
+            return
+        if self._profile is not None:
+            self._profile.disable()
+            try:
+                self._profile.dump_stats(str(self.profile_file))
+            except Exception as e:
+                logging.warning(f"Could not write cProfile stats: {e}")
+            self._profile = None
+        self.wall_time = time.perf_counter() - self._wall_start
+        self.cpu_time = process_cpu_seconds(self._process) - self._cpu_start
+        self.sampler.stop()
+
+    @contextmanager
+    def stage(self, name, **counts):
+        """
+        Measure a pipeline stage
+
+        Args:
+            name: Stage name in the report
+            **counts: Initial counts (e.g. rows=...); more can be set on the yielded dict
+
+        Yields:
+            dict: Counts for the stage; keys set inside the block are added to the report
+        """
+        counts = dict(counts)
+        if not self.enabled or self.sampler is None:
+            yield counts
+            return
+
+        window = self.sampler.open_window()
+        wall_start = time.perf_counter()
+        cpu_start = process_cpu_seconds(self._process)
+        try:
+            yield counts
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = process_cpu_seconds(self._process) - cpu_start
+            self.sampler.close_window(window)
+
+            entry = self.stages.get(name)
+            if entry is None:
+                entry = {'name': name, 'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0,
+                         'start_rss': window['start_rss'], 'peak_rss': 0}
+                self.stages[name] = entry
+            entry['calls'] += 1
+            entry['wall_time'] += wall_time
+            entry['cpu_time'] += cpu_time
+            entry['peak_rss'] = max(entry['peak_rss'], window['peak_rss'])
+            for key, value in counts.items():
+                entry[key] = entry.get(key, 0) + value if isinstance(value, (int, float)) else value
+            logging.debug(f"Stage '{name}': {wall_time:.2f}s wall, {cpu_time:.2f}s CPU, "
+                          f"peak {window['peak_rss'] / 2**20:.1f} MB")
+
+    def report(self, **info):
+        """
+        Run report as a dictionary
+
+        Args:
+            **info: Extra top-level fields (job inputs, status, ...)
+
+        Returns:
+            dict: info fields, run totals and one entry per stage in the order they first ran
+        """
+        stages = []
+        for entry in self.stages.values():
+            stage = {key: value for key, value in entry.items() if key not in ('start_rss', 'peak_rss')}
+            stage['wall_time'] = round(entry['wall_time'], 3)
+            stage['cpu_time'] = round(entry['cpu_time'], 3)
+            stage['start_rss_mb'] = round(entry['start_rss'] / 2**20, 1)
+            stage['peak_rss_mb'] = round(entry['peak_rss'] / 2**20, 1)
+            stages.append(stage)
+
+        report = dict(info)
+        report.update(
+            started_at=self.started_at,
+            wall_time=round(self.wall_time, 3),
+            cpu_time=round(self.cpu_time, 3),
+            start_rss_mb=round(self.sampler.start_rss / 2**20, 1) if self.sampler else None,
+            peak_rss_mb=round(self.sampler.peak_rss / 2**20, 1) if self.sampler else None,
+            profile_file=str(self.profile_file) if self.profile_file else None,
+            stages=stages
+        )
+        return report
+
+    def log_summary(self):
+        """Log one line per stage, slowest first"""
+        logging.info(f"Stage timings ({self.wall_time:.2f}s total, peak {self.sampler.peak_rss / 2**20:.1f} MB):")
+        for entry in sorted(self.stages.values(), key=lambda e: e['wall_time'], reverse=True):
+            logging.info(f"  {entry['name']:<24}{entry['wall_time']:8.2f}s wall {entry['cpu_time']:8.2f}s CPU "
+                         f"peak {entry['peak_rss'] / 2**20:7.1f} MB")
+
+    def write_report(self, report_file, **info):
+        """Write the run report as JSON and return its path"""
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(**info), f, indent=2, default=str)
+        return report_file
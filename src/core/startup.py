@@ -0,0 +1,138 @@
+import importlib
+import json
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Modules that only the processing pipeline needs; none of them should be loaded before the window appears
+HEAVY_MODULES = ("numpy", "pandas", "openpyxl", "PyPDF2", "fitz", "psutil", "core.pole_data_processor")
+
+# Imported in the background once the window is up, dependencies first so the report shows what each one costs
+PREWARM_MODULES = ("numpy", "pandas", "openpyxl", "PyPDF2", "fitz", "core.job_runner")
+
+
+def get_base_directory():
+    """Get the base directory for the application (exe or script location)"""
+    if getattr(sys, 'frozen', False):
+        # Running as a PyInstaller bundle
+        return Path(sys.executable).parent
+    else:
+        # Running as a script - use the main script's directory
+        return Path(sys.argv[0]).resolve().parent
+
+
+def _process_age():
+    """Seconds since the process was created (includes the frozen build's unpacking), or None"""
+    try:
+        import psutil
+        return time.time() - psutil.Process().create_time()
+    except Exception:
+        return None
+
+
+class StartupReport:
+    """
+    Records what is imported before the window is first shown
+
+    Create it as early as possible; mark_first_paint() takes a snapshot of sys.modules once the
+    window is visible, and the prewarm timings are added when the background imports finish.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.initial_modules = set(sys.modules)
+        self.first_paint_time = None
+        self.process_age = None
+        self.first_paint_modules = []
+        self.prewarm_times = {}
+        self.prewarm_time = None
+
+    def mark_first_paint(self):
+        """Snapshot the loaded modules now that the window is on screen"""
+        self.first_paint_time = time.perf_counter() - self.start
+        # psutil is imported only after the snapshot so it does not show up as loaded before first paint
+        self.first_paint_modules = sorted(set(sys.modules) - self.initial_modules)
+        self.process_age = _process_age()
+        loaded = self.heavy_modules_at_first_paint()
+        logging.debug(f"Modules imported before first paint: {', '.join(self.first_paint_modules)}")
+        logging.info(f"Window shown in {self.first_paint_time:.2f}s"
+                     + (f" ({self.process_age:.2f}s since process start)" if self.process_age is not None else "")
+                     + f" with {len(self.first_paint_modules)} modules imported; heavy modules loaded: "
+                     + (", ".join(loaded) if loaded else "none"))
+
+    def heavy_modules_at_first_paint(self):
+        """HEAVY_MODULES (and their submodules) that were already imported at first paint"""
+        loaded = set(self.initial_modules) | set(self.first_paint_modules)
+        return [name for name in HEAVY_MODULES
+                if name in loaded or any(module.startswith(name + ".") for module in loaded)]
+
+    def to_dict(self):
+        """Report contents (e.g. for a JSON dump)"""
+        return {
+            'first_paint_time': round(self.first_paint_time, 3) if self.first_paint_time is not None else None,
+            'process_age_at_first_paint': round(self.process_age, 3) if self.process_age is not None else None,
+            'heavy_modules_at_first_paint': self.heavy_modules_at_first_paint(),
+            'modules_at_first_paint': self.first_paint_modules,
+            'prewarm_time': round(self.prewarm_time, 3) if self.prewarm_time is not None else None,
+            'prewarm_times': {name: round(seconds, 3) for name, seconds in self.prewarm_times.items()}
+        }
+
+    def write(self, report_file):
+        """Write the report as JSON"""
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class ModulePrewarmer:
+    """
+    Imports the processing modules on a background thread
+
+    Importing is thread-safe, so code that needs one of the modules before the thread gets
+    to it simply imports it itself and waits on Python's import lock for that module only.
+    """
+
+    def __init__(self, modules=PREWARM_MODULES, report=None, report_file=None):
+        self.modules = tuple(modules)
+        self.report = report
+        self.report_file = report_file
+        self.ready = threading.Event()
+        self.errors = {}
+        self._thread = None
+
+    def start(self):
+        """Start importing in the background (no-op if already started)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="module-prewarm", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        """Block until every module has been imported; returns False on timeout"""
+        return self.ready.wait(timeout)
+
+    def _run(self):
+        start = time.perf_counter()
+        times = {}
+        for name in self.modules:
+            module_start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                # Optional dependencies (e.g. PyMuPDF) may be missing; the pipeline handles that itself
+                self.errors[name] = str(e)
+                logging.debug(f"Prewarm import of {name} failed: {e}")
+            times[name] = time.perf_counter() - module_start
+        total = time.perf_counter() - start
+
+        if self.report is not None:
+            self.report.prewarm_times = times
+            self.report.prewarm_time = total
+        logging.debug("Prewarm import times: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in times.items()))
+        logging.info(f"Processing modules loaded in the background in {total:.2f}s")
+        if self.report is not None and self.report_file:
+            try:
+                self.report.write(self.report_file)
+            except Exception as e:
+                logging.warning(f"Could not write startup report: {e}")
+        self.ready.set()
@@ -0,0 +1,471 @@
+import logging
+import os
+import posixpath
+import re
+import shutil
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from xml.sax.saxutils import escape, unescape
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+
+# Same characters openpyxl refuses to store in a cell
+_ILLEGAL_CHARACTERS = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+_ATTRIBUTE = re.compile(r"""([\w:]+)\s*=\s*(["'])(.*?)\2""", re.S)
+_CELL_REF = re.compile(r"^([A-Z]+)(\d+)$")
+_PACKAGE_RELS = "_rels/.rels"
+_CONTENT_TYPES = "[Content_Types].xml"
+
+
+class TemplatePatchError(Exception):
+    """Raised when a template sheet cannot be patched safely (the openpyxl engine should be used instead)"""
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _attributes(attr_text):
+    return {name: unescape(value, {'&quot;': '"', '&apos;': "'"}) for name, _, value in _ATTRIBUTE.findall(attr_text or "")}
+
+
+def _format_attributes(attrs):
+    return "".join(f' {name}="{escape(str(value), {chr(34): "&quot;"})}"' for name, value in attrs.items())
+
+
+class PatchedCell:
+    """Minimal stand-in for an openpyxl cell; assigning .value queues a write"""
+
+    def __init__(self, sheet, row, column):
+        self._sheet = sheet
+        self.row = row
+        self.column = column
+
+    @property
+    def value(self):
+        return self._sheet.get_value(self.row, self.column)
+
+    @value.setter
+    def value(self, value):
+        self._sheet.set_value(self.row, self.column, value)
+
+
+class PatchedWorksheet:
+    """
+    Worksheet view over a template sheet's XML
+
+    Supports the parts of the openpyxl worksheet API used to write results
+    (ws[row] for header rows, ws.cell(row, column[, value]) and cell.value).
+    Writes are queued and applied when the owning TemplatePatchWriter is saved.
+    """
+
+    def __init__(self, writer, title, part_name):
+        self._writer = writer
+        self.parent = writer
+        self.title = title
+        self.part_name = part_name
+        self.updates = {}  # row -> {column: value}
+        self._row_values = {}  # row -> {column: template value}, read on demand
+
+    def __getitem__(self, row):
+        values = self._template_row(row)
+        last_column = max(list(values) + list(self.updates.get(row, {})), default=0)
+        return tuple(PatchedCell(self, row, column) for column in range(1, last_column + 1))
+
+    def cell(self, row, column, value=None):
+        if row < 1 or column < 1:
+            raise ValueError("Row or column values must be at least 1")
+        cell = PatchedCell(self, row, column)
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def get_value(self, row, column):
+        if column in self.updates.get(row, {}):
+            return self.updates[row][column]
+        return self._template_row(row).get(column)
+
+    def set_value(self, row, column, value):
+        # Validate now so callers see the same errors openpyxl raises on assignment
+        if isinstance(value, str) and _ILLEGAL_CHARACTERS.search(value):
+            raise ValueError(f"{value!r} cannot be used in worksheets.")
+        if value is not None and not isinstance(value, (str, bool, int, float)):
+            raise ValueError(f"Cannot convert {value!r} to Excel")
+        self.updates.setdefault(row, {})[column] = value
+
+    def _template_row(self, row):
+        if row not in self._row_values:
+            self._row_values[row] = self._writer.read_row(self.part_name, row)
+        return self._row_values[row]
+
+
+class TemplatePatchWriter:
+    """
+    Writes values into a copied template by patching only the target sheets' XML
+
+    Unlike load_workbook/save, nothing outside the sheets that receive values is parsed:
+    styles, VBA, drawings and untouched sheets are copied through byte for byte, so write
+    time and memory follow the number of rows written rather than the size of the template.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = Path(file_path)
+        self._sheets = {}  # title -> PatchedWorksheet
+        self._sheet_xml = {}  # part name -> sheet XML text
+        self._shared_strings = None
+        self._shared_strings_part = None
+        self._workbook_part = None
+        self._workbook_rels_part = None
+        self._active_index = 0
+        self._load_workbook_index()
+
+    @property
+    def sheetnames(self):
+        return list(self._sheets)
+
+    @property
+    def active(self):
+        sheets = list(self._sheets.values())
+        return sheets[self._active_index] if 0 <= self._active_index < len(sheets) else sheets[0]
+
+    def __getitem__(self, title):
+        if title not in self._sheets:
+            raise KeyError(f"Worksheet {title} does not exist.")
+        return self._sheets[title]
+
+    def _load_workbook_index(self):
+        """Map sheet titles to worksheet parts using the workbook part and its relationships"""
+        with zipfile.ZipFile(self.file_path) as zf:
+            names = set(zf.namelist())
+            self._workbook_part = "xl/workbook.xml"
+            if _PACKAGE_RELS in names:
+                for rel in ET.fromstring(zf.read(_PACKAGE_RELS)):
+                    if rel.get('Type', '').endswith('/officeDocument'):
+                        self._workbook_part = rel.get('Target', '').lstrip('/')
+                        break
+            self._workbook_rels_part = self._rels_part_for(self._workbook_part)
+            workbook = ET.fromstring(zf.read(self._workbook_part))
+            rels = ET.fromstring(zf.read(self._workbook_rels_part)) if self._workbook_rels_part in names else []
+
+        base_dir = posixpath.dirname(self._workbook_part)
+        targets = {}
+        for rel in rels:
+            target = self._resolve_target(base_dir, rel.get('Target', ''))
+            targets[rel.get('Id')] = target
+            if rel.get('Type', '').endswith('/sharedStrings'):
+                self._shared_strings_part = target
+
+        for element in workbook.iter():
+            name = _local_name(element.tag)
+            if name == 'workbookView':
+                self._active_index = int(element.get('activeTab', 0) or 0)
+            elif name == 'sheet':
+                rel_id = next((v for k, v in element.attrib.items() if _local_name(k) == 'id'), None)
+                part = targets.get(rel_id)
+                if part and part in names:
+                    title = element.get('name')
+                    self._sheets[title] = PatchedWorksheet(self, title, part)
+        logging.debug(f"Indexed {len(self._sheets)} sheets in {self.file_path.name} for template patching")
+
+    @staticmethod
+    def _rels_part_for(part):
+        return posixpath.join(posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels")
+
+    @staticmethod
+    def _resolve_target(base_dir, target):
+        if target.startswith('/'):
+            return target.lstrip('/')
+        return posixpath.normpath(posixpath.join(base_dir, target))
+
+    def _get_sheet_xml(self, part_name):
+        if part_name not in self._sheet_xml:
+            with zipfile.ZipFile(self.file_path) as zf:
+                self._sheet_xml[part_name] = zf.read(part_name).decode('utf-8')
+        return self._sheet_xml[part_name]
+
+    def _get_shared_strings(self):
+        """Read the shared string table (only needed to resolve header text)"""
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if self._shared_strings_part:
+                with zipfile.ZipFile(self.file_path) as zf:
+                    with zf.open(self._shared_strings_part) as f:
+                        for _, element in ET.iterparse(f):
+                            if _local_name(element.tag) == 'si':
+                                parts = []
+                                for child in element:
+                                    name = _local_name(child.tag)
+                                    if name == 't':
+                                        parts.append(child.text or "")
+                                    elif name == 'r':
+                                        parts.extend(t.text or "" for t in child if _local_name(t.tag) == 't')
+                                self._shared_strings.append("".join(parts))
+                                element.clear()
+        return self._shared_strings
+
+    @staticmethod
+    def _sheet_patterns(xml):
+        """Row/cell patterns using whatever namespace prefix the sheet was written with"""
+        match = re.search(r"<(\w+:)?sheetData[\s/>]", xml)
+        if not match:
+            raise TemplatePatchError("worksheet has no sheetData element")
+        prefix = match.group(1) or ""
+        row_pattern = re.compile(rf"<{prefix}row(?=[\s/>])([^>]*?)(?:/>|>(.*?)</{prefix}row>)", re.S)
+        cell_pattern = re.compile(rf"<{prefix}c(?=[\s/>])([^>]*?)(?:/>|>(.*?)</{prefix}c>)", re.S)
+        return prefix, row_pattern, cell_pattern
+
+    @staticmethod
+    def _split_reference(ref):
+        match = _CELL_REF.match(ref or "")
+        if not match:
+            return None, None
+        return column_index_from_string(match.group(1)), int(match.group(2))
+
+    def read_row(self, part_name, row_number):
+        """
+        Read the template values of one row
+
+        Args:
+            part_name: Worksheet part inside the package
+            row_number: 1-based row number
+
+        Returns:
+            Dictionary of column index -> value for the cells present in that row
+        """
+        xml = self._get_sheet_xml(part_name)
+        prefix, row_pattern, cell_pattern = self._sheet_patterns(xml)
+        current_row = 0
+        for row_match in row_pattern.finditer(xml):
+            attrs = _attributes(row_match.group(1))
+            current_row = int(attrs['r']) if 'r' in attrs else current_row + 1
+            if current_row < row_number:
+                continue
+            if current_row > row_number:
+                break
+            values = {}
+            column = 0
+            for cell_match in cell_pattern.finditer(row_match.group(2) or ""):
+                cell_attrs = _attributes(cell_match.group(1))
+                ref_column, _ = self._split_reference(cell_attrs.get('r'))
+                column = ref_column or column + 1
+                value = self._cell_value(prefix, cell_attrs, cell_match.group(2) or "")
+                if value is not None:
+                    values[column] = value
+            return values
+        return {}
+
+    def _cell_value(self, prefix, attrs, inner):
+        """Decode a cell's value the way openpyxl would report it"""
+        cell_type = attrs.get('t', 'n')
+        if cell_type == 'inlineStr':
+            texts = re.findall(rf"<{prefix}t(?:\s[^>]*)?>(.*?)</{prefix}t>", inner, re.S)
+            return unescape("".join(texts)) if texts else None
+        match = re.search(rf"<{prefix}v(?:\s[^>]*)?>(.*?)</{prefix}v>", inner, re.S)
+        if not match:
+            return None
+        text = unescape(match.group(1))
+        if cell_type == 's':
+            strings = self._get_shared_strings()
+            index = int(text)
+            return strings[index] if index < len(strings) else None
+        if cell_type == 'b':
+            return text == '1'
+        if cell_type in ('str', 'e'):
+            return text
+        try:
+            return int(text) if re.fullmatch(r"-?\d+", text) else float(text)
+        except ValueError:
+            return text
+
+    @staticmethod
+    def _cell_xml(prefix, column, row, value, style=None):
+        """Serialize one cell, keeping the template's style index"""
+        attrs = {'r': f"{get_column_letter(column)}{row}"}
+        if style is not None:
+            attrs['s'] = style
+        if value is None or value == "":
+            # openpyxl writes empty strings as blank cells too
+            return f"<{prefix}c{_format_attributes(attrs)}/>"
+        if isinstance(value, bool):
+            attrs['t'] = 'b'
+            body = f"<{prefix}v>{int(value)}</{prefix}v>"
+        elif isinstance(value, (int, float)):
+            body = f"<{prefix}v>{value!r}</{prefix}v>"
+        elif value.startswith('=') and len(value) > 1:
+            # openpyxl stores '=...' strings as formulas, so do the same
+            body = f"<{prefix}f>{escape(value[1:])}</{prefix}f>"
+        else:
+            attrs['t'] = 'inlineStr'
+            body = f'<{prefix}is><{prefix}t xml:space="preserve">{escape(value)}</{prefix}t></{prefix}is>'
+        return f"<{prefix}c{_format_attributes(attrs)}>{body}</{prefix}c>"
+
+    def _patch_row(self, prefix, cell_pattern, row_number, row_attrs, inner, updates, state):
+        """Merge queued values into one row's cells, keeping untouched cells as they are"""
+        pending = sorted(updates.items())
+        pieces = []
+        position = 0
+        column = 0
+        for cell_match in cell_pattern.finditer(inner):
+            attrs = _attributes(cell_match.group(1))
+            ref_column, _ = self._split_reference(attrs.get('r'))
+            column = ref_column or column + 1
+            pieces.append(inner[position:cell_match.start()])
+            position = cell_match.end()
+
+            while pending and pending[0][0] < column:
+                new_column, value = pending.pop(0)
+                pieces.append(self._cell_xml(prefix, new_column, row_number, value))
+
+            if pending and pending[0][0] == column:
+                _, value = pending.pop(0)
+                formula = re.search(rf"<{prefix}f(\s[^>]*)?(?:/>|>)", cell_match.group(2) or "")
+                if formula:
+                    formula_attrs = _attributes(formula.group(1))
+                    if 'ref' in formula_attrs:
+                        raise TemplatePatchError(
+                            f"cell {get_column_letter(column)}{row_number} holds a shared or array formula"
+                        )
+                    state['formulas_replaced'] = True
+                pieces.append(self._cell_xml(prefix, column, row_number, value, attrs.get('s')))
+            elif 'r' not in attrs:
+                # Give implicit cells an explicit reference so inserted cells cannot shift them
+                cell_text = cell_match.group(0)
+                pieces.append(f'<{prefix}c r="{get_column_letter(column)}{row_number}"' + cell_text[len(prefix) + 2:])
+            else:
+                pieces.append(cell_match.group(0))
+
+        tail = inner[position:]
+        pieces.extend(self._cell_xml(prefix, new_column, row_number, value) for new_column, value in pending)
+        pieces.append(tail)
+
+        row_attrs = dict(row_attrs)
+        row_attrs['r'] = str(row_number)
+        row_attrs.pop('spans', None)  # Optional hint that may no longer cover the row's cells
+        row_attrs = {'r': row_attrs.pop('r'), **row_attrs}
+        return f"<{prefix}row{_format_attributes(row_attrs)}>{''.join(pieces)}</{prefix}row>"
+
+    def _patch_sheet(self, sheet):
+        """Build the patched XML for one sheet"""
+        xml = self._get_sheet_xml(sheet.part_name)
+        prefix, row_pattern, cell_pattern = self._sheet_patterns(xml)
+        state = {'formulas_replaced': False}
+
+        start = re.search(rf"<{prefix}sheetData(\s[^>]*?)?(/?)>", xml)
+        if start.group(2):
+            body, end = "", start.end()
+            opening = f"<{prefix}sheetData{start.group(1) or ''}>"
+        else:
+            end = xml.index(f"</{prefix}sheetData>", start.end())
+            body = xml[start.end():end]
+            end += len(f"</{prefix}sheetData>")
+            opening = start.group(0)
+
+        pending_rows = sorted(sheet.updates)
+        pieces = []
+        position = 0
+        row_number = 0
+        for row_match in row_pattern.finditer(body):
+            attrs = _attributes(row_match.group(1))
+            row_number = int(attrs['r']) if 'r' in attrs else row_number + 1
+            pieces.append(body[position:row_match.start()])
+            position = row_match.end()
+
+            while pending_rows and pending_rows[0] < row_number:
+                new_row = pending_rows.pop(0)
+                pieces.append(self._patch_row(prefix, cell_pattern, new_row, {}, "", sheet.updates[new_row], state))
+
+            if pending_rows and pending_rows[0] == row_number:
+                pending_rows.pop(0)
+                pieces.append(self._patch_row(prefix, cell_pattern, row_number, attrs, row_match.group(2) or "",
+                                              sheet.updates[row_number], state))
+            elif 'r' not in attrs:
+                row_text = row_match.group(0)
+                pieces.append(f'<{prefix}row r="{row_number}"' + row_text[len(prefix) + 4:])
+            else:
+                pieces.append(row_match.group(0))
+
+        tail = body[position:]
+        for new_row in pending_rows:
+            pieces.append(self._patch_row(prefix, cell_pattern, new_row, {}, "", sheet.updates[new_row], state))
+        pieces.append(tail)
+
+        closing = f"</{prefix}sheetData>"
+        patched = xml[:start.start()] + opening + "".join(pieces) + closing + xml[end:]
+        return self._update_dimension(prefix, patched, sheet), state['formulas_replaced']
+
+    def _update_dimension(self, prefix, xml, sheet):
+        """Grow the sheet's used-range reference to cover the written cells"""
+        match = re.search(rf'<{prefix}dimension\s+ref="([^"]*)"', xml)
+        if not match or not sheet.updates:
+            return xml
+        refs = match.group(1).split(':')
+        first_column, first_row = self._split_reference(refs[0])
+        last_column, last_row = self._split_reference(refs[-1])
+        if first_column is None or last_column is None:
+            return xml
+        written_columns = [column for row in sheet.updates.values() for column in row]
+        first_row = min(first_row, min(sheet.updates))
+        last_row = max(last_row, max(sheet.updates))
+        first_column = min(first_column, min(written_columns))
+        last_column = max(last_column, max(written_columns))
+        ref = f"{get_column_letter(first_column)}{first_row}:{get_column_letter(last_column)}{last_row}"
+        return xml[:match.start(1)] + ref + xml[match.end(1):]
+
+    def _drop_calc_chain(self, zf, replacements, dropped):
+        """Remove the calculation chain so Excel rebuilds it after formulas were overwritten"""
+        calc_chain = next((name for name in zf.namelist() if name.endswith('calcChain.xml')), None)
+        if not calc_chain:
+            return
+        dropped.add(calc_chain)
+        content_types = zf.read(_CONTENT_TYPES).decode('utf-8')
+        replacements[_CONTENT_TYPES] = re.sub(r'<Override[^>]*PartName="/' + re.escape(calc_chain) + r'"[^>]*/>', "", content_types)
+        rels = replacements.get(self._workbook_rels_part) or zf.read(self._workbook_rels_part).decode('utf-8')
+        replacements[self._workbook_rels_part] = re.sub(r'<Relationship[^>]*Target="[^"]*calcChain\.xml"[^>]*/>', "", rels)
+
+    def save(self, output_file=None):
+        """
+        Write the patched package, copying every other part unchanged
+
+        Args:
+            output_file: Destination path (defaults to the file that was opened)
+
+        Raises:
+            TemplatePatchError: If a target sheet cannot be patched safely; nothing is written
+        """
+        target = Path(output_file) if output_file else self.file_path
+        replacements = {}
+        formulas_replaced = False
+        for sheet in self._sheets.values():
+            if sheet.updates:
+                xml, replaced = self._patch_sheet(sheet)
+                replacements[sheet.part_name] = xml
+                formulas_replaced = formulas_replaced or replaced
+
+        temp_file = target.with_name(target.name + ".tmp")
+        try:
+            with zipfile.ZipFile(self.file_path) as zin:
+                dropped = set()
+                if formulas_replaced:
+                    self._drop_calc_chain(zin, replacements, dropped)
+                with zipfile.ZipFile(temp_file, 'w', zipfile.ZIP_DEFLATED) as zout:
+                    for info in zin.infolist():
+                        if info.filename in dropped:
+                            continue
+                        out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                        out_info.compress_type = info.compress_type
+                        out_info.external_attr = info.external_attr
+                        if info.filename in replacements:
+                            zout.writestr(out_info, replacements[info.filename].encode('utf-8'))
+                        else:
+                            with zin.open(info) as src, zout.open(out_info, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as dst:
+                                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(temp_file, target)
+        except Exception:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise
+
+        cells = sum(len(row) for sheet in self._sheets.values() for row in sheet.updates.values())
+        logging.info(f"Patched {cells} cells in {len(replacements)} part(s) of {target.name}")
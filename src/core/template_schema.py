@@ -0,0 +1,105 @@
+import logging
+import re
+
+
+class TemplateSchema:
+    """
+    Header rows, column indices and mapping resolutions for one output workbook
+
+    Writers and comparators used to rescan the same header cells for every call; the
+    schema reads each sheet's header band once and shares it. Anything that writes into
+    a sheet's header band (rows 1-3) must call invalidate() for that sheet afterwards.
+    """
+
+    HEADER_ROWS = (1, 2, 3)
+    HEADER_SCAN_COLUMNS = 100  # Header scans look at columns 1..99
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._header_bands = {}  # sheet title -> [(row_num, [(col_idx, value), ...]), ...]
+        self._column_maps = {}  # (sheet title, header row) -> {normalized header: col_idx}
+        self._mapping_resolutions = {}  # mapping rows -> {internal key: output column name}
+
+    @staticmethod
+    def normalize_header(value):
+        """Collapse whitespace/newlines in a header cell the way the writers match headers"""
+        return re.sub(r"\s+", " ", str(value).replace("\n", " ")).strip()
+
+    def header_rows(self, sheet, max_columns=HEADER_SCAN_COLUMNS):
+        """
+        Get the cells of a sheet's header band (rows 1-3)
+
+        Args:
+            sheet: Worksheet to read
+            max_columns: Exclusive column limit of the scan (e.g. 50 reads columns 1..49)
+
+        Returns:
+            List of (row_num, [(col_idx, value), ...]) in row order
+        """
+        band = self._header_bands.get(sheet.title)
+        if band is None:
+            last_column = min(sheet.max_column + 1, self.HEADER_SCAN_COLUMNS)
+            band = [
+                (row_num, [(col_idx, sheet.cell(row=row_num, column=col_idx).value) for col_idx in range(1, last_column)])
+                for row_num in self.HEADER_ROWS
+            ]
+            self._header_bands[sheet.title] = band
+        if max_columns >= self.HEADER_SCAN_COLUMNS:
+            return band
+        return [(row_num, [cell for cell in cells if cell[0] < max_columns]) for row_num, cells in band]
+
+    def column_map(self, sheet, header_row):
+        """
+        Get normalized header text -> column index for one header row (all columns)
+
+        Args:
+            sheet: Worksheet to read
+            header_row: Row holding the headers
+
+        Returns:
+            Dictionary of header text -> 1-based column index
+        """
+        key = (sheet.title, header_row)
+        if key not in self._column_maps:
+            headers = []
+            for cell_obj in sheet[header_row]:
+                headers.append(self.normalize_header(cell_obj.value) if cell_obj.value else "")
+            self._column_maps[key] = {h: idx + 1 for idx, h in enumerate(headers) if h.strip()}
+        return self._column_maps[key]
+
+    def resolve_mapping(self, mapping_data, key_resolver):
+        """
+        Resolve mapping rows to internal key -> output column name, once per mapping
+
+        Args:
+            mapping_data: (element, attribute, output column) rows
+            key_resolver: Callable (element, attribute) -> internal key or None
+
+        Returns:
+            Dictionary of internal key -> output column name
+        """
+        key = tuple(tuple(row) for row in mapping_data)
+        if key not in self._mapping_resolutions:
+            internal_to_excel = {}
+            for element, attribute, output_col_name in mapping_data:
+                internal_key = key_resolver(element, attribute)
+                if internal_key and output_col_name.strip():
+                    internal_to_excel[internal_key] = output_col_name
+                    logging.debug(f"Mapping {element}:{attribute} -> {internal_key} -> {output_col_name}")
+                else:
+                    logging.debug(f"Skipping mapping {element}:{attribute} -> {internal_key} -> {output_col_name}")
+            self._mapping_resolutions[key] = internal_to_excel
+        return self._mapping_resolutions[key]
+
+    def invalidate(self, sheet_title, from_row=1):
+        """
+        Forget cached headers of a sheet whose cells were rewritten
+
+        Args:
+            sheet_title: Sheet that was written
+            from_row: First row that was written; headers above it stay cached
+        """
+        if from_row <= max(self.HEADER_ROWS):
+            self._header_bands.pop(sheet_title, None)
+        for key in [k for k in self._column_maps if k[0] == sheet_title and k[1] >= from_row]:
+            del self._column_maps[key]
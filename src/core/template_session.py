@@ -0,0 +1,108 @@
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_FORMULA, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
+
+
+class TemplateSession:
+    """
+    Keeps one loaded copy of the output template for a run
+
+    The template is opened once: Pole/To Pole pairs are read straight from the loaded
+    sheets and the same workbook is handed to the writer, which saves it under the output
+    file name (the template on disk is never written). A workbook handed out for writing
+    is released by the session, so any later request loads a clean copy again.
+    """
+
+    def __init__(self, template_path):
+        self.template_path = Path(template_path)
+        self._workbook = None
+        self.load_time = 0.0
+
+    @property
+    def workbook(self):
+        """The loaded template workbook (loaded on first use)"""
+        if self._workbook is None:
+            start = time.perf_counter()
+            # Macros are not needed to read pairs, and write_output drops them for non-.xlsm outputs
+            self._workbook = load_workbook(self.template_path)
+            self.load_time = time.perf_counter() - start
+            logging.info(f"Loaded template '{self.template_path.name}' in {self.load_time:.2f}s")
+        return self._workbook
+
+    def can_write_to(self, output_file):
+        """
+        Check whether the loaded template can be saved as the given output file
+
+        The session loads the template without its VBA project, which is exactly how
+        write_output opens non-.xlsm outputs; .xlsm outputs still need their own load.
+        """
+        return Path(output_file).suffix.lower() != '.xlsm'
+
+    def checkout_workbook(self):
+        """
+        Hand the loaded workbook to a writer
+
+        The session forgets the workbook so the caller's edits never leak into a later
+        read; the next access to .workbook loads the template again.
+
+        Returns:
+            openpyxl Workbook with the template contents
+        """
+        workbook = self.workbook
+        self._workbook = None
+        return workbook
+
+    @staticmethod
+    def _convert_cell(cell):
+        """Convert a cell the same way pandas' openpyxl reader does"""
+        if cell.value is None:
+            return ""
+        if cell.data_type == TYPE_ERROR:
+            return np.nan
+        if cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            if value == cell.value:
+                return value
+            return float(cell.value)
+        return cell.value
+
+    def read_sheet_frame(self, sheet_name):
+        """
+        Read a template sheet into the same DataFrame pd.read_excel(path, sheet_name) returns
+
+        Rows come from the already loaded workbook and go through pandas' own text parser,
+        so header handling, NA values and type inference are unchanged. Sheets containing
+        formulas are read with pd.read_excel, since only it sees the cached formula results.
+
+        Args:
+            sheet_name: Name of the sheet to read
+
+        Returns:
+            DataFrame with the sheet's first row as the header
+        """
+        sheet = self.workbook[sheet_name]
+        data = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(sheet.rows):
+            if any(cell.data_type == TYPE_FORMULA for cell in row):
+                logging.debug(f"Sheet '{sheet_name}' has formulas; reading cached values with pandas")
+                return pd.read_excel(self.template_path, sheet_name=sheet_name)
+            converted_row = [self._convert_cell(cell) for cell in row]
+            while converted_row and converted_row[-1] == "":
+                converted_row.pop()
+            if converted_row:
+                last_row_with_data = row_number
+            data.append(converted_row)
+        data = data[:last_row_with_data + 1]
+        if not data:
+            return pd.DataFrame()
+
+        max_width = max(len(data_row) for data_row in data)
+        data = [data_row + [""] * (max_width - len(data_row)) for data_row in data]
+        return TextParser(data, header=0, skip_blank_lines=False).read()
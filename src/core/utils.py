@@ -1,7 +1,153 @@
 import sys
 import re
+import time
 import logging
+from functools import lru_cache
 from pathlib import Path
+import numpy as np
+import pandas as pd
+
+try:
+    from .startup import get_base_directory
+except ImportError:
+    from startup import get_base_directory
+
+
+# Compiled once at import; every parser below looks its patterns up here instead of recompiling per call
+_PATTERNS = {
+    'whitespace': re.compile(r'\s+'),
+    'scid_simple': re.compile(r'^0*(\d+)(?:\.0+)?([A-Za-z]*)$'),
+    'scid_part': re.compile(r'^([A-Za-z]*)0*(\d+)([A-Za-z]*)$'),
+    'scid_numeric_prefix': re.compile(r'(\d+)([A-Za-z]*)'),
+    'height_feet_inches': re.compile(r"(\d+)'-?(\d+)\""),
+    'height_feet_space_inches': re.compile(r"(\d+)'\s+(\d+)\"?"),
+    'height_feet_optional_inches': re.compile(r"(\d+)'\s*(\d+)?\"?"),
+    'height_feet_only': re.compile(r"(\d+)'"),
+    'height_alden': re.compile(r"(\d+)ft\s*(\d+)in"),
+    'height_decimal_parts': re.compile(r"(\d+)\.(\d+)"),
+    'height_integer': re.compile(r"(\d+)$"),
+    'height_number': re.compile(r"(\d+\.?\d*)"),
+    'structure_guyed': re.compile(r'\bGuyed\b\s*', re.IGNORECASE),
+    'structure_unguyed': re.compile(r'\bUnguyed\b\s*', re.IGNORECASE),
+    'structure_guyed_prefix': re.compile(r'^Guyed(?=[A-Z])', re.IGNORECASE),
+    'structure_unguyed_prefix': re.compile(r'^Unguyed(?=[A-Z])', re.IGNORECASE),
+    # The four parse_height_decimal patterns as one alternation (tried in the same order)
+    'height_decimal_combined': re.compile(
+        r"^(?:(?P<f1>\d+)'-?(?P<i1>\d+)\""
+        r"|(?P<f2>\d+)ft\s*(?P<i2>\d+)in"
+        r"|(?P<f3>\d+)'\s*(?P<i3>\d+)?\"?"
+        r"|(?P<num>\d+\.?\d*))"
+    ),
+    # Plain decimal text that float() and astype(float) read identically
+    'plain_number': re.compile(r'^\s*\d+(?:\.\d*)?\s*$'),
+    # Anything float() might accept (signs, exponents, underscores, inf/nan); such text is left to the scalar parser
+    'float_like': re.compile(
+        r'^\s*[+-]?(?:(?:\d(?:_?\d)*)?(?:\.(?:\d(?:_?\d)*)?)?(?:[eE][+-]?\d(?:_?\d)*)?|inf(?:inity)?|nan)\s*$',
+        re.IGNORECASE
+    ),
+}
+
+
+def _height_text(value):
+    """Text a scalar height parser works on: '' for blank/falsy input, otherwise str(value).strip()"""
+    if isinstance(value, str):
+        return value.strip()
+    try:
+        if value is None or not value:
+            return ''
+    except (TypeError, ValueError):
+        # pd.NA and other values without a truth value
+        return ''
+    return str(value).strip()
+
+
+def _round2(values):
+    """
+    Round a float array to 2 decimals with the same result as Python's round(value, 2)
+    
+    np.round scales by 100 first, which can land on the other side of a half-cent tie;
+    those few values (and huge magnitudes) are rounded with the built-in instead.
+    """
+    values = np.array(values, dtype=float)
+    rounded = np.round(values, 2)
+    with np.errstate(invalid='ignore'):
+        scaled = values * 100
+        near_tie = (np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6) | (np.abs(values) > 1e13)
+    near_tie &= np.isfinite(values)
+    if near_tie.any():
+        rounded[near_tie] = [round(float(v), 2) for v in values[near_tie]]
+    return rounded
+
+
+def _format_unique(values, formatter):
+    """Apply a Python formatter once per distinct value of a numeric array and broadcast the text back"""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    labels = np.array([formatter(value) for value in uniques.tolist()], dtype=object)
+    return labels[inverse.reshape(-1)]
+
+
+def _vectorize_height(values, scalar_func, text_kernel, number_kernel, empty_value):
+    """
+    Run a height conversion over a column with the result scalar_func would give per value
+    
+    Numeric columns go straight to number_kernel (NumPy arithmetic). In text/object columns
+    each distinct string is converted once by text_kernel and broadcast back; any other
+    objects (None, mixed numbers) use scalar_func.
+    
+    Args:
+        values: Series, ndarray or list
+        scalar_func: Scalar conversion the result must match
+        text_kernel: Converts a Series of distinct strings
+        number_kernel: Converts a numeric Series
+        empty_value: Result for empty input
+        
+    Returns:
+        pd.Series aligned with values
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values, dtype=object if len(values) == 0 else None)
+    if values.empty:
+        return pd.Series(empty_value, index=values.index, dtype=object)
+    if values.dtype.kind in 'iuf':
+        return number_kernel(values)
+    
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    result = pd.Series(empty_value, index=values.index, dtype=object)
+    if is_str.any():
+        strings = values[is_str].to_numpy(dtype=object)
+        uniques = pd.unique(strings)
+        converted = text_kernel(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+        result[is_str] = converted[pd.Index(uniques).get_indexer(strings)]
+    if not is_str.all():
+        result[~is_str] = values[~is_str].map(scalar_func)
+    return result
+
+
+@lru_cache(maxsize=64)
+def _compile_ignore_keywords(keywords):
+    """
+    Compile an ignore-keyword tuple once
+    
+    Returns:
+        (alternation, patterns): one case-insensitive regex matching any keyword, used as a
+        quick "does anything need removing" check, and the per-keyword patterns applied in
+        list order (order matters when keywords overlap, e.g. "Pole" and "Foreign Pole")
+    """
+    cleaned = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+    if not cleaned:
+        return None, ()
+    patterns = tuple(re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE) for keyword in cleaned)
+    alternation = re.compile('|'.join(r'\b' + re.escape(keyword) + r'\b' for keyword in cleaned), re.IGNORECASE)
+    return alternation, patterns
+
+
+# Upper bound on remembered (raw SCID, ignore keywords) pairs; a large job has a few thousand poles
+SCID_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=SCID_CACHE_SIZE, typed=True)
+def _normalize_scid_cached(scid, ignore_keywords):
+    return Utils.normalize_scid(scid, ignore_keywords)
 
 
 class Utils:
@@ -31,20 +177,20 @@ class Utils:
         # Apply ignore keywords if provided
         if ignore_keywords:
             scid_cleaned = scid_str
-            for keyword in ignore_keywords:
-                if keyword and keyword.strip():  # Only process non-empty keywords
-                    # Create a case-insensitive pattern to match the keyword
-                    # Use word boundaries to avoid partial matches
-                    pattern = r'\b' + re.escape(keyword.strip()) + r'\b'
-                    scid_cleaned = re.sub(pattern, '', scid_cleaned, flags=re.IGNORECASE).strip()
+            alternation, keyword_patterns = Utils.ignore_keyword_patterns(ignore_keywords)
+            # Most SCIDs contain no keyword at all, so one combined search decides whether to strip
+            if alternation is not None and alternation.search(scid_cleaned):
+                for pattern in keyword_patterns:
+                    # Case-insensitive, word-bounded to avoid partial matches
+                    scid_cleaned = pattern.sub('', scid_cleaned).strip()
             
             # Remove extra whitespace that might result from keyword removal
-            scid_cleaned = re.sub(r'\s+', ' ', scid_cleaned).strip()
+            scid_cleaned = _PATTERNS['whitespace'].sub(' ', scid_cleaned).strip()
             scid_str = scid_cleaned
         
         # Handle simple numeric SCIDs with optional letters (like "001A" -> "1A")
         # Also handle decimal numbers (like "1.0" -> "1")
-        match = re.match(r'^0*(\d+)(?:\.0+)?([A-Za-z]*)$', scid_str)
+        match = _PATTERNS['scid_simple'].match(scid_str)
         if match:
             numeric_part = str(int(match.group(1)))
             letter_part = match.group(2).upper()
@@ -62,7 +208,7 @@ class Utils:
             else:
                 # For mixed alphanumeric parts, normalize leading zeros in numeric portions
                 # Handle patterns like "MISM013" -> "MISM13"
-                part_match = re.match(r'^([A-Za-z]*)0*(\d+)([A-Za-z]*)$', part)
+                part_match = _PATTERNS['scid_part'].match(part)
                 if part_match:
                     prefix = part_match.group(1).upper()
                     numeric = str(int(part_match.group(2)))
@@ -73,10 +219,102 @@ class Utils:
         
         return ' '.join(normalized_parts)
     
+    @staticmethod
+    def normalize_scid_cached(scid, ignore_keywords=None):
+        """
+        Memoized normalize_scid shared by every reader in the process
+        
+        Args:
+            scid: Raw SCID value
+            ignore_keywords (list, optional): Keywords to ignore when normalizing
+            
+        Returns:
+            str: Normalized SCID (same result as normalize_scid)
+        """
+        try:
+            return _normalize_scid_cached(scid, tuple(ignore_keywords or ()))
+        except TypeError:
+            # Unhashable values are normalized directly
+            return Utils.normalize_scid(scid, ignore_keywords)
+    
+    @staticmethod
+    def scid_cache_stats():
+        """Get hit/miss counters of the shared SCID normalization cache"""
+        info = _normalize_scid_cached.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'maxsize': info.maxsize}
+    
+    @staticmethod
+    def log_scid_cache_stats():
+        """Log the shared SCID normalization cache counters"""
+        stats = Utils.scid_cache_stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / lookups * 100) if lookups else 0.0
+        logging.info(f"SCID normalization cache: {stats['hits']} hits, {stats['misses']} misses "
+                     f"({hit_rate:.1f}% hit rate, {stats['size']}/{stats['maxsize']} entries)")
+    
+    @staticmethod
+    def clear_scid_cache():
+        """Reset the shared SCID normalization cache and its counters"""
+        _normalize_scid_cached.cache_clear()
+    
+    @staticmethod
+    def normalize_nodes_scids(nodes_df, ignore_keywords=None):
+        """
+        Normalize the 'scid' column of a nodes DataFrame once
+        
+        The returned copy is tagged with the keywords used, so process_data can skip
+        normalizing it a second time.
+        
+        Args:
+            nodes_df (DataFrame): Nodes sheet with a 'scid' column
+            ignore_keywords (list, optional): Keywords to ignore when normalizing
+            
+        Returns:
+            DataFrame: Copy of nodes_df with normalized SCIDs
+        """
+        keywords = tuple(ignore_keywords or ())
+        if Utils.nodes_scids_normalized(nodes_df, ignore_keywords):
+            return nodes_df.copy()
+        nodes_df = nodes_df.copy()
+        nodes_df['scid'] = nodes_df['scid'].map(lambda x: Utils.normalize_scid_cached(x, keywords))
+        nodes_df.attrs['normalized_scid_keywords'] = keywords
+        return nodes_df
+    
+    @staticmethod
+    def nodes_scids_normalized(nodes_df, ignore_keywords=None):
+        """Check whether normalize_nodes_scids already ran on nodes_df with these keywords"""
+        return nodes_df.attrs.get('normalized_scid_keywords') == tuple(ignore_keywords or ())
+    
+    @staticmethod
+    def pattern(name):
+        """
+        Get a precompiled pattern from the shared registry
+        
+        Args:
+            name (str): Registry key (e.g. 'height_feet_inches', 'scid_simple')
+            
+        Returns:
+            re.Pattern: The compiled pattern
+        """
+        return _PATTERNS[name]
+    
+    @staticmethod
+    def ignore_keyword_patterns(ignore_keywords):
+        """
+        Get the compiled patterns for an ignore-keyword list, cached per distinct list
+        
+        Args:
+            ignore_keywords (list): Keywords to ignore when normalizing
+            
+        Returns:
+            tuple: (combined alternation pattern or None, tuple of per-keyword patterns)
+        """
+        return _compile_ignore_keywords(tuple(ignore_keywords or ()))
+    
     @staticmethod
     def extract_numeric_part(scid):
         """Extract numeric part from SCID for sorting purposes"""
-        match = re.match(r'(\d+)([A-Za-z]*)', str(scid))
+        match = _PATTERNS['scid_numeric_prefix'].match(str(scid))
         if match:
             num = int(match.group(1))
             alpha = match.group(2) or ''
@@ -94,12 +332,7 @@ class Utils:
     @staticmethod
     def get_base_directory():
         """Get the base directory for the application (exe or script location)"""
-        if getattr(sys, 'frozen', False):
-            # Running as a PyInstaller bundle
-            return Path(sys.executable).parent
-        else:
-            # Running as a script - use the main script's directory
-            return Path(sys.argv[0]).resolve().parent
+        return get_base_directory()
     
     @staticmethod
     def parse_height_format(height_str):
@@ -110,23 +343,22 @@ class Utils:
         
         # Handle various height formats
         # Pattern 1: 5'-10" or 5'10"
-        height_pattern = re.compile(r"(\d+)'-?(\d+)\"")
-        m = height_pattern.match(s)
+        m = _PATTERNS['height_feet_inches'].match(s)
         if m:
             return f"{int(m.group(1))}' {int(m.group(2))}\""
         
         # Pattern 2: 5' 10" (with space)
-        m = re.match(r"(\d+)'\s+(\d+)\"?", s)
+        m = _PATTERNS['height_feet_space_inches'].match(s)
         if m:
             return f"{int(m.group(1))}' {int(m.group(2))}\""
         
         # Pattern 3: Just feet with apostrophe (5')
-        m = re.match(r"(\d+)'", s)
+        m = _PATTERNS['height_feet_only'].match(s)
         if m:
             return f"{int(m.group(1))}' 0\""
         
         # Pattern 4: Decimal feet (5.5 -> 5' 6")
-        m = re.match(r"(\d+)\.(\d+)", s)
+        m = _PATTERNS['height_decimal_parts'].match(s)
         if m:
             feet = int(m.group(1))
             decimal_part = float(f"0.{m.group(2)}")
@@ -134,7 +366,7 @@ class Utils:
             return f"{feet}' {inches}\""
         
         # Pattern 5: Just a number (assume feet)
-        m = re.match(r"(\d+)$", s)
+        m = _PATTERNS['height_integer'].match(s)
         if m:
             return f"{int(m.group(1))}' 0\""
         
@@ -150,22 +382,21 @@ class Utils:
             s = str(height_str).strip()
             
             # Pattern 1: 5'-10" or 5'10"
-            height_pattern = re.compile(r"(\d+)'-?(\d+)\"")
-            m = height_pattern.match(s)
+            m = _PATTERNS['height_feet_inches'].match(s)
             if m:
                 feet = int(m.group(1))
                 inches = int(m.group(2))
                 return round(feet + inches / 12, 2)
             
             # Pattern 2: Alden format "22ft 1in" or "22ft1in"
-            m = re.match(r"(\d+)ft\s*(\d+)in", s)
+            m = _PATTERNS['height_alden'].match(s)
             if m:
                 feet = int(m.group(1))
                 inches = int(m.group(2))
                 return round(feet + inches / 12, 2)
             
             # Pattern 3: 5' 10" (with space)
-            m = re.match(r"(\d+)'\s*(\d+)?\"?", s)
+            m = _PATTERNS['height_feet_optional_inches'].match(s)
             if m:
                 feet = int(m.group(1))
                 inches = int(m.group(2)) if m.group(2) else 0
@@ -174,7 +405,7 @@ class Utils:
             # Pattern 4: Decimal number with explicit context
             # If it contains a decimal point and is reasonable for feet (< 50), treat as feet
             # Otherwise, treat as inches
-            m = re.match(r"(\d+\.?\d*)", s)
+            m = _PATTERNS['height_number'].match(s)
             if m:
                 value = float(m.group(1))
                 # If it's a decimal and reasonably small, assume it's feet
@@ -332,6 +563,191 @@ class Utils:
             logging.warning(f"Could not convert feet/inches to decimal format: {feet_inches_str}")
             return str(feet_inches_str)
     
+    @staticmethod
+    def parse_height_decimal_series(values):
+        """
+        Vectorized parse_height_decimal for a whole column
+        
+        Args:
+            values: Series, ndarray or list of height values
+            
+        Returns:
+            pd.Series: float decimal feet, NaN where parse_height_decimal returns None
+        """
+        def text_kernel(strings):
+            text = strings.str.strip()
+            parts = text.str.extract(_PATTERNS['height_decimal_combined'])
+            feet = pd.to_numeric(parts['f1'].fillna(parts['f2']).fillna(parts['f3']), errors='coerce')
+            inches = pd.to_numeric(parts['i1'].fillna(parts['i2']).fillna(parts['i3']), errors='coerce').fillna(0)
+            result = np.array(feet + inches / 12, dtype=float)
+            
+            # Plain numbers: decimals under 50 are feet, anything else is inches
+            number = parts['num'].notna().to_numpy()
+            if number.any():
+                value = parts['num'][number].astype(float).to_numpy()
+                has_dot = text[number].str.contains('.', regex=False).to_numpy(dtype=bool)
+                result[number] = np.where(has_dot & (value < 50), value, value / 12)
+            return pd.Series(_round2(result), index=strings.index)
+        
+        def number_kernel(numbers):
+            value = numbers.to_numpy(dtype=float)
+            if numbers.dtype.kind == 'f':
+                # str() of these floats always has a '.'; tiny/huge ones print in exponent form
+                result = np.where(value < 50, value, value / 12)
+                odd = np.isfinite(value) & (value > 0) & ((value < 1e-4) | (value >= 1e16))
+            else:
+                result = value / 12
+                odd = np.zeros(len(value), dtype=bool)
+            result = _round2(np.where(value > 0, result, np.nan))
+            result[~np.isfinite(value)] = np.nan
+            series = pd.Series(result, index=numbers.index)
+            if odd.any():
+                series[odd] = numbers[odd].map(Utils.parse_height_decimal).astype(float)
+            return series
+        
+        return pd.to_numeric(
+            _vectorize_height(values, Utils.parse_height_decimal, text_kernel, number_kernel, np.nan),
+            errors='coerce'
+        ).astype(float)
+    
+    @staticmethod
+    def _format_whole_inches(total, scalar_func, values):
+        """Format float inch totals as feet-inches text like inches_to_feet_format ('' for invalid)"""
+        total = np.asarray(total, dtype=float)
+        fallback = np.isinf(total) | (np.abs(total) > 1e15)
+        valid = ~np.isnan(total) & (total >= 0) & ~fallback
+        whole = np.rint(total[valid]).astype(np.int64)
+        result = pd.Series('', index=values.index, dtype=object)
+        if valid.any():
+            result[valid] = _format_unique(whole, lambda inches: f"{inches // 12}' {inches % 12}\"")
+        if fallback.any():
+            result[fallback] = values[fallback].map(scalar_func)
+        return result
+    
+    @staticmethod
+    def inches_to_feet_format_series(values):
+        """
+        Vectorized inches_to_feet_format for a whole column
+        
+        Args:
+            values: Series, ndarray or list of inch values (numbers, numeric text or feet-inches text)
+            
+        Returns:
+            pd.Series: feet-inches strings, '' where inches_to_feet_format returns ''
+        """
+        def text_kernel(strings):
+            text = strings.str.strip()
+            total = pd.Series(np.nan, index=strings.index)
+            # Already feet-inches: parse to decimal feet and back to whole inches
+            quoted = (text.str.contains("'", regex=False) | text.str.contains('"', regex=False)).to_numpy(dtype=bool)
+            if quoted.any():
+                total[quoted] = np.rint(Utils.parse_height_decimal_series(text[quoted]).to_numpy() * 12)
+            
+            clean = text.str.replace('″', '', regex=False)
+            plain = ~quoted & clean.str.match(_PATTERNS['plain_number']).to_numpy(dtype=bool)
+            if plain.any():
+                number = clean[plain].astype(float).to_numpy()
+                has_dot = clean[plain].str.contains('.', regex=False).to_numpy(dtype=bool)
+                # Decimals under 50 are feet; other decimals and integers are inches
+                total[plain] = np.where(has_dot, np.where(number < 50, np.rint(number * 12), np.rint(number)), number)
+            
+            result = Utils._format_whole_inches(total, Utils.inches_to_feet_format, strings)
+            other = ~quoted & ~plain
+            if other.any():
+                result[other] = strings[other].map(Utils.inches_to_feet_format)
+            return result
+        
+        def number_kernel(numbers):
+            return Utils._format_whole_inches(numbers.to_numpy(dtype=float), Utils.inches_to_feet_format, numbers)
+        
+        return _vectorize_height(values, Utils.inches_to_feet_format, text_kernel, number_kernel, '')
+    
+    @staticmethod
+    def decimal_feet_to_feet_format_series(values):
+        """
+        Vectorized decimal_feet_to_feet_format for a whole column
+        
+        Args:
+            values: Series, ndarray or list of decimal feet values
+            
+        Returns:
+            pd.Series: feet'inches" strings, None where decimal_feet_to_feet_format returns None
+        """
+        def number_kernel(numbers):
+            decimal = numbers.to_numpy(dtype=float)
+            fallback = np.isinf(decimal) | (np.abs(decimal) > 1e15)
+            valid = ~np.isnan(decimal) & ~fallback
+            rounded = _round2(decimal[valid])
+            feet = np.trunc(rounded)
+            inches = np.rint((rounded - feet) * 12)
+            # Inches that round up to 12 carry into the next foot
+            carry = inches == 12
+            feet = np.where(carry, feet + 1, feet).astype(np.int64)
+            inches = np.where(carry, 0, inches).astype(np.int64)
+            result = pd.Series(None, index=numbers.index, dtype=object)
+            if valid.any():
+                # Each distinct rounded height is formatted once
+                _, first, inverse = np.unique(rounded, return_index=True, return_inverse=True)
+                labels = np.array([f"{f}'{i}\"" for f, i in zip(feet[first].tolist(), inches[first].tolist())], dtype=object)
+                result[valid] = labels[inverse.reshape(-1)]
+            if fallback.any():
+                result[fallback] = numbers[fallback].map(Utils.decimal_feet_to_feet_format)
+            return result
+        
+        def text_kernel(strings):
+            plain = strings.str.match(_PATTERNS['plain_number']).to_numpy(dtype=bool)
+            result = pd.Series(None, index=strings.index, dtype=object)
+            if plain.any():
+                result[plain] = number_kernel(strings[plain].astype(float)).to_numpy(dtype=object)
+            if not plain.all():
+                result[~plain] = strings[~plain].map(Utils.decimal_feet_to_feet_format)
+            return result
+        
+        return _vectorize_height(values, Utils.decimal_feet_to_feet_format, text_kernel, number_kernel, None)
+    
+    @staticmethod
+    def feet_inches_to_decimal_format_series(values):
+        """
+        Vectorized feet_inches_to_decimal_format for a whole column
+        
+        Args:
+            values: Series, ndarray or list of feet-inches or decimal values
+            
+        Returns:
+            pd.Series: two-decimal strings, matching feet_inches_to_decimal_format value for value
+        """
+        def format_number(number):
+            # Under 1000 is already feet, larger values are inches
+            number = pd.Series(number.to_numpy(dtype=float), index=number.index)
+            feet = number.where(~(number >= 1000), number / 12).to_numpy(dtype=float)
+            return pd.Series(_format_unique(feet, '{:.2f}'.format), index=number.index)
+        
+        def number_kernel(numbers):
+            result = format_number(numbers)
+            result[numbers.to_numpy() == 0] = ''
+            return result
+        
+        def text_kernel(strings):
+            text = strings.str.strip()
+            result = pd.Series('', index=strings.index, dtype=object)
+            blank = (text == '').to_numpy(dtype=bool)
+            quoted = (strings.str.contains("'", regex=False) | strings.str.contains('"', regex=False)).to_numpy(dtype=bool)
+            plain = ~blank & ~quoted & strings.str.match(_PATTERNS['plain_number']).to_numpy(dtype=bool)
+            # Other text float() might still accept (exponents, inf, ...) keeps the scalar rules
+            float_like = ~blank & ~quoted & ~plain & strings.str.match(_PATTERNS['float_like']).to_numpy(dtype=bool)
+            parse = ~blank & ~plain & ~float_like
+            if plain.any():
+                result[plain] = format_number(strings[plain].astype(float)).to_numpy(dtype=object)
+            if parse.any():
+                # Heights are parsed; unparseable text is returned as-is
+                decimal = Utils.parse_height_decimal_series(strings[parse])
+                result[parse] = decimal.map('{:.2f}'.format).where(decimal.notna(), strings[parse]).to_numpy(dtype=object)
+            if float_like.any():
+                result[float_like] = strings[float_like].map(Utils.feet_inches_to_decimal_format)
+            return result
+        
+        return _vectorize_height(values, Utils.feet_inches_to_decimal_format, text_kernel, number_kernel, '')
+    
     @staticmethod
     def round_coordinate(coord_value, decimal_places=7):
         """
@@ -383,18 +799,59 @@ class Utils:
             
             # Remove 'Guyed' and 'Unguyed' words (case-insensitive)
             # Handle both cases: with spaces (Guyed Tangent) and without spaces (GuyedTangent)
-            structure_type_str = re.sub(r'\bGuyed\b\s*', '', structure_type_str, flags=re.IGNORECASE)
-            structure_type_str = re.sub(r'\bUnguyed\b\s*', '', structure_type_str, flags=re.IGNORECASE)
+            structure_type_str = _PATTERNS['structure_guyed'].sub('', structure_type_str)
+            structure_type_str = _PATTERNS['structure_unguyed'].sub('', structure_type_str)
             
             # Also handle cases where they're concatenated without word boundaries
-            structure_type_str = re.sub(r'^Guyed(?=[A-Z])', '', structure_type_str, flags=re.IGNORECASE)
-            structure_type_str = re.sub(r'^Unguyed(?=[A-Z])', '', structure_type_str, flags=re.IGNORECASE)
+            structure_type_str = _PATTERNS['structure_guyed_prefix'].sub('', structure_type_str)
+            structure_type_str = _PATTERNS['structure_unguyed_prefix'].sub('', structure_type_str)
             
             # Clean up extra whitespace that might result from word removal
-            structure_type_str = re.sub(r'\s+', ' ', structure_type_str).strip()
+            structure_type_str = _PATTERNS['whitespace'].sub(' ', structure_type_str).strip()
             
             return structure_type_str
             
         except (ValueError, TypeError) as e:
             logging.debug(f"Could not clean structure type value: {structure_type_value} - {e}")
-            return str(structure_type_value) if structure_type_value is not None else ''
\ No newline at end of file
+            return str(structure_type_value) if structure_type_value is not None else ''
+    
+    @staticmethod
+    def benchmark_parsers(sample_count=100000, ignore_keywords=None):
+        """
+        Time the registry-based parsers against per-call pattern compilation
+        
+        The baseline rebuilds each ignore-keyword pattern for every SCID, the way
+        normalize_scid used to; heights are timed as-is to give a per-call cost.
+        
+        Args:
+            sample_count (int): Number of generated inputs per parser (default: 100000)
+            ignore_keywords (list, optional): Keywords to strip (default: the stock ignore list)
+            
+        Returns:
+            dict: Per-call microseconds for each measured function
+        """
+        ignore_keywords = ignore_keywords or ["PCO", "AT&T", "Foreign Pole", "Unknown", "Xcel"]
+        scids = [f"{i % 400:03d}" if i % 5 else f"{i % 400:03d} PCO" for i in range(sample_count)]
+        heights = [f"{20 + i % 20}'-{i % 12}\"" if i % 2 else f"{20 + i % 20}.{i % 10}" for i in range(sample_count)]
+        
+        def per_call_keyword_strip(value):
+            for keyword in ignore_keywords:
+                pattern = r'\b' + re.escape(keyword.strip()) + r'\b'
+                value = re.compile(pattern, re.IGNORECASE).sub('', value).strip()
+            return value
+        
+        def time_per_call(func, values):
+            start = time.perf_counter()
+            for value in values:
+                func(value)
+            return (time.perf_counter() - start) / len(values) * 1e6
+        
+        results = {
+            'keyword_strip_per_call_compile_us': time_per_call(per_call_keyword_strip, scids),
+            'normalize_scid_us': time_per_call(lambda v: Utils.normalize_scid(v, ignore_keywords), scids),
+            'parse_height_decimal_us': time_per_call(Utils.parse_height_decimal, heights),
+            'parse_height_format_us': time_per_call(Utils.parse_height_format, heights),
+        }
+        logging.info("Parser benchmark (%d inputs): %s" % (
+            sample_count, ", ".join(f"{name} {value:.2f}" for name, value in results.items())))
+        return results
@@ -0,0 +1,109 @@
+import logging
+import threading
+from collections import deque
+from tkinter import END
+
+
+class GuiLogHandler(logging.Handler):
+    """
+    Logging handler that shows records in a Tk Text widget without touching it from other threads
+
+    emit() only formats the record and appends it to a bounded queue, so worker threads never
+    wait on Tk. The Tk main loop drains the queue on a timer (start()) and inserts each batch
+    with a single insert and a single scroll. The widget keeps at most max_lines lines of
+    scrollback; older lines are trimmed from the top. When the producers outrun the timer the
+    oldest queued lines are dropped and a notice with the count is shown in their place.
+    """
+
+    def __init__(self, text_widget, interval_ms=100, max_lines=5000, max_pending=10000):
+        super().__init__()
+        self.text_widget = text_widget
+        self.interval_ms = interval_ms
+        self.max_lines = max_lines
+        self.max_pending = max_pending
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._after_id = None
+
+        # Counters since the handler was created (dropped: never shown, trimmed: scrolled out of the widget)
+        self.dropped_lines = 0
+        self.trimmed_lines = 0
+        self._dropped_since_flush = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._pending_lock:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped_lines += 1
+                self._dropped_since_flush += 1
+            self._pending.append(msg)
+
+    def _take_pending(self):
+        """Swap out the queued lines and the number dropped since the last flush"""
+        with self._pending_lock:
+            lines = self._pending
+            self._pending = deque()
+            dropped = self._dropped_since_flush
+            self._dropped_since_flush = 0
+        return lines, dropped
+
+    def start(self):
+        """Start draining the queue from the Tk main loop (call from the main thread)"""
+        if self._after_id is None:
+            self._after_id = self.text_widget.after(self.interval_ms, self._poll)
+
+    def stop(self):
+        """Stop the timer and show whatever is still queued"""
+        if self._after_id is not None:
+            try:
+                self.text_widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self.flush_to_widget()
+
+    def _poll(self):
+        self._after_id = None
+        self.flush_to_widget()
+        try:
+            self._after_id = self.text_widget.after(self.interval_ms, self._poll)
+        except Exception:
+            # Widget destroyed - nothing left to show the log in
+            pass
+
+    def flush_to_widget(self):
+        """Insert all queued lines into the widget (main thread only)"""
+        lines, dropped = self._take_pending()
+        if not lines and not dropped:
+            return
+
+        # Lines that would be trimmed straight away are never inserted (the drop notice keeps its line)
+        limit = max(1, self.max_lines - (1 if dropped else 0))
+        if len(lines) > limit:
+            skipped = len(lines) - limit
+            for _ in range(skipped):
+                lines.popleft()
+            self.trimmed_lines += skipped
+        if dropped:
+            lines.appendleft(f"... {dropped} log line(s) dropped - logging faster than the window can show ...")
+
+        try:
+            widget = self.text_widget
+            # Only follow the end of the log if the user has not scrolled up to read something
+            at_end = widget.yview()[1] >= 0.999
+            widget.insert(END, "\n".join(lines) + "\n")
+
+            line_count = int(widget.index("end-1c").split(".")[0]) - 1
+            excess = line_count - self.max_lines
+            if excess > 0:
+                widget.delete("1.0", f"{excess + 1}.0")
+                self.trimmed_lines += excess
+            if at_end:
+                widget.see(END)
+        except Exception:
+            pass
@@ -11,15 +11,12 @@ from pathlib import Path
 from tkinter import *
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
-import pandas as pd
 
-# Add missing imports
+# Only light modules here: pandas, openpyxl, the PDF libraries and the processing pipeline are
+# imported in the background once the window is up (see start_background_imports)
 from core.config_manager import ConfigManager
-from core.utils import Utils
-from core.attachment_data_reader import AttachmentDataReader
-from core.pole_data_processor import PoleDataProcessor
-from core.pdf_report_reader import PDFReportReader
-from core.alden_qc_reader import AldenQCReader
+from core.startup import ModulePrewarmer, get_base_directory
+from gui.log_handler import GuiLogHandler
 
 
 class PoleMapperApp:
@@ -40,7 +37,7 @@ class PoleMapperApp:
             self._temp_extract_dirs = []
             
             # Initialize managers and paths
-            self.base_dir = Utils.get_base_directory()
+            self.base_dir = get_base_directory()
             self.config_manager = ConfigManager(self.base_dir)
             
             # Store recent-paths file in the same directory as main.py / executable
@@ -55,6 +52,7 @@ class PoleMapperApp:
             self.processing_thread = None
             self.stop_processing = False
             self.process_button = None
+            self.prewarmer = None
             
             # Create GUI
             self.create_widgets()
@@ -1043,234 +1041,60 @@ TIPS:
     def _process_files_worker(self, progress_callback, input_file, attachment_file, output_file):
         """Process files in a background thread."""
         try:
-            import pandas as pd
-            
-            # Check for stop request before starting
-            if not progress_callback(0, "Starting processing..."):
-                logging.info("Processing stopped by user request")
-                self.root.after(0, self.reset_process_button)
-                return
-
             # Update config from UI
             self.update_config_from_ui()
 
-            # Read main input file if provided
-            nodes_df = None
-            connections_df = None
-            sections_df = None
-            
-            if input_file:
-                if not progress_callback(10, "Reading main input file..."):
-                    logging.info("Processing stopped by user request")
-                    self.root.after(0, self.reset_process_button)
-                    return
-                nodes_df = pd.read_excel(input_file, sheet_name='nodes', dtype=str).fillna("")
-                connections_df = pd.read_excel(input_file, sheet_name='connections', dtype=str).fillna("")
-                sections_df = pd.read_excel(input_file, sheet_name='sections', dtype=str).fillna("")
-                logging.info(f"Loaded {len(nodes_df)} nodes, {len(connections_df)} connections")
-            else:
-                nodes_df = pd.DataFrame()
-                connections_df = pd.DataFrame()
-                sections_df = pd.DataFrame()
-
-            if not progress_callback(15, "Extracting valid SCIDs..."):
-                logging.info("Processing stopped by user request")
-                self.root.after(0, self.reset_process_button)
-                return
-            
-            # Extract valid SCIDs from nodes data if available
-            valid_scids = []
-            if not nodes_df.empty and 'scid' in nodes_df.columns:
-                from core.utils import Utils
-                nodes_df_copy = nodes_df.copy()
-                ignore_keywords = self.config.get("ignore_scid_keywords", [])
-                nodes_df_copy['scid'] = nodes_df_copy['scid'].apply(lambda x: Utils.normalize_scid(x, ignore_keywords))
-                valid_nodes = Utils.filter_valid_nodes(nodes_df_copy)
-                valid_scids = valid_nodes['scid'].tolist()
-                logging.info(f"Found {len(valid_scids)} valid SCIDs")
-            else:
-                valid_scids = []
-
-            # Read attachment data if provided
-            attachment_reader = None
-            if attachment_file:
-                if not progress_callback(25, "Reading attachment data..."):
-                    logging.info("Stopped by user")
-                    self.root.after(0, self.reset_process_button)
-                    return
-                attachment_reader = AttachmentDataReader(attachment_file, config=self.config, valid_scids=valid_scids)
-
-            # QC reader disabled
-            qc_reader = None
-
-            # Initialize Alden QC reader if file is provided
-            alden_qc_reader = None
-            alden_qc_file_path = self.alden_qc_var.get() if hasattr(self, 'alden_qc_var') else ""
-            if alden_qc_file_path:
-                try:
-                    alden_qc_reader = AldenQCReader(alden_qc_file_path)
-                    if alden_qc_reader.is_active():
-                        logging.info(f"Loaded Alden QC with {len(alden_qc_reader.get_all_poles())} poles")
-                except Exception as e:
-                    logging.error(f"Error loading Alden QC: {e}")
-                    alden_qc_reader = None
-
-            if not progress_callback(30, "Initializing data processor..."):
-                logging.info("Processing stopped by user request")
-                self.root.after(0, self.reset_process_button)
-                return
-
-            # Initialize PDF reader with folder paths from UI
-            pdf_reader = None
-            existing_reports_folder = self.existing_reports_var.get() if hasattr(self, 'existing_reports_var') else ""
-            proposed_reports_folder = self.proposed_reports_var.get() if hasattr(self, 'proposed_reports_var') else ""
-            
-            # Normalize paths for Windows compatibility
-            if existing_reports_folder:
-                existing_reports_folder = str(Path(existing_reports_folder).resolve())
-            if proposed_reports_folder:
-                proposed_reports_folder = str(Path(proposed_reports_folder).resolve())
-            
-            if existing_reports_folder or proposed_reports_folder:
-                try:
-                    ignore_keywords = self.config.get("ignore_scid_keywords", [])
-                    pdf_reader = PDFReportReader(existing_reports_folder, proposed_reports_folder, ignore_keywords)
-                    logging.info("PDF reader initialized")
-                except Exception as e:
-                    logging.error(f"Error initializing PDF reader: {e}")
-                    pdf_reader = None
-            
-            processor = PoleDataProcessor(
-                config=self.config,
-                mapping_data=self.mapping_data,
-                attachment_reader=attachment_reader,
-                qc_reader=qc_reader,
-                pdf_reader=pdf_reader,
-                alden_qc_reader=alden_qc_reader
+            if self.prewarmer and not self.prewarmer.ready.is_set():
+                progress_callback(0, "Loading processing modules...")
+            from core.job_runner import ProcessingJob, run_job
+
+            job = ProcessingJob(
+                output_file=output_file,
+                input_file=input_file,
+                attachment_file=attachment_file,
+                existing_reports_folder=self.existing_reports_var.get() if hasattr(self, 'existing_reports_var') else "",
+                proposed_reports_folder=self.proposed_reports_var.get() if hasattr(self, 'proposed_reports_var') else "",
+                alden_qc_file=self.alden_qc_var.get() if hasattr(self, 'alden_qc_var') else ""
             )
+            result = run_job(job, self.config, self.mapping_data, progress_callback=progress_callback)
 
-            # Read template SCIDs to filter processing
-            if not progress_callback(35, "Reading template connections..."):
-                logging.info("Processing stopped by user request")
-                self.root.after(0, self.reset_process_button)
-                return
-            
-            template_scids = processor.read_template_scids(output_file)
-            if template_scids:
-                logging.info(f"Processing {len(template_scids)} template connections")
-
-            # Process data
-            if not progress_callback(40, "Processing pole data..."):
-                logging.info("Processing stopped by user request")
-                self.root.after(0, self.reset_process_button)
-                return
-            result_data = processor.process_data(
-                nodes_df=nodes_df,
-                connections_df=connections_df,
-                sections_df=sections_df,
-                progress_callback=progress_callback,
-                manual_routes=None,
-                clear_existing_routes=False
-            )
-
-            # Extract job name from nodes_df if available
-            progress_callback(85, "Generating output file...")
-            job_name = ""
-            if not nodes_df.empty and "job_name" in nodes_df.columns and not nodes_df["job_name"].empty:
-                job_name = str(nodes_df["job_name"].iloc[0]).strip()
-            if not job_name:
-                job_name = "Output"
-
-            # Generate actual output file by copying template with job name
-            actual_output_file = self.generate_output_file(job_name, output_file)
-            if not actual_output_file:
-                progress_callback(0, "Failed to generate output file!")
-                return
-            
-
-            # Write output to the newly created file
-            progress_callback(90, "Writing output file...")
-            processor.write_output(result_data, str(actual_output_file))
-
-            progress_callback(100, "Processing complete!")
-            logging.info(f"Processing complete. Output written to: {actual_output_file}")
-
-            # Save last paths
-            self.save_last_paths()
+            if result['status'] == 'complete':
+                # Save last paths
+                self.save_last_paths()
 
-            # Open output file if requested
-            if self.open_output_var.get():
-                self.root.after(1000, lambda: self.open_output_file(str(actual_output_file)))
-
-            logging.info(f"✓ Processed {len(result_data)} poles → {actual_output_file.name}")
-            
-            # Reset button on completion
-            self.root.after(0, self.reset_process_button)
+                # Open output file if requested
+                if self.open_output_var.get():
+                    actual_output_file = str(result['output_file'])
+                    self.root.after(1000, lambda: self.open_output_file(actual_output_file))
 
         except Exception as e:
             logging.error(f"Error during processing: {e}", exc_info=True)
             progress_callback(0, "Processing failed!")
-            # Reset button on error
+        finally:
+            # Reset button on completion, stop or error
             self.root.after(0, self.reset_process_button)
 
     def generate_output_file(self, job_name, output_template):
         """Generate actual output file by copying the template using job_name."""
-        import shutil
-        from pathlib import Path
-        import time
-        
-        template_path = Path(output_template)
-        if not template_path.exists():
-            logging.error(f"Output template file not found: {output_template}")
-            return None
-        
-        # Create output directory in the same location as the template
-        output_dir = template_path.parent / "output"
-        output_dir.mkdir(exist_ok=True)
-        
-        # Always use .xlsx format for output files
-        base_filename = f"{job_name} Spread Sheet.xlsx"
-        
-        # Try to find an available filename in the output directory
-        counter = 0
-        actual_output_file = output_dir / base_filename
-        
-        while actual_output_file.exists():
-            counter += 1
-            if counter == 1:
-                # First attempt: try with timestamp
-                timestamp = time.strftime("%Y%m%d_%H%M%S")
-                actual_output_file = output_dir / f"{job_name} Spread Sheet_{timestamp}.xlsx"
-            else:
-                # Subsequent attempts: try with counter
-                actual_output_file = output_dir / f"{job_name} Spread Sheet_{counter}.xlsx"
-            
-            # Prevent infinite loop
-            if counter > 100:
-                logging.error(f"Could not find available filename after 100 attempts")
-                return None
-        
+        from core.job_runner import generate_output_file
+        return generate_output_file(job_name, output_template)
+
+    def start_background_imports(self, report=None):
+        """
+        Import the processing modules on a background thread once the window is shown
+
+        Args:
+            report: Optional StartupReport that receives the import timings; it is also written to
+                    startup_report.json when processing_options.startup_report is enabled
+        """
         try:
-            shutil.copy(template_path, actual_output_file)
-            return actual_output_file
-        except PermissionError as e:
-            # File is likely open in Excel or another application
-            logging.warning(f"Permission denied - file may be open in another application: {actual_output_file}")
-            
-            # Try with a unique timestamp
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            unique_filename = f"{job_name} Spread Sheet_{timestamp}.xlsx"
-            actual_output_file = output_dir / unique_filename
-            
-            try:
-                shutil.copy(template_path, actual_output_file)
-                return actual_output_file
-            except Exception as e2:
-                logging.error(f"Failed to copy template even with unique filename: {e2}")
-                return None
+            report_file = None
+            if report is not None and self.config.get("processing_options", {}).get("startup_report", False):
+                report_file = self.base_dir / "startup_report.json"
+            self.prewarmer = ModulePrewarmer(report=report, report_file=report_file)
+            self.prewarmer.start()
         except Exception as e:
-            logging.error(f"Error copying template file: {e}")
-            return None
+            logging.warning(f"Could not start background imports: {e}")
 
     def open_output_file(self, filepath):
         """Open the output file"""
@@ -1286,20 +1110,7 @@ TIPS:
 
     def setup_logging(self):
         """Setup logging to display in GUI"""
-        class GuiLogHandler(logging.Handler):
-            def __init__(self, text_widget):
-                super().__init__()
-                self.text_widget = text_widget
-            
-            def emit(self, record):
-                try:
-                    msg = self.format(record)
-                    self.text_widget.insert(END, msg + '\n')
-                    self.text_widget.see(END)
-                except Exception:
-                    pass
-        
-        # Create handler
+        # Create handler; records are queued and the Tk loop shows them in batches
         if hasattr(self, 'log_text'):
             gui_handler = GuiLogHandler(self.log_text)
             gui_handler.setLevel(logging.INFO)
@@ -1308,6 +1119,16 @@ TIPS:
             
             # Add to root logger
             logging.getLogger().addHandler(gui_handler)
+            gui_handler.start()
+            self.gui_log_handler = gui_handler
+
+    def _remove_gui_log_handler(self):
+        """Detach the GUI log handler before the log widget is destroyed"""
+        handler = getattr(self, 'gui_log_handler', None)
+        if handler:
+            logging.getLogger().removeHandler(handler)
+            handler.stop()
+            self.gui_log_handler = None
 
     def auto_save_config(self):
         """Automatically save configuration with debouncing"""
@@ -1443,6 +1264,7 @@ TIPS:
                     logging.debug(f"Failed to remove temp directory {temp_dir}: {cleanup_error}")
             
             logging.info("Application closing")
+            self._remove_gui_log_handler()
             self.root.destroy()
         except Exception as e:
             logging.error(f"Error during application close: {e}")
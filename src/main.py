@@ -2,6 +2,11 @@ import sys
 import logging
 from tkinter import Tk
 
+from core.startup import StartupReport
+
+# Started before anything else is imported, so the report covers the whole GUI import
+startup_report = StartupReport()
+
 def handle_exception(exc_type, exc_value, exc_traceback):
     """Handle exceptions globally for both sys and tkinter"""
     if issubclass(exc_type, KeyboardInterrupt):
@@ -39,6 +44,11 @@ def main():
         app = PoleMapperApp(root)
         root.update_idletasks()  # Force Tkinter to process all pending events, including StringVar initialization
         root.deiconify()  # Show the window
+        root.update()  # Paint it before anything heavy is imported
+
+        # Report what was needed to get here, then load the processing modules while the user picks files
+        startup_report.mark_first_paint()
+        app.start_background_imports(startup_report)
         root.mainloop()
             
     except Exception as e: